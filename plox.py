@@ -1,33 +1,85 @@
 #!/usr/bin/env python3
 
 # Python Imports
+import mmap
 import sys
+import tracemalloc
 
 # Project Imports
 from src.ast.printer import AstPrinter
+from src.interpreter.closure import ClosureInterpreter
 from src.interpreter.interpreter import Interpreter
+from src.interpreter.stack import StackInterpreter
+from src.optimizer.dead_code import DeadCodeEliminator
+from src.optimizer.folder import ConstantFolder
 from src.parser.parser import Parser
 from src.parser.resolver import Resolver
+from src.scanner.regex_scanner import RegexScanner
 from src.scanner.scanner import Scanner
+from src.transpiler.backend import PythonBackend
 from src.util.errors import ErrType, LoxError
 from src.util.mode import RunMode
+from src.vm.vm import VM
+
+
+ENGINES = {
+    "tree": Interpreter,
+    "stack": StackInterpreter,
+    "closure": ClosureInterpreter,
+    "vm": VM,
+    "python": PythonBackend,
+}
+
+SCANNERS = {
+    "char": Scanner,
+    "regex": RegexScanner,
+}
+
+# How much of a mapped file is checked at a time, in bytes.
+CHUNK = 1 << 20
+
+
+def is_plain(source):
+    # Whether a file can be scanned as it is on disk: ASCII only, without
+    # the carriage returns that reading it as text would translate.
+    if source.find(b"\r") != -1:
+        return False
+
+    return all(
+        source[start : start + CHUNK].isascii()
+        for start in range(0, len(source), CHUNK)
+    )
 
 
 class Lox:
-    def __init__(self, file_name="STDIN"):
+    def __init__(self, file_name="STDIN", engine="tree"):
         self.fn = file_name
+        self.scanner = Scanner
         self.debug = False
+        self.optimizer_stats = False
+        self.memo_stats = False
+        self.memory_stats = False
+        self.stream = False
         self.err_manager = LoxError()
         self.mode = RunMode.FILE
-        self.interpreter = Interpreter(self.err_manager, self.mode)
+        self.interpreter = ENGINES[engine](self.err_manager, self.mode)
 
     def run_file(self, file_path):
         try:
-            with open(file_path, "rt") as f:
-                source = f.read()
+            with open(file_path, "rb") as f:
+                source = self.map_source(f)
+
+            if self.memory_stats:
+                tracemalloc.start()
 
             self.run(source)
 
+            if self.memo_stats:
+                self.report_memos()
+
+            if self.memory_stats:
+                self.report_memory()
+
             if self.err_manager.had_error:
                 sys.exit(65)
             if self.err_manager.had_runtime_error:
@@ -37,6 +89,50 @@ class Lox:
             print(e)
             self.err_manager.error(ErrType.IO_ERROR, f" {e}"[10:])
 
+    def map_source(self, f):
+        # Maps the file into memory rather than reading it in. A scanner
+        # that takes bytes scans the mapping itself, as long as the file is
+        # plain ASCII with '\n' line endings, so that byte and character
+        # offsets agree and nothing needs translating. Otherwise it is
+        # decoded straight from the mapping, with newlines translated as
+        # reading the file as text would.
+        if f.seek(0, 2) == 0:
+            return ""
+
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.scanner.scans_bytes and is_plain(source):
+            return source
+
+        with source:
+            text = str(source, "utf-8")
+
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def report_memos(self):
+        for declaration, memo in self.interpreter.memos.items():
+            print(
+                f"memo '{declaration.name.lexeme}': {memo.hits} hits, " + \
+                f"{memo.misses} misses, {memo.evictions} evictions.",
+                file=sys.stderr
+            )
+
+    def report_memory(self):
+        # Tracing slows the run down and its own bookkeeping adds to the
+        # RSS, so compare runs that both have it on.
+        import resource
+
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # ru_maxrss is in KiB on Linux.
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        print(
+            f"Memory: {peak} bytes peak allocated, {rss} KiB peak RSS.",
+            file=sys.stderr
+        )
+
     def repl(self):
         if self.debug:
             print("plox REPL Version 0.0.1 [DEBUG MODE]")
@@ -56,6 +152,7 @@ class Lox:
                 self.run(line)
 
                 self.err_manager.had_error = False
+                self.err_manager.had_scan_error = False
                 self.err_manager.had_runtime_error = False
 
         except EOFError:
@@ -67,8 +164,12 @@ class Lox:
             sys.exit(0)
 
     def run(self, source):
+        if self.stream and not self.debug:
+            self.run_streaming(source)
+            return
+
         # Lexer
-        scanner = Scanner(source, self.err_manager)
+        scanner = self.scanner(source, self.err_manager)
         tokens = scanner.scan_tokens()
 
         if self.err_manager.had_error:
@@ -98,15 +199,87 @@ class Lox:
             if self.err_manager.had_error:
                 return
 
+            # Optimizer
+            folder = ConstantFolder()
+            folder.fold_stmts(statements)
+
+            eliminator = DeadCodeEliminator(self.interpreter)
+            statements = eliminator.eliminate_stmts(statements)
+
+            if self.optimizer_stats:
+                print(
+                    f"Optimizer: folded {folder.folded} expressions, " + \
+                    f"removed {eliminator.removed} dead nodes.",
+                    file=sys.stderr
+                )
+
             self.interpreter.mode = self.mode
             self.interpreter.interpret(statements)
 
+    def run_streaming(self, source):
+        # Scans, parses, resolves, optimizes and runs one top-level
+        # declaration at a time, so output starts as soon as the first one
+        # is done and each is dropped once it has run. Once there has been
+        # an error nothing more runs, but the rest is still checked so that
+        # the errors after it are reported too. A syntax error may leave
+        # the tree broken, so after one the rest is only parsed, and after
+        # a scan error, as when running in batch, only scanned.
+        scanner = self.scanner(source, self.err_manager)
+        parser = Parser(scanner.stream_tokens(), self.err_manager)
+        resolver = Resolver(self.interpreter, self.err_manager)
+        resolver.streaming = True
+        folder = ConstantFolder()
+        eliminator = DeadCodeEliminator(self.interpreter)
+
+        self.interpreter.mode = self.mode
+
+        for statement in parser.declarations():
+            if self.err_manager.had_scan_error:
+                scanner.scan_rest()
+                break
+
+            if parser.had_error:
+                continue
+
+            resolver.resolve_stmts([statement])
+
+            if self.err_manager.had_error:
+                continue
+
+            folder.fold_stmt(statement)
+            statements = eliminator.eliminate_stmts([statement])
+
+            self.interpreter.interpret(statements)
+
+            for statement in statements:
+                self.interpreter.release(statement)
+
+            if self.err_manager.had_runtime_error:
+                return
+
+        if self.optimizer_stats:
+            print(
+                f"Optimizer: folded {folder.folded} expressions, " + \
+                f"removed {eliminator.removed} dead nodes.",
+                file=sys.stderr
+            )
+
 
 if __name__ == "__main__":
-    from argparse import ArgumentParser
+    from argparse import ArgumentParser, ArgumentTypeError
+
+    def positive_int(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise ArgumentTypeError(f"invalid int value: '{text}'")
+
+        if value < 1:
+            raise ArgumentTypeError(f"must be a positive integer, got {value}")
+
+        return value
 
     parser = ArgumentParser(prog="plox.py")
-    lox = Lox()
 
     parser.add_argument(
         "script",
@@ -121,8 +294,108 @@ if __name__ == "__main__":
         help="Run in Debug Mode. Spits out results of " + \
              "lexer and parser, suppressing interpretation."
     )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        choices=ENGINES.keys(),
+        default="tree",
+        help="Execution engine. 'tree' walks the AST, 'stack' walks " + \
+             "it keeping Lox calls off the Python stack, 'closure' " + \
+             "compiles it into nested Python closures first, 'vm' " + \
+             "compiles it to bytecode for a stack-based VM, 'python' " + \
+             "transpiles it to Python source and runs that."
+    )
+    parser.add_argument(
+        "--scanner",
+        choices=SCANNERS.keys(),
+        default="char",
+        help="Scanner backend. 'char' scans a character at a time, " + \
+             "'regex' matches one token at a time against a single " + \
+             "compiled pattern. Both produce the same tokens."
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Scan, parse, resolve and run the script one top-level " + \
+             "declaration at a time rather than each stage in turn " + \
+             "over the whole of it."
+    )
+    parser.add_argument(
+        "--disassemble",
+        action="store_true",
+        help="With '--engine=vm', print the compiled bytecode " + \
+             "before running it."
+    )
+
+    parser.add_argument(
+        "--max-depth",
+        type=positive_int,
+        default=None,
+        help="With '--engine=stack', the deepest Lox call nesting " + \
+             "allowed before reporting a stack overflow."
+    )
+
+    parser.add_argument(
+        "--dump-python",
+        action="store_true",
+        help="With '--engine=python', print the generated Python " + \
+             "source before running it."
+    )
+
+    parser.add_argument(
+        "--memoize",
+        action="store_true",
+        help="With '--engine=tree' or '--engine=stack', memoize every " + \
+             "function found to be pure, as if passed to memo()."
+    )
+
+    parser.add_argument(
+        "--memo-stats",
+        action="store_true",
+        help="With '--engine=tree' or '--engine=stack', report the " + \
+             "hits, misses and evictions of every memoized function."
+    )
+
+    parser.add_argument(
+        "--optimizer-stats",
+        action="store_true",
+        help="Report how many expressions the optimizer folded and " + \
+             "how many dead nodes it removed."
+    )
+
+    parser.add_argument(
+        "--memory-stats",
+        action="store_true",
+        help="Trace allocations while running the script and report " + \
+             "the peak allocated memory and the peak RSS."
+    )
 
     args = parser.parse_args()
+    lox = Lox(engine=args.engine)
+
+    lox.scanner = SCANNERS[args.scanner]
+    lox.stream = args.stream
+
+    if args.disassemble and args.engine == "vm":
+        lox.interpreter.disassemble = True
+
+    if args.dump_python and args.engine == "python":
+        lox.interpreter.dump = True
+
+    if args.max_depth is not None and args.engine == "stack":
+        lox.interpreter.max_depth = args.max_depth
+
+    if args.memoize and args.engine in ("tree", "stack"):
+        lox.interpreter.memoize = True
+
+    if args.memo_stats and args.engine in ("tree", "stack"):
+        lox.memo_stats = True
+
+    if args.optimizer_stats:
+        lox.optimizer_stats = True
+
+    if args.memory_stats:
+        lox.memory_stats = True
 
     if args.debug:
         lox.debug = True
@@ -1,101 +1,136 @@
-# Python Imports
-from abc import ABC, abstractmethod
-
 # Project Imports
 from src.scanner.token import Token
 
 
-class Expr(ABC):
-    @abstractmethod
-    def accept(self, visitor):
-        ...
-
-
-class ExprVisitor(ABC):
-    @abstractmethod
-    def visit_assign_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_binary_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_call_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_conditional_expr(self, expr: Expr) -> object | None:
-        ...
+# Kind Tags
+#
+# Every node class has an integer 'kind', and EXPR_VISITS names the
+# visit method for each kind in the same order. A visitor builds a table
+# of its own methods once with expr_dispatch() and then visits a node
+# with table[node.kind](node).
+ASSIGN = 0
+BINARY = 1
+CALL = 2
+CONDITIONAL = 3
+GET = 4
+GROUPING = 5
+LITERAL = 6
+LOGICAL = 7
+SELF = 8
+SET = 9
+SUPER = 10
+UNARY = 11
+VARIABLE = 12
+
+EXPR_VISITS = [
+    "visit_assign_expr",
+    "visit_binary_expr",
+    "visit_call_expr",
+    "visit_conditional_expr",
+    "visit_get_expr",
+    "visit_grouping_expr",
+    "visit_literal_expr",
+    "visit_logical_expr",
+    "visit_self_expr",
+    "visit_set_expr",
+    "visit_super_expr",
+    "visit_unary_expr",
+    "visit_variable_expr",
+]
+
+# Every ExprVisitor has to cover the first EXPR_NODES kinds,
+# the node classes defined in this file.
+EXPR_NODES = len(EXPR_VISITS)
+
+
+def add_expr_kind(visit):
+    # Gives a node class defined elsewhere a kind of its own. Visitors
+    # that have no such method get None in its place.
+    EXPR_VISITS.append(visit)
+    return len(EXPR_VISITS) - 1
+
+
+def expr_dispatch(visitor):
+    return [getattr(visitor, visit, None) for visit in EXPR_VISITS]
+
+
+class Expr:
+    # Nodes keep their fields in __slots__ rather than a __dict__, which
+    # makes every node smaller and its fields faster to get at. The
+    # base has to declare them too, even if empty, or every node would
+    # get a __dict__ anyway.
+    __slots__ = ()
+    kind = None
 
-    @abstractmethod
-    def visit_get_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_grouping_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_literal_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_logical_expr(self, expr: Expr) -> object | None:
-        ...
-
-    @abstractmethod
-    def visit_self_expr(self, expr: Expr) -> object | None:
-        ...
+    def accept(self, visitor):
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_set_expr(self, expr: Expr) -> object | None:
-        ...
 
-    @abstractmethod
-    def visit_super_expr(self, expr: Expr) -> object | None:
-        ...
+class ExprVisitor:
+    # A visitor class must have a visit method for every node class,
+    # its own or inherited. That is checked as soon as it is defined.
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    @abstractmethod
-    def visit_unary_expr(self, expr: Expr) -> object | None:
-        ...
+        missing = [
+            visit for visit in EXPR_VISITS[:EXPR_NODES]
+            if not callable(getattr(cls, visit, None))
+        ]
 
-    @abstractmethod
-    def visit_variable_expr(self, expr: Expr) -> object | None:
-        ...
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} is missing {', '.join(missing)}."
+            )
 
 
 class Assign(Expr):
+    __slots__ = ("name", "operator", "value", "global_slot")
+    kind = ASSIGN
+
     def __init__(self, name: Token, operator: Token, value: Expr):
         self.name = name
         self.operator = operator
         self.value = value
+        self.global_slot = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_assign_expr(self)
 
 
 class Binary(Expr):
+    __slots__ = ("left", "operator", "right", "hits", "guard", "op")
+    kind = BINARY
+
     def __init__(self, left: Expr, operator: Token, right: Expr):
         self.left = left
         self.operator = operator
         self.right = right
+        self.hits = 0
+        self.guard = None
+        self.op = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_binary_expr(self)
 
 
 class Call(Expr):
+    __slots__ = ("callee", "paren", "arguments", "cache")
+    kind = CALL
+
     def __init__(self, callee: Expr, paren: Token, arguments: list[Expr]):
         self.callee = callee
         self.paren = paren
         self.arguments = arguments
+        self.cache = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_call_expr(self)
 
 
 class Conditional(Expr):
+    __slots__ = ("condition", "then_branch", "else_branch")
+    kind = CONDITIONAL
+
     def __init__(self, condition: Expr, then_branch: Expr, else_branch: Expr):
         self.condition = condition
         self.then_branch = then_branch
@@ -106,15 +141,22 @@ class Conditional(Expr):
 
 
 class Get(Expr):
+    __slots__ = ("obj", "name", "cache")
+    kind = GET
+
     def __init__(self, obj: Expr, name: Token):
         self.obj = obj
         self.name = name
+        self.cache = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_get_expr(self)
 
 
 class Grouping(Expr):
+    __slots__ = ("expression",)
+    kind = GROUPING
+
     def __init__(self, expression: Expr):
         self.expression = expression
 
@@ -123,14 +165,21 @@ class Grouping(Expr):
 
 
 class Literal(Expr):
-    def __init__(self, value: object):
+    __slots__ = ("value", "token")
+    kind = LITERAL
+
+    def __init__(self, value: object, token: Token):
         self.value = value
+        self.token = token
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_literal_expr(self)
 
 
 class Logical(Expr):
+    __slots__ = ("left", "operator", "right")
+    kind = LOGICAL
+
     def __init__(self, left: Expr, operator: Token, right: Token):
         self.left = left
         self.operator = operator
@@ -141,6 +190,9 @@ class Logical(Expr):
 
 
 class Self(Expr):
+    __slots__ = ("keyword",)
+    kind = SELF
+
     def __init__(self, keyword: Token):
         self.keyword = keyword
 
@@ -149,36 +201,54 @@ class Self(Expr):
 
 
 class Set(Expr):
+    __slots__ = ("obj", "name", "value", "cache")
+    kind = SET
+
     def __init__(self, obj: Expr, name: Token, value: Expr):
         self.obj = obj
         self.name = name
         self.value = value
+        self.cache = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_set_expr(self)
 
 
 class Super(Expr):
+    __slots__ = ("keyword", "method", "cache")
+    kind = SUPER
+
     def __init__(self, keyword: Token, method: Token):
         self.keyword = keyword
         self.method = method
+        self.cache = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_super_expr(self)
 
 
 class Unary(Expr):
+    __slots__ = ("operator", "right", "hits", "guard", "op")
+    kind = UNARY
+
     def __init__(self, operator: Token, right: Expr):
         self.operator = operator
         self.right = right
+        self.hits = 0
+        self.guard = None
+        self.op = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_unary_expr(self)
 
 
 class Variable(Expr):
+    __slots__ = ("name", "global_slot")
+    kind = VARIABLE
+
     def __init__(self, name: Token):
         self.name = name
+        self.global_slot = None
 
     def accept(self, visitor: ExprVisitor):
         return visitor.visit_variable_expr(self)
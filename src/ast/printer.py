@@ -5,6 +5,7 @@ import sys
 from src.ast.expr import (
     Expr,
     ExprVisitor,
+    expr_dispatch,
     Assign,
     Binary,
     Call,
@@ -22,6 +23,7 @@ from src.ast.expr import (
 from src.ast.stmt import (
     Stmt,
     StmtVisitor,
+    stmt_dispatch,
     Block,
     Break,
     Class,
@@ -38,6 +40,16 @@ from src.ast.stmt import (
 )
 
 class AstPrinter(ExprVisitor, StmtVisitor):
+    def __init__(self):
+        self.expr_table = expr_dispatch(self)
+        self.stmt_table = stmt_dispatch(self)
+
+    def build_stmt(self, stmt: Stmt):
+        return self.stmt_table[stmt.kind](stmt)
+
+    def build_expr(self, expr: Expr):
+        return self.expr_table[expr.kind](expr)
+
     def visit_block_stmt(self, stmt: Block):
         return self.build_stmt_tree(stmt)
 
@@ -120,7 +132,7 @@ class AstPrinter(ExprVisitor, StmtVisitor):
         result = "{"
 
         for statement in statements:
-            result += f"\n\t{statement.accept(self)}"
+            result += f"\n\t{self.build_stmt(statement)}"
 
         result += "\n}"
         return result
@@ -140,33 +152,33 @@ class AstPrinter(ExprVisitor, StmtVisitor):
             if stmt.methods:
                 for method in stmt.methods:
                     if isinstance(method, Function):
-                        result += f" {method.accept(self)} "
+                        result += f" {self.build_stmt(method)} "
                     else:
                         result += f" {method.lexeme} "
 
         elif isinstance(stmt, Const):
             result += f" = const define {stmt.name.lexeme}"
-            result += f" {stmt.initializer.accept(self)} "
+            result += f" {self.build_expr(stmt.initializer)} "
 
         elif isinstance(stmt, Echo):
-            result += f" echo {stmt.expression.accept(self)} "
+            result += f" echo {self.build_expr(stmt.expression)} "
 
         elif isinstance(stmt, Expression):
-            result += f" {stmt.expression.accept(self)} "
+            result += f" {self.build_expr(stmt.expression)} "
 
         elif isinstance(stmt, For):
             result += " for"
             if stmt.initializer != None:
-                result += f" : {stmt.initializer.accept(self)} :"
+                result += f" : {self.build_stmt(stmt.initializer)} :"
 
-            result += f" if {stmt.condition.accept(self)} is True :"
+            result += f" if {self.build_expr(stmt.condition)} is True :"
             if stmt.increment != None:
-                result += f" increment {stmt.increment.accept(self)}"
+                result += f" increment {self.build_expr(stmt.increment)}"
 
             if isinstance(stmt.body, Block):
                 result += f" {self.build_block(stmt.body.statements)} "
             else:
-                result += f" {stmt.body.accept(self)} "
+                result += f" {self.build_stmt(stmt.body)} "
 
         elif isinstance(stmt, Function):
             result += f" define function {stmt.name.lexeme} "
@@ -181,26 +193,26 @@ class AstPrinter(ExprVisitor, StmtVisitor):
 
             for statement in stmt.body:
                 print(type(statement))
-                result += f" {statement.accept(self)} "
+                result += f" {self.build_stmt(statement)} "
 
         elif isinstance(stmt, If):
-            result += f" if {stmt.condition.accept(self)} is true,"
+            result += f" if {self.build_expr(stmt.condition)} is true,"
 
             if stmt.else_branch != None:
-                result += f" then {stmt.then_branch.accept(self)}"
-                result += f" else {stmt.else_branch.accept(self)} "
+                result += f" then {self.build_stmt(stmt.then_branch)}"
+                result += f" else {self.build_stmt(stmt.else_branch)} "
             else:
-                result += f" then {stmt.then_branch.accept(self)} "
+                result += f" then {self.build_stmt(stmt.then_branch)} "
 
         elif isinstance(stmt, Return):
-            result += f" return {stmt.value.accept(self)} "
+            result += f" return {self.build_expr(stmt.value)} "
 
         elif isinstance(stmt, Var):
             if stmt.initializer == None:
                 result += f" var declare {stmt.name.lexeme} "
             else:
                 result += f" = {stmt.keyword.lexeme} define ({stmt.name.lexeme})"
-                result += f" {stmt.initializer.accept(self)} "
+                result += f" {self.build_expr(stmt.initializer)} "
 
         elif isinstance(stmt, While):
             result += " do "
@@ -208,7 +220,7 @@ class AstPrinter(ExprVisitor, StmtVisitor):
             if isinstance(stmt.body, Block):
                 result += self.build_block(stmt.body.statements)
 
-            result += f" while {stmt.condition.accept(self)} is true "
+            result += f" while {self.build_expr(stmt.condition)} is true "
 
         result += "]"
         return result
@@ -218,12 +230,12 @@ class AstPrinter(ExprVisitor, StmtVisitor):
 
         if isinstance(expr, Assign):
             result += f" {expr.operator.lexeme}"
-            result += f" var {expr.name.lexeme} {expr.value.accept(self)} "
+            result += f" var {expr.name.lexeme} {self.build_expr(expr.value)} "
 
         elif isinstance(expr, Binary):
             result += f" {expr.operator.lexeme}"
-            result += f" {expr.left.accept(self)}"
-            result += f" {expr.right.accept(self)} "
+            result += f" {self.build_expr(expr.left)}"
+            result += f" {self.build_expr(expr.right)} "
 
         elif isinstance(expr, Call):
             result += f" call {expr.callee.name.lexeme}"
@@ -233,9 +245,9 @@ class AstPrinter(ExprVisitor, StmtVisitor):
 
                 for arg in expr.arguments:
                     if arg == expr.arguments[len(expr.arguments) - 1]:
-                        result += f" {arg.accept(self)} "
+                        result += f" {self.build_expr(arg)} "
                     else:
-                        result += f" {arg.accept(self)},"
+                        result += f" {self.build_expr(arg)},"
 
                 result += ") "
             else:
@@ -243,15 +255,15 @@ class AstPrinter(ExprVisitor, StmtVisitor):
 
 
         elif isinstance(expr, Conditional):
-            result += f" {expr.condition.accept(self)}"
-            result += f" ? {expr.then_branch.accept(self)}"
-            result += f" : {expr.else_branch.accept(self)} "
+            result += f" {self.build_expr(expr.condition)}"
+            result += f" ? {self.build_expr(expr.then_branch)}"
+            result += f" : {self.build_expr(expr.else_branch)} "
 
         elif isinstance(expr, Get):
-            result += f" get {expr.name.lexeme} from {expr.obj.accept(self)} "
+            result += f" get {expr.name.lexeme} from {self.build_expr(expr.obj)} "
 
         elif isinstance(expr, Grouping):
-            return f" group ( {expr.expression.accept(self)} ) "
+            return f" group ( {self.build_expr(expr.expression)} ) "
 
         elif isinstance(expr, Literal):
             if expr.value == None:
@@ -261,22 +273,22 @@ class AstPrinter(ExprVisitor, StmtVisitor):
 
         elif isinstance(expr, Logical):
             result += f" {expr.operator.lexeme}"
-            result += f" {expr.left.accept(self)}"
-            result += f" {expr.right.accept(self)} "
+            result += f" {self.build_expr(expr.left)}"
+            result += f" {self.build_expr(expr.right)} "
 
         elif isinstance(expr, Self):
             result += "self"
 
         elif isinstance(expr, Set):
-            result += f" set {expr.obj.accept(self)}.{expr.name.lexeme}"
-            result += f" = {expr.value.accept(self)} "
+            result += f" set {self.build_expr(expr.obj)}.{expr.name.lexeme}"
+            result += f" = {self.build_expr(expr.value)} "
 
         elif isinstance(expr, Super):
             result += f" get super method : {expr.method.lexeme} "
 
         elif isinstance(expr, Unary):
             result += f" {expr.operator.lexeme}"
-            result += f" {expr.right.accept(self)} "
+            result += f" {self.build_expr(expr.right)} "
 
         elif isinstance(expr, Variable):
             result += expr.name.lexeme
@@ -285,8 +297,8 @@ class AstPrinter(ExprVisitor, StmtVisitor):
         return result
 
     def print_stmt(self, stmt: Stmt):
-        print(stmt.accept(self), file=sys.stderr)
+        print(self.build_stmt(stmt), file=sys.stderr)
 
     def print_expr(self, expr: Expr):
-        print(expr.accept(self), file=sys.stderr)
+        print(self.build_expr(expr), file=sys.stderr)
 
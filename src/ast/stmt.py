@@ -1,72 +1,93 @@
-# Python Imports
-from abc import ABC, abstractmethod
-
 # Project Imports
 from src.ast.expr import Expr
 from src.scanner.token import Token
 
 
-class Stmt(ABC):
-    @abstractmethod
-    def accept(self, visitor):
-        ...
-
-
-class StmtVisitor(ABC):
-    @abstractmethod
-    def visit_block_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_break_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_class_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_const_stmt(self, stmt: Stmt) -> None:
-        ...
+# Kind Tags
+#
+# Every node class has an integer 'kind', and STMT_VISITS names the
+# visit method for each kind in the same order. A visitor builds a table
+# of its own methods once with stmt_dispatch() and then visits a node
+# with table[node.kind](node).
+BLOCK = 0
+BREAK = 1
+CLASS = 2
+CONST = 3
+CONTINUE = 4
+ECHO = 5
+EXPRESSION = 6
+FOR = 7
+FUNCTION = 8
+IF = 9
+RETURN = 10
+VAR = 11
+WHILE = 12
+
+STMT_VISITS = [
+    "visit_block_stmt",
+    "visit_break_stmt",
+    "visit_class_stmt",
+    "visit_const_stmt",
+    "visit_continue_stmt",
+    "visit_echo_stmt",
+    "visit_expression_stmt",
+    "visit_for_stmt",
+    "visit_function_stmt",
+    "visit_if_stmt",
+    "visit_return_stmt",
+    "visit_var_stmt",
+    "visit_while_stmt",
+]
+
+# Every StmtVisitor has to cover the first STMT_NODES kinds,
+# the node classes defined in this file.
+STMT_NODES = len(STMT_VISITS)
+
+
+def add_stmt_kind(visit):
+    # Gives a node class defined elsewhere a kind of its own. Visitors
+    # that have no such method get None in its place.
+    STMT_VISITS.append(visit)
+    return len(STMT_VISITS) - 1
+
+
+def stmt_dispatch(visitor):
+    return [getattr(visitor, visit, None) for visit in STMT_VISITS]
+
+
+class Stmt:
+    # Nodes keep their fields in __slots__ rather than a __dict__, which
+    # makes every node smaller and its fields faster to get at. The
+    # base has to declare them too, even if empty, or every node would
+    # get a __dict__ anyway.
+    __slots__ = ()
+    kind = None
 
-    @abstractmethod
-    def visit_continue_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_echo_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_expression_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_for_stmt(self, stmt: Stmt) -> None:
-        ...
-
-    @abstractmethod
-    def visit_function_stmt(self, stmt: Stmt) -> None:
-        ...
+    def accept(self, visitor):
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_if_stmt(self, stmt: Stmt) -> None:
-        ...
 
-    @abstractmethod
-    def visit_return_stmt(self, stmt: Stmt) -> None:
-        ...
+class StmtVisitor:
+    # A visitor class must have a visit method for every node class,
+    # its own or inherited. That is checked as soon as it is defined.
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    @abstractmethod
-    def visit_var_stmt(self, stmt: Stmt) -> None:
-        ...
+        missing = [
+            visit for visit in STMT_VISITS[:STMT_NODES]
+            if not callable(getattr(cls, visit, None))
+        ]
 
-    @abstractmethod
-    def visit_while_stmt(self, stmt: Stmt) -> None:
-        ...
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} is missing {', '.join(missing)}."
+            )
 
 
 class Block(Stmt):
+    __slots__ = ("statements",)
+    kind = BLOCK
+
     def __init__(self, statements: list[Stmt]):
         self.statements = statements
 
@@ -75,6 +96,9 @@ class Block(Stmt):
 
 
 class Break(Stmt):
+    __slots__ = ("keyword",)
+    kind = BREAK
+
     def __init__(self, keyword: Token):
         self.keyword = keyword
 
@@ -83,6 +107,9 @@ class Break(Stmt):
 
 
 class Class(Stmt):
+    __slots__ = ("name", "superclass", "methods")
+    kind = CLASS
+
     def __init__(self, name: Token, superclass: Expr, methods: list[Stmt]):
         self.name = name
         self.superclass = superclass
@@ -93,6 +120,9 @@ class Class(Stmt):
 
 
 class Const(Stmt):
+    __slots__ = ("name", "initializer")
+    kind = CONST
+
     def __init__(self, name: Token, initializer: Expr):
         self.name = name
         self.initializer = initializer
@@ -102,6 +132,9 @@ class Const(Stmt):
 
 
 class Continue(Stmt):
+    __slots__ = ("keyword",)
+    kind = CONTINUE
+
     def __init__(self, keyword: Token):
         self.keyword = keyword
 
@@ -110,6 +143,9 @@ class Continue(Stmt):
 
 
 class Echo(Stmt):
+    __slots__ = ("expression",)
+    kind = ECHO
+
     def __init__(self, expression: Expr):
         self.expression = expression
 
@@ -118,6 +154,9 @@ class Echo(Stmt):
 
 
 class Expression(Stmt):
+    __slots__ = ("expression",)
+    kind = EXPRESSION
+
     def __init__(self, expression: Expr):
         self.expression = expression
 
@@ -126,27 +165,39 @@ class Expression(Stmt):
 
 
 class For(Stmt):
-    def __init__(self, initializer: Stmt, condition: Expr, increment: Expr, body: Stmt):
+    __slots__ = ("initializer", "condition", "increment", "body", "end")
+    kind = FOR
+
+    def __init__(self, initializer: Stmt, condition: Expr, increment: Expr, body: Stmt, end: Token):
         self.initializer = initializer
         self.condition = condition
         self.increment = increment
         self.body = body
+        self.end = end
 
     def accept(self, visitor: StmtVisitor):
         return visitor.visit_for_stmt(self)
 
 
 class Function(Stmt):
+    __slots__ = ("name", "params", "body", "pure", "calls")
+    kind = FUNCTION
+
     def __init__(self, name: Token, params: list[Token], body: list[Stmt]):
         self.name = name
         self.params = params
         self.body = body
+        self.pure = None
+        self.calls = None
 
     def accept(self, visitor: StmtVisitor):
         return visitor.visit_function_stmt(self)
 
 
 class If(Stmt):
+    __slots__ = ("condition", "then_branch", "else_branch")
+    kind = IF
+
     def __init__(self, condition: Expr, then_branch: Stmt, else_branch: Stmt):
         self.condition = condition
         self.then_branch = then_branch
@@ -157,15 +208,22 @@ class If(Stmt):
 
 
 class Return(Stmt):
+    __slots__ = ("keyword", "value", "tail_call")
+    kind = RETURN
+
     def __init__(self, keyword: Token, value: Expr):
         self.keyword = keyword
         self.value = value
+        self.tail_call = None
 
     def accept(self, visitor: StmtVisitor):
         return visitor.visit_return_stmt(self)
 
 
 class Var(Stmt):
+    __slots__ = ("name", "keyword", "initializer")
+    kind = VAR
+
     def __init__(self, name: Token, keyword: Token, initializer: Expr):
         self.name = name
         self.keyword = keyword
@@ -176,9 +234,13 @@ class Var(Stmt):
 
 
 class While(Stmt):
-    def __init__(self, condition: Expr, body: Stmt):
+    __slots__ = ("condition", "body", "end")
+    kind = WHILE
+
+    def __init__(self, condition: Expr, body: Stmt, end: Token):
         self.condition = condition
         self.body = body
+        self.end = end
 
     def accept(self, visitor: StmtVisitor):
         return visitor.visit_while_stmt(self)
@@ -0,0 +1,69 @@
+from src.callable.lox_callable import LoxCallable
+from src.interpreter.completion import TailCall
+from src.interpreter.environment import Environment
+
+
+class ClosureFunction(LoxCallable):
+    __slots__ = (
+        "is_init", "closure", "declaration", "arity_", "size", "body"
+    )
+
+    def __init__(self, declaration, size, body, closure, is_init):
+        self.is_init = is_init
+        self.closure = closure
+        self.declaration = declaration
+        self.arity_ = len(declaration.params)
+        self.size = size
+        self.body = body
+
+    def bind(self, instance):
+        return ClosureFunction(
+            self.declaration,
+            self.size,
+            self.body,
+            self.receiver(instance),
+            self.is_init
+        )
+
+    def receiver(self, instance):
+        environment = Environment(self.closure, 2)
+        environment.slots[0] = instance
+        environment.slots[1] = instance
+        return environment
+
+    def arity(self):
+        return self.arity_
+
+    def invoke(self, interpreter, instance, arguments):
+        # Calls the method on 'instance' without binding it first.
+        return self.call(interpreter, arguments, self.receiver(instance))
+
+    def call(self, interpreter, arguments, closure = None):
+        if closure is None:
+            closure = self.closure
+
+        # Same trampoline as LoxFunction.call.
+        function = self
+
+        while True:
+            environment = Environment(closure, function.size)
+            environment.slots[0 : len(arguments)] = arguments
+
+            signal = function.body(environment)
+
+            if function.is_init:
+                return closure.slots[0]
+
+            # Compiled bodies signal a 'return' by handing back a 1-tuple.
+            if signal.__class__ is tuple:
+                return signal[0]
+
+            if signal.__class__ is not TailCall:
+                return None
+
+            function = signal.function
+            closure = signal.closure
+            arguments = signal.arguments
+
+    def __str__(self):
+        return f"<User Fn - {self.declaration.name.lexeme}>"
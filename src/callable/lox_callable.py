@@ -1,15 +1,17 @@
-from abc import ABC, abstractmethod
+# Lox Callable
+#
+# Base of everything Lox can call. It is a plain class rather than an ABC,
+# since 'isinstance(callee, LoxCallable)' runs on every call that misses
+# its call-site cache, and ABC checks are far slower.
+class LoxCallable:
+    # Empty, so that subclasses can be slotted.
+    __slots__ = ()
 
-
-class LoxCallable(ABC):
-    @abstractmethod
     def arity(self):
         raise NotImplementedError
 
-    @abstractmethod
     def call(self, interpreter, arguments):
         raise NotImplementedError
 
-    @abstractmethod
     def __str__(self):
         raise NotImplementedError
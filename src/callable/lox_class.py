@@ -1,39 +1,51 @@
 from src.callable.lox_callable import LoxCallable
 from src.callable.lox_instance import LoxInstance
+from src.callable.shape import Shape
 
 
+# Lox Class
+#
+# 'methods' is flattened when the class is declared: the superclass's
+# table, itself already flat, is copied in first and the class's own
+# methods override it. Finding a method, inherited or not, is a single
+# dictionary lookup, and the initializer is looked up just the once.
 class LoxClass(LoxCallable):
+    __slots__ = ("superclass", "name", "shape", "methods", "initializer")
+
     def __init__(self, name, superclass, methods):
         self.superclass = superclass
         self.name = name
+        self.shape = Shape(self)
+
         self.methods = methods
+        if superclass != None:
+            self.methods = superclass.methods | methods
 
-    def find_method(self, name):
-        if name in self.methods.keys():
-            return self.methods.get(name)
+        self.initializer = None
+        self.find_initializer()
 
-        if self.superclass != None:
-            return self.superclass.find_method(name)
+    def find_method(self, name):
+        return self.methods.get(name)
 
-    def arity(self):
-        initializer = self.find_method("init")
+    def find_initializer(self):
+        # Either 'init' or a method named after the class constructs it.
+        initializer = self.methods.get("init")
         if initializer == None:
-            initializer = self.find_method(self.name)
+            initializer = self.methods.get(self.name)
 
-        if initializer == None:
+        self.initializer = initializer
+
+    def arity(self):
+        if self.initializer == None:
             return 0
 
-        return initializer.arity()
+        return self.initializer.arity()
 
     def call(self, interpreter, arguments):
         instance = LoxInstance(self)
 
-        initializer = self.find_method("init")
-        if initializer == None:
-            initializer = self.find_method(self.name)
-
-        if initializer != None:
-            initializer.bind(instance).call(interpreter, arguments)
+        if self.initializer != None:
+            self.initializer.invoke(interpreter, instance, arguments)
 
         return instance
 
@@ -1,42 +1,92 @@
 from src.callable.lox_callable import LoxCallable
+from src.interpreter.completion import TailCall
 from src.interpreter.environment import Environment
-from src.util.exceptions import ReturnException
+from src.interpreter.memo import MISSING
 
 
+# Lox Function
+#
+# A new LoxFunction is made for every closure and every bound method, so
+# it is slotted.
 class LoxFunction(LoxCallable):
-    def __init__(self, declaration, closure, is_init):
+    __slots__ = ("is_init", "closure", "declaration", "size", "memo")
+
+    def __init__(self, declaration, closure, is_init, size):
         self.is_init = is_init
         self.closure = closure
         self.declaration = declaration
+        self.size = size
+        self.memo = None
 
     def bind(self, instance):
-        environment = Environment(self.closure)
-        environment.define("this", instance)
-        environment.define("self", instance)
-        return LoxFunction(self.declaration, environment, self.is_init)
+        return LoxFunction(
+            self.declaration,
+            self.receiver(instance),
+            self.is_init,
+            self.size
+        )
+
+    def receiver(self, instance):
+        # Slot 0 is 'this' and slot 1 is 'self', as the Resolver lays out
+        # the scope it opens around every class body.
+        environment = Environment(self.closure, 2)
+        environment.slots[0] = instance
+        environment.slots[1] = instance
+        return environment
 
     def arity(self):
         return len(self.declaration.params)
 
-    def call(self, interpreter, arguments):
-        environment = Environment(self.closure)
+    def invoke(self, interpreter, instance, arguments):
+        # Calls the method on 'instance' without binding it first.
+        return self.call(interpreter, arguments, self.receiver(instance))
+
+    def call(self, interpreter, arguments, closure = None):
+        if closure is None:
+            if self.memo is not None:
+                return self.memoized(interpreter, arguments)
+
+            closure = self.closure
+
+        # Trampoline: a tail call hands back the next function to run and
+        # it runs here, in place of the one that returned it.
+        function = self
 
-        for i in range(len(self.declaration.params)):
-            environment.define(
-                self.declaration.params[i].lexeme,
-                arguments[i]
+        while True:
+            # Parameters take the first slots of the function's scope.
+            environment = Environment(closure, function.size)
+            environment.slots[0 : len(arguments)] = arguments
+
+            signal = interpreter.execute_block(
+                function.declaration.body,
+                environment
             )
 
-        try:
-            interpreter.execute_block(self.declaration.body, environment)
-        except ReturnException as returnValue:
-            if self.is_init:
-                return self.closure.get_at(0, "self")
+            if function.is_init:
+                return closure.slots[0]
+
+            # A 'return' completes the body with a 1-tuple holding its value.
+            if signal.__class__ is tuple:
+                return signal[0]
+
+            if signal.__class__ is not TailCall:
+                return None
+
+            function = signal.function
+            closure = signal.closure
+            arguments = signal.arguments
+
+    def memoized(self, interpreter, arguments):
+        memo = self.memo
+        key = memo.key(arguments)
 
-            return returnValue.value
+        value = memo.lookup(key)
+        if value is MISSING:
+            # Passing the closure along runs the body itself.
+            value = self.call(interpreter, arguments, self.closure)
+            memo.store(key, value)
 
-        if self.is_init:
-            return self.closure.get_at(0, "self")
+        return value
 
     def __str__(self):
         return f"<User Fn - {self.declaration.name.lexeme}>"
@@ -1,14 +1,22 @@
 from src.util.errors import LoxRuntimeError
 
 
+# Lox Instance
+#
+# Fields live in 'values', laid out by the instance's Shape, so the
+# instance itself only needs these three slots.
 class LoxInstance:
+    __slots__ = ("klass", "shape", "values")
+
     def __init__(self, klass):
         self.klass = klass
-        self.fields = {}
+        self.shape = klass.shape
+        self.values = []
 
     def get(self, name):
-        if name.lexeme in self.fields.keys():
-            return self.fields.get(name.lexeme)
+        index = self.shape.indices.get(name.lexeme)
+        if index != None:
+            return self.values[index]
 
         method = self.klass.find_method(name.lexeme)
         if method != None:
@@ -17,7 +25,13 @@ class LoxInstance:
         raise LoxRuntimeError(name, f"Undefined Property '{name.lexeme}'.")
 
     def set_(self, name, value):
-        self.fields[name.lexeme] = value
+        index = self.shape.indices.get(name.lexeme)
+        if index != None:
+            self.values[index] = value
+            return
+
+        self.shape = self.shape.add(name.lexeme)
+        self.values.append(value)
 
     def __str__(self):
         return f"<Instance of : {self.klass.name}>"
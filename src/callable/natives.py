@@ -3,6 +3,8 @@ import time
 
 # Project Imports
 from src.callable.lox_callable import LoxCallable
+from src.callable.lox_function import LoxFunction
+from src.util.errors import NativeError
 
 
 class Clock(LoxCallable):
@@ -16,5 +18,31 @@ class Clock(LoxCallable):
         return "<Native Fn - clock>"
 
 
+class Memo(LoxCallable):
+    # memo(fn) turns on memoization for a pure function and returns it.
+    # Only the tree and stack engines run LoxFunctions, so only they get it.
+    def arity(self):
+        return 1
+
+    def call(self, interpreter, arguments):
+        function = arguments[0]
+
+        if function.__class__ is not LoxFunction:
+            raise NativeError("Can only memoize functions.")
+
+        declaration = function.declaration
+        if not declaration.pure:
+            raise NativeError(
+                f"Cannot memoize '{declaration.name.lexeme}', " +
+                "it is not pure."
+            )
+
+        function.memo = interpreter.memo_cache(declaration)
+        return function
+
+    def __str__(self):
+        return "<Native Fn - memo>"
+
+
 def define_natives(interpreter):
     interpreter.globals.define_const("clock", Clock())
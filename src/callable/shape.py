@@ -0,0 +1,26 @@
+# Shape
+#
+# Describes the layout of a LoxInstance: which field lives at which index
+# of its 'values' list. Every class starts its instances on an empty root
+# shape, and adding a field moves an instance along a transition to the
+# shape with that field appended. Instances that gain the same fields in
+# the same order end up sharing one shape, and since Lox can't delete a
+# field, a shape never changes once made.
+class Shape:
+    def __init__(self, klass, parent = None, name = None):
+        self.klass = klass
+        self.transitions = {}
+
+        if parent == None:
+            self.indices = {}
+        else:
+            self.indices = dict(parent.indices)
+            self.indices[name] = len(parent.indices)
+
+    def add(self, name: str):
+        shape = self.transitions.get(name)
+        if shape == None:
+            shape = Shape(self.klass, self, name)
+            self.transitions[name] = shape
+
+        return shape
@@ -0,0 +1,902 @@
+# Python Imports
+import operator
+
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    ExprVisitor,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Self,
+    Set,
+    Super,
+    Unary,
+    Variable
+)
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.callable.closure_function import ClosureFunction
+from src.callable.lox_callable import LoxCallable
+from src.callable.lox_class import LoxClass
+from src.callable.lox_instance import LoxInstance
+from src.interpreter.completion import (
+    BREAK,
+    CONTINUE,
+    NULL_RETURN,
+    TailCall
+)
+from src.interpreter.environment import Environment, UNDEFINED
+from src.interpreter.inline_cache import PropertyCache
+from src.interpreter.interpreter import Interpreter
+from src.scanner.token import TokenType
+from src.util.errors import LoxRuntimeError, NativeError
+
+
+# Closure Compiler
+#
+# Turns resolved Stmt/Expr trees into nested Python closures taking the
+# current Environment. Every decision the tree-walker makes per evaluation
+# (operator, resolved depth, literal values) is made once, here.
+class ClosureCompiler(ExprVisitor, StmtVisitor):
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.globals = interpreter.globals
+        self.locals = interpreter.locals
+
+    def compile_stmt(self, stmt: Stmt):
+        return stmt.accept(self)
+
+    def compile_expr(self, expr: Expr):
+        return expr.accept(self)
+
+    def compile_block(self, statements: list[Stmt]):
+        compiled = tuple(self.compile_stmt(stmt) for stmt in statements)
+
+        if not compiled:
+            def empty(env):
+                return None
+
+            return empty
+
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def sequence(env):
+            for statement in compiled:
+                signal = statement(env)
+                if signal is not None:
+                    return signal
+
+        return sequence
+
+    def compile_function(self, declaration: Function):
+        size = self.interpreter.slots[declaration]
+        return size, self.compile_block(declaration.body)
+
+    def compile_lookup(self, name, expr):
+        resolved = self.locals.get(expr)
+
+        if resolved is None:
+            slots = self.globals.slots
+            slot = self.globals.index(name.lexeme)
+
+            def global_variable(env):
+                value = slots[slot]
+                if value is UNDEFINED:
+                    raise LoxRuntimeError(
+                        name,
+                        f"Undefined Variable '{name.lexeme}'."
+                    )
+
+                return value
+
+            return global_variable
+
+        distance, slot = resolved
+
+        if distance == 0:
+            def local_variable(env):
+                return env.slots[slot]
+
+            return local_variable
+
+        if distance == 1:
+            def enclosing_variable(env):
+                return env.enclosing.slots[slot]
+
+            return enclosing_variable
+
+        def ancestor_variable(env):
+            return env.ancestor(distance).slots[slot]
+
+        return ancestor_variable
+
+    def compile_store(self, name, expr):
+        resolved = self.locals.get(expr)
+
+        if resolved is None:
+            globals_ = self.globals
+            slot = globals_.index(name.lexeme)
+
+            def store_global(env, value):
+                globals_.assign_slot(slot, name, value)
+
+            return store_global
+
+        distance, slot = resolved
+
+        if distance == 0:
+            def store_local(env, value):
+                env.slots[slot] = value
+
+            return store_local
+
+        def store_ancestor(env, value):
+            env.ancestor(distance).slots[slot] = value
+
+        return store_ancestor
+
+    def compile_declaration(self, stmt: Stmt, name, is_const=False):
+        # Locals go straight into the slot the Resolver picked, globals are
+        # still defined by name.
+        resolved = self.locals.get(stmt)
+
+        if resolved is None:
+            lexeme = name.lexeme
+            globals_ = self.globals
+
+            if is_const:
+                def declare_global_const(env, value):
+                    globals_.define_const(lexeme, value)
+
+                return declare_global_const
+
+            def declare_global(env, value):
+                globals_.define(lexeme, value)
+
+            return declare_global
+
+        slot = resolved[1]
+
+        def declare_local(env, value):
+            env.slots[slot] = value
+
+        return declare_local
+
+    def visit_block_stmt(self, stmt: Block):
+        body = self.compile_block(stmt.statements)
+        size = self.interpreter.slots[stmt]
+
+        def block(env):
+            return body(Environment(env, size))
+
+        return block
+
+    def visit_break_stmt(self, stmt: Break):
+        def break_(env):
+            return BREAK
+
+        return break_
+
+    def visit_class_stmt(self, stmt: Class):
+        name = stmt.name
+        superclass_expr = None
+        if stmt.superclass != None:
+            superclass_expr = self.compile_expr(stmt.superclass)
+
+        declare = self.compile_declaration(stmt, name)
+
+        methods = []
+        for method in stmt.methods:
+            size, body = self.compile_function(method)
+            is_init = (
+                method.name.lexeme == "init" or
+                method.name.lexeme == name.lexeme
+            )
+            methods.append((method, size, body, is_init))
+
+        def class_(env):
+            superclass = None
+            if superclass_expr is not None:
+                superclass = superclass_expr(env)
+
+                if not isinstance(superclass, LoxClass):
+                    raise LoxRuntimeError(
+                        stmt.superclass.name,
+                        "Superclass must be a class."
+                    )
+
+            declare(env, None)
+
+            closure = env
+            if superclass_expr is not None:
+                closure = Environment(env, 1)
+                closure.slots[0] = superclass
+
+            table = {}
+            for method, size, body, is_init in methods:
+                table[method.name.lexeme] = ClosureFunction(
+                    method,
+                    size,
+                    body,
+                    closure,
+                    is_init
+                )
+
+            declare(env, LoxClass(name.lexeme, superclass, table))
+
+        return class_
+
+    def visit_const_stmt(self, stmt: Const):
+        initializer = self.compile_expr(stmt.initializer)
+        declare = self.compile_declaration(stmt, stmt.name, True)
+
+        def const(env):
+            declare(env, initializer(env))
+
+        return const
+
+    def visit_continue_stmt(self, stmt: Continue):
+        def continue_(env):
+            return CONTINUE
+
+        return continue_
+
+    def visit_echo_stmt(self, stmt: Echo):
+        expression = self.compile_expr(stmt.expression)
+        stringify = self.interpreter.stringify
+
+        def echo(env):
+            print(stringify(expression(env)))
+
+        return echo
+
+    def visit_expression_stmt(self, stmt: Expression):
+        expression = self.compile_expr(stmt.expression)
+
+        def expression_stmt(env):
+            expression(env)
+
+        return expression_stmt
+
+    def visit_for_stmt(self, stmt: For):
+        initializer = None
+        if stmt.initializer != None:
+            initializer = self.compile_stmt(stmt.initializer)
+
+        condition = self.compile_expr(stmt.condition)
+        body = self.compile_stmt(stmt.body)
+
+        # A 'continue' still has to run the increment the parser appended
+        # to the end of a block body.
+        increment = None
+        if stmt.increment != None:
+            increment = self.compile_stmt(stmt.body.statements[-1])
+            size = self.interpreter.slots[stmt.body]
+
+        def for_(env):
+            if initializer is not None:
+                initializer(env)
+
+            while True:
+                value = condition(env)
+                if value is None or value is False:
+                    return
+
+                signal = body(env)
+                if signal is None:
+                    continue
+
+                if signal is BREAK:
+                    return
+
+                if signal is CONTINUE:
+                    if increment is not None:
+                        increment(Environment(env, size))
+                    continue
+
+                return signal
+
+        return for_
+
+    def visit_function_stmt(self, stmt: Function):
+        size, body = self.compile_function(stmt)
+        declare = self.compile_declaration(stmt, stmt.name)
+
+        def function(env):
+            declare(env, ClosureFunction(stmt, size, body, env, False))
+
+        return function
+
+    def visit_if_stmt(self, stmt: If):
+        condition = self.compile_expr(stmt.condition)
+        then_branch = self.compile_stmt(stmt.then_branch)
+
+        if stmt.else_branch == None:
+            def if_(env):
+                value = condition(env)
+                if value is not None and value is not False:
+                    return then_branch(env)
+
+            return if_
+
+        else_branch = self.compile_stmt(stmt.else_branch)
+
+        def if_else(env):
+            value = condition(env)
+            if value is not None and value is not False:
+                return then_branch(env)
+
+            return else_branch(env)
+
+        return if_else
+
+    def visit_return_stmt(self, stmt: Return):
+        if stmt.value == None:
+            def return_null(env):
+                return NULL_RETURN
+
+            return return_null
+
+        if stmt.tail_call:
+            return self.compile_tail_call(stmt.value)
+
+        value = self.compile_expr(stmt.value)
+
+        def return_(env):
+            return (value(env),)
+
+        return return_
+
+    def compile_tail_call(self, expr: Call):
+        # Lox functions and methods come back as a TailCall for the
+        # trampoline in ClosureFunction.call, anything else is called here.
+        if expr.callee.__class__ is Get:
+            invoke = self.compile_invoke(expr.callee, expr, True)
+
+            def tail_invoke(env):
+                result = invoke(env)
+                if result.__class__ is TailCall:
+                    return result
+
+                return (result,)
+
+            return tail_invoke
+
+        callee_expr = self.compile_expr(expr.callee)
+        arguments_expr = tuple(
+            self.compile_expr(argument) for argument in expr.arguments
+        )
+        paren = expr.paren
+        interpreter = self.interpreter
+
+        def tail_call(env):
+            callee = callee_expr(env)
+            arguments = [argument(env) for argument in arguments_expr]
+
+            if callee.__class__ is not ClosureFunction:
+                return (interpreter.call(callee, arguments, expr),)
+
+            arity = callee.arity_
+            if len(arguments) != arity:
+                raise LoxRuntimeError(
+                    paren,
+                    f"Expected {arity} arguments " +
+                    f"but got {len(arguments)} instead."
+                )
+
+            return TailCall(callee, callee.closure, arguments)
+
+        return tail_call
+
+    def visit_var_stmt(self, stmt: Var):
+        resolved = self.locals.get(stmt)
+        declare = self.compile_declaration(stmt, stmt.name)
+
+        if stmt.initializer == None:
+            def var_null(env):
+                declare(env, None)
+
+            return var_null
+
+        initializer = self.compile_expr(stmt.initializer)
+
+        if resolved is not None:
+            slot = resolved[1]
+
+            def var_local(env):
+                env.slots[slot] = initializer(env)
+
+            return var_local
+
+        def var(env):
+            declare(env, initializer(env))
+
+        return var
+
+    def visit_while_stmt(self, stmt: While):
+        condition = self.compile_expr(stmt.condition)
+        body = self.compile_stmt(stmt.body)
+
+        def while_(env):
+            while True:
+                value = condition(env)
+                if value is None or value is False:
+                    return
+
+                signal = body(env)
+                if signal is None or signal is CONTINUE:
+                    continue
+
+                if signal is BREAK:
+                    return
+
+                return signal
+
+        return while_
+
+    def visit_assign_expr(self, expr: Assign):
+        value_expr = self.compile_expr(expr.value)
+        store = self.compile_store(expr.name, expr)
+
+        if expr.operator.type == TokenType.EQ:
+            resolved = self.locals.get(expr)
+
+            if resolved is not None and resolved[0] == 0:
+                slot = resolved[1]
+
+                def assign_local(env):
+                    value = value_expr(env)
+                    env.slots[slot] = value
+                    return value
+
+                return assign_local
+
+            def assign(env):
+                value = value_expr(env)
+                store(env, value)
+                return value
+
+            return assign
+
+        name = expr.name
+        operator_ = expr.operator
+        apply = {
+            TokenType.MINUSEQ: operator.sub,
+            TokenType.MODEQ: operator.mod,
+            TokenType.PLUSEQ: operator.add,
+            TokenType.SLASHEQ: operator.truediv,
+            TokenType.STAREQ: operator.mul,
+        }[operator_.type]
+        divides = operator_.type in (TokenType.MODEQ, TokenType.SLASHEQ)
+        lookup = self.compile_lookup(name, expr)
+
+        def augmented_assign(env):
+            value = value_expr(env)
+            if value.__class__ is not float:
+                raise LoxRuntimeError(
+                    operator_,
+                    "Cannot use augmented assignment on non-number values."
+                )
+
+            if divides and value == 0:
+                raise LoxRuntimeError(operator_, "Cannot divide by Zero.")
+
+            initial = lookup(env)
+            if initial.__class__ is not float:
+                raise LoxRuntimeError(
+                    operator_,
+                    "Cannot use augmented assignment on non-number values."
+                )
+
+            store(env, apply(initial, value))
+            return value
+
+        return augmented_assign
+
+    def visit_binary_expr(self, expr: Binary):
+        left = self.compile_expr(expr.left)
+        right = self.compile_expr(expr.right)
+        operator_ = expr.operator
+
+        match operator_.type:
+            case TokenType.PLUS:
+                stringify = self.interpreter.stringify
+
+                def add(env):
+                    a = left(env)
+                    b = right(env)
+
+                    if a.__class__ is float:
+                        if b.__class__ is float:
+                            return a + b
+                        if b.__class__ is str:
+                            return stringify(a) + b
+
+                    elif a.__class__ is str:
+                        if b.__class__ is str:
+                            return a + b
+                        if b.__class__ is float:
+                            return a + stringify(b)
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers or strings. Combining the two is allowed.")
+
+                return add
+
+            case TokenType.MINUS:
+                def subtract(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a - b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return subtract
+
+            case TokenType.STAR:
+                def multiply(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a * b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return multiply
+
+            case TokenType.SLASH | TokenType.MODULUS:
+                apply = (
+                    operator.truediv
+                    if operator_.type == TokenType.SLASH
+                    else operator.mod
+                )
+
+                def divide(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        if b == 0:
+                            raise LoxRuntimeError(operator_, "Cannot divide by Zero.")
+
+                        return apply(a, b)
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return divide
+
+            case TokenType.POWER:
+                def power(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a ** b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return power
+
+            case TokenType.LT:
+                def less(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a < b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return less
+
+            case TokenType.LTEQ:
+                def less_equal(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a <= b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return less_equal
+
+            case TokenType.GT:
+                def greater(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a > b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return greater
+
+            case TokenType.GTEQ:
+                def greater_equal(env):
+                    a = left(env)
+                    b = right(env)
+                    if a.__class__ is float and b.__class__ is float:
+                        return a >= b
+
+                    raise LoxRuntimeError(operator_, "Operands must be numbers.")
+
+                return greater_equal
+
+            case TokenType.EQEQ:
+                def equal(env):
+                    a = left(env)
+                    b = right(env)
+                    if a is None:
+                        return b is None
+
+                    return a == b
+
+                return equal
+
+            case TokenType.BANGEQ:
+                def not_equal(env):
+                    a = left(env)
+                    b = right(env)
+                    if a is None:
+                        return b is not None
+
+                    return not a == b
+
+                return not_equal
+
+    def visit_call_expr(self, expr: Call):
+        if expr.callee.__class__ is Get:
+            return self.compile_invoke(expr.callee, expr)
+
+        callee_expr = self.compile_expr(expr.callee)
+        arguments_expr = tuple(
+            self.compile_expr(argument) for argument in expr.arguments
+        )
+        paren = expr.paren
+        interpreter = self.interpreter
+
+        def call(env):
+            callee = callee_expr(env)
+            arguments = [argument(env) for argument in arguments_expr]
+
+            # The site keeps the last callee that passed the checks, see
+            # Interpreter.call.
+            if callee is not expr.cache:
+                if (callee.__class__ is not ClosureFunction and
+                        not isinstance(callee, LoxCallable)):
+                    raise LoxRuntimeError(
+                        paren,
+                        "Only classes, functions or methods can be called."
+                    )
+
+                arity = callee.arity()
+                if len(arguments) != arity:
+                    raise LoxRuntimeError(
+                        paren,
+                        f"Expected {arity} arguments " +
+                        f"but got {len(arguments)} instead."
+                    )
+
+                expr.cache = callee
+
+            try:
+                return callee.call(interpreter, arguments)
+            except NativeError as e:
+                raise LoxRuntimeError(paren, e.message)
+
+        return call
+
+    def compile_invoke(self, get: Get, expr: Call, tail=False):
+        # 'obj.name(...)': methods are invoked on the receiver without
+        # binding them, anything else is fetched and called as usual.
+        obj_expr = self.compile_expr(get.obj)
+        arguments_expr = tuple(
+            self.compile_expr(argument) for argument in expr.arguments
+        )
+        name = get.name
+        paren = expr.paren
+        interpreter = self.interpreter
+        cache = PropertyCache(name)
+        find_method = cache.find_method
+        cached_get = cache.get
+
+        def invoke(env):
+            obj = obj_expr(env)
+            if not isinstance(obj, LoxInstance):
+                raise LoxRuntimeError(
+                    name,
+                    "Only instances of an object have properties."
+                )
+
+            method = find_method(obj)
+            if method is None:
+                callee = cached_get(obj)
+                arguments = [argument(env) for argument in arguments_expr]
+                return interpreter.call(callee, arguments, expr)
+
+            arguments = [argument(env) for argument in arguments_expr]
+
+            arity = method.arity_
+            if len(arguments) != arity:
+                raise LoxRuntimeError(
+                    paren,
+                    f"Expected {arity} arguments " +
+                    f"but got {len(arguments)} instead."
+                )
+
+            if tail:
+                return TailCall(method, method.receiver(obj), arguments)
+
+            return method.invoke(interpreter, obj, arguments)
+
+        return invoke
+
+    def visit_conditional_expr(self, expr: Conditional):
+        condition = self.compile_expr(expr.condition)
+        then_branch = self.compile_expr(expr.then_branch)
+        else_branch = self.compile_expr(expr.else_branch)
+
+        def conditional(env):
+            value = condition(env)
+            if value is not None and value is not False:
+                return then_branch(env)
+
+            return else_branch(env)
+
+        return conditional
+
+    def visit_get_expr(self, expr: Get):
+        obj_expr = self.compile_expr(expr.obj)
+        name = expr.name
+        cached_get = PropertyCache(name).get
+
+        def get(env):
+            obj = obj_expr(env)
+            if isinstance(obj, LoxInstance):
+                return cached_get(obj)
+
+            raise LoxRuntimeError(
+                name,
+                "Only instances of an object have properties."
+            )
+
+        return get
+
+    def visit_grouping_expr(self, expr: Grouping):
+        return self.compile_expr(expr.expression)
+
+    def visit_literal_expr(self, expr: Literal):
+        value = expr.value
+
+        def literal(env):
+            return value
+
+        return literal
+
+    def visit_logical_expr(self, expr: Logical):
+        left = self.compile_expr(expr.left)
+        right = self.compile_expr(expr.right)
+
+        if expr.operator.type == TokenType.OR:
+            def or_(env):
+                value = left(env)
+                if value is not None and value is not False:
+                    return value
+
+                return right(env)
+
+            return or_
+
+        def and_(env):
+            value = left(env)
+            if value is None or value is False:
+                return value
+
+            return right(env)
+
+        return and_
+
+    def visit_self_expr(self, expr: Self):
+        return self.compile_lookup(expr.keyword, expr)
+
+    def visit_set_expr(self, expr: Set):
+        obj_expr = self.compile_expr(expr.obj)
+        value_expr = self.compile_expr(expr.value)
+        name = expr.name
+        cached_set = PropertyCache(name).set_
+
+        def set_(env):
+            obj = obj_expr(env)
+
+            if not isinstance(obj, LoxInstance):
+                raise LoxRuntimeError(
+                    name,
+                    "Only instances of an object have fields."
+                )
+
+            value = value_expr(env)
+            cached_set(obj, value)
+            return value
+
+        return set_
+
+    def visit_super_expr(self, expr: Super):
+        distance = self.locals.get(expr)[0]
+        method_name = expr.method
+
+        def super_(env):
+            superclass = env.ancestor(distance).slots[0]
+            obj = env.ancestor(distance - 1).slots[0]
+
+            method = superclass.find_method(method_name.lexeme)
+
+            if method is None:
+                raise LoxRuntimeError(
+                    method_name,
+                    f"Undefined Property '{method_name.lexeme}'."
+                )
+
+            return method.bind(obj)
+
+        return super_
+
+    def visit_unary_expr(self, expr: Unary):
+        right = self.compile_expr(expr.right)
+        operator_ = expr.operator
+
+        if operator_.type == TokenType.BANG:
+            def not_(env):
+                value = right(env)
+                return value is None or value is False
+
+            return not_
+
+        def negate(env):
+            value = right(env)
+            if value.__class__ is float:
+                return -value
+
+            raise LoxRuntimeError(operator_, "Operand must be a number.")
+
+        return negate
+
+    def visit_variable_expr(self, expr: Variable):
+        return self.compile_lookup(expr.name, expr)
+
+
+# Closure Interpreter
+#
+# Drop-in replacement for the tree-walking Interpreter. Top-level statements
+# are compiled once and then run against the global environment. Functions
+# run as ClosureFunctions, which can't be memoized, so there is no memo().
+class ClosureInterpreter(Interpreter):
+    memoizes = False
+
+    def __init__(self, err_manager, mode):
+        super().__init__(err_manager, mode)
+        self.compiler = ClosureCompiler(self)
+
+    def execute(self, stmt: Stmt):
+        self.compiler.compile_stmt(stmt)(self.globals)
+
+    def evaluate(self, expr: Expr):
+        return self.compiler.compile_expr(expr)(self.globals)
@@ -0,0 +1,25 @@
+# Completion Signals
+#
+# Executing a statement hands back how it completed instead of raising.
+# Normal completion is None, 'break' and 'continue' are the markers below,
+# a 'return' hands back a 1-tuple holding the returned value and a tail
+# call a TailCall. Loops consume BREAK and CONTINUE, function calls unwrap
+# the tuple or run the tail call, and every other statement passes a
+# signal it doesn't handle straight up.
+BREAK = object()
+CONTINUE = object()
+NULL_RETURN = (None,)
+
+
+# Tail Call
+#
+# What a 'return f(...)' marked by the Resolver hands back instead of
+# making the call itself: the function, the closure to run it in and the
+# evaluated arguments. The calling function's trampoline then runs it in
+# place of the frame that returned it, so tail recursion doesn't grow the
+# Python stack.
+class TailCall:
+    def __init__(self, function, closure, arguments):
+        self.function = function
+        self.closure = closure
+        self.arguments = arguments
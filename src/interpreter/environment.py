@@ -4,17 +4,28 @@ from src.util.errors import LoxRuntimeError
 
 
 # Environment
+#
+# Locals live in 'slots', a list sized by the Resolver when it closes the
+# scope, and are addressed by (distance, slot) pairs it hands out. Only the
+# global environment is keyed by name, through 'values' and 'constants'.
+#
+# An environment is made for every call and every block, so it is slotted
+# and the name tables, which a local scope never uses, are only made the
+# first time something is defined by name.
 class Environment:
-    def __init__(self, enclosing = None):
+    __slots__ = ("enclosing", "slots", "values", "constants")
+
+    def __init__(self, enclosing = None, size = 0):
         self.enclosing = enclosing
-        self.values = {}
-        self.constants = {}
+        self.slots = [None] * size
+        self.values = None
+        self.constants = None
 
     def get(self, name: Token):
-        if name.lexeme in self.values.keys():
+        if self.values != None and name.lexeme in self.values:
             return self.values[name.lexeme]
 
-        if name.lexeme in self.constants.keys():
+        if self.constants != None and name.lexeme in self.constants:
             return self.constants[name.lexeme]
 
         if self.enclosing != None:
@@ -22,15 +33,15 @@ class Environment:
 
         raise LoxRuntimeError(name, f"Undefined Variable '{name.lexeme}'.")
 
-    def get_at(self, distance: int, name: str):
-        return self.ancestor(distance).values.get(name)
+    def get_at(self, distance: int, slot: int):
+        return self.ancestor(distance).slots[slot]
 
     def assign(self, name: Token, value: object):
-        if name.lexeme in self.values.keys():
+        if self.values != None and name.lexeme in self.values:
             self.values[name.lexeme] = value
             return
 
-        if name.lexeme in self.constants.keys():
+        if self.constants != None and name.lexeme in self.constants:
             raise LoxRuntimeError(name, "Cannot reassign a constant.")
 
         if self.enclosing != None:
@@ -39,13 +50,19 @@ class Environment:
 
         raise LoxRuntimeError(name, f"Undefined Variable '{name.lexeme}'.")
 
-    def assign_at(self, distance: int, name: Token, value: object):
-        self.ancestor(distance).values[name.lexeme] = value
+    def assign_at(self, distance: int, slot: int, value: object):
+        self.ancestor(distance).slots[slot] = value
 
     def define(self, name: str, value: object):
+        if self.values == None:
+            self.values = {}
+
         self.values[name] = value
 
     def define_const(self, name: str, value: object):
+        if self.constants == None:
+            self.constants = {}
+
         self.constants[name] = value
 
     def ancestor(self, distance):
@@ -54,3 +71,67 @@ class Environment:
             environment = environment.enclosing
 
         return environment
+
+
+# Marks a global slot that has been handed out but not defined yet.
+UNDEFINED = object()
+
+
+# Global Environment
+#
+# Globals are kept in an indexed table. Every name gets a fixed slot the
+# first time it is seen, so a use site can look its slot up once and read
+# the list directly afterwards. Redefining a name reuses its slot.
+class GlobalEnvironment(Environment):
+    __slots__ = ("indices", "names", "is_const")
+
+    def __init__(self):
+        super().__init__()
+        self.indices = {}
+        self.names = []
+        self.is_const = []
+
+    def index(self, lexeme: str):
+        slot = self.indices.get(lexeme)
+
+        if slot == None:
+            slot = len(self.slots)
+            self.indices[lexeme] = slot
+            self.names.append(lexeme)
+            self.slots.append(UNDEFINED)
+            self.is_const.append(False)
+
+        return slot
+
+    def get(self, name: Token):
+        return self.get_slot(self.index(name.lexeme), name)
+
+    def get_slot(self, slot: int, name: Token):
+        value = self.slots[slot]
+
+        if value is UNDEFINED:
+            raise LoxRuntimeError(name, f"Undefined Variable '{name.lexeme}'.")
+
+        return value
+
+    def assign(self, name: Token, value: object):
+        self.assign_slot(self.index(name.lexeme), name, value)
+
+    def assign_slot(self, slot: int, name: Token, value: object):
+        if self.slots[slot] is UNDEFINED:
+            raise LoxRuntimeError(name, f"Undefined Variable '{name.lexeme}'.")
+
+        if self.is_const[slot]:
+            raise LoxRuntimeError(name, "Cannot reassign a constant.")
+
+        self.slots[slot] = value
+
+    def define(self, name: str, value: object):
+        slot = self.index(name)
+        self.slots[slot] = value
+        self.is_const[slot] = False
+
+    def define_const(self, name: str, value: object):
+        slot = self.index(name)
+        self.slots[slot] = value
+        self.is_const[slot] = True
@@ -0,0 +1,130 @@
+# Python Imports
+from enum import Enum
+
+# Project Imports
+from src.util.errors import LoxRuntimeError
+
+
+# A site that has seen more receiver classes than this stops caching.
+MAX_POLYMORPHIC = 4
+
+
+class CacheState(Enum):
+    UNINITIALIZED = 0
+    MONOMORPHIC = 1
+    POLYMORPHIC = 2
+    MEGAMORPHIC = 3
+
+
+# Property Cache
+#
+# Inline cache for one Get or Set site, keyed on the receiver's Shape. A
+# shape belongs to a single class and fixes where every field lives, so
+# an entry can hold everything the site needs to know:
+#
+#   Get: (field index, method), the index being None when the shape has
+#        no such field. Fields shadow methods, and the method is None when
+#        the class has none either.
+#   Set: (field index, transition), the transition being the shape to move
+#        to when the field is new, which then goes at the given index.
+#
+# Shapes never change once made and Lox can't remove a field, so entries
+# never go stale. A new field or a redefined class simply shows up as a
+# shape the site hasn't seen.
+class PropertyCache:
+    def __init__(self, name):
+        self.name = name
+        self.lexeme = name.lexeme
+        self.state = CacheState.UNINITIALIZED
+
+        # The first shape seen gets its own slot, the rest go in 'entries'.
+        self.shape = None
+        self.entry = None
+        self.entries = {}
+
+    def get(self, instance):
+        shape = instance.shape
+
+        if shape is self.shape:
+            index, method = self.entry
+        elif self.state == CacheState.MEGAMORPHIC:
+            return instance.get(self.name)
+        else:
+            index, method = self.lookup(shape, self.resolve_get)
+
+        if index != None:
+            return instance.values[index]
+
+        if method is None:
+            raise LoxRuntimeError(
+                self.name,
+                f"Undefined Property '{self.lexeme}'."
+            )
+
+        return method.bind(instance)
+
+    def find_method(self, instance):
+        # For invoke sites: the method the name resolves to, or None when
+        # it is a field or undefined and the site must go through get().
+        shape = instance.shape
+
+        if shape is self.shape:
+            index, method = self.entry
+        elif self.state == CacheState.MEGAMORPHIC:
+            index, method = self.resolve_get(shape)
+        else:
+            index, method = self.lookup(shape, self.resolve_get)
+
+        if index != None:
+            return None
+
+        return method
+
+    def set_(self, instance, value):
+        shape = instance.shape
+
+        if shape is self.shape:
+            index, transition = self.entry
+        elif self.state == CacheState.MEGAMORPHIC:
+            instance.set_(self.name, value)
+            return
+        else:
+            index, transition = self.lookup(shape, self.resolve_set)
+
+        if transition is None:
+            instance.values[index] = value
+        else:
+            instance.shape = transition
+            instance.values.append(value)
+
+    def resolve_get(self, shape):
+        return (
+            shape.indices.get(self.lexeme),
+            shape.klass.find_method(self.lexeme)
+        )
+
+    def resolve_set(self, shape):
+        index = shape.indices.get(self.lexeme)
+        if index != None:
+            return (index, None)
+
+        return (len(shape.indices), shape.add(self.lexeme))
+
+    def lookup(self, shape, resolve):
+        if shape in self.entries:
+            return self.entries[shape]
+
+        entry = resolve(shape)
+
+        if self.state == CacheState.UNINITIALIZED:
+            self.shape = shape
+            self.entry = entry
+            self.state = CacheState.MONOMORPHIC
+        elif len(self.entries) < MAX_POLYMORPHIC - 1:
+            self.entries[shape] = entry
+            self.state = CacheState.POLYMORPHIC
+        else:
+            self.entries.clear()
+            self.state = CacheState.MEGAMORPHIC
+
+        return entry
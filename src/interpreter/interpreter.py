@@ -37,30 +37,56 @@ from src.callable.lox_callable import LoxCallable
 from src.callable.lox_class import LoxClass
 from src.callable.lox_function import LoxFunction
 from src.callable.lox_instance import LoxInstance
-from src.interpreter.environment import Environment
-from src.callable.natives import define_natives
-from src.scanner.token import TokenType
-from src.util.errors import LoxRuntimeError
-from src.util.exceptions import (
-    BreakException,
-    ContinueException,
-    ReturnException
+from src.interpreter.completion import (
+    BREAK,
+    CONTINUE,
+    NULL_RETURN,
+    TailCall
 )
+from src.interpreter.environment import Environment, GlobalEnvironment
+from src.interpreter.inline_cache import PropertyCache
+from src.interpreter.memo import MemoCache
+from src.interpreter.quicken import (
+    QUICKEN_AFTER,
+    QuickBinary,
+    QuickUnary,
+    deoptimize,
+    quicken_binary,
+    quicken_unary
+)
+from src.interpreter.values import is_equal, is_truthy, stringify
+from src.callable.natives import Memo, define_natives
+from src.scanner.token import Token, TokenType
+from src.util.errors import LoxRuntimeError, NativeError
 from src.util.mode import RunMode
 
 
 # Interpreter Class
 class Interpreter(ExprVisitor, StmtVisitor):
+    # Whether the engine runs LoxFunctions, which memo() works on.
+    memoizes = True
+
+    is_truthy = staticmethod(is_truthy)
+    is_equal = staticmethod(is_equal)
+    stringify = staticmethod(stringify)
+
     def __init__(self, err_manager, mode):
         self.err_manager = err_manager
         self.mode = mode
-        self.globals = Environment()
+        self.globals = GlobalEnvironment()
         self.environment = self.globals
         self.locals = {}
-        self.loop_depth = 0
+        self.slots = {}
+
+        # With 'memoize' on, every function the Resolver found pure is
+        # memoized. 'memos' holds the cache of each memoized declaration.
+        self.memoize = False
+        self.memos = {}
 
         # Native Functions
         define_natives(self)
+        if self.memoizes:
+            self.globals.define_const("memo", Memo())
 
     def interpret(self, statements: list[Stmt]):
         try:
@@ -82,11 +108,47 @@ class Interpreter(ExprVisitor, StmtVisitor):
         else:
             self.execute(stmt)
 
-    def resolve(self, expr, depth):
-        self.locals[expr] = depth
+    def resolve(self, expr, depth, slot):
+        self.locals[expr] = (depth, slot)
+
+    def resolve_scope(self, node, size):
+        self.slots[node] = size
+
+    def release(self, node):
+        # Drops what the Resolver recorded for a statement that will never
+        # run again, like one that was streamed or eliminated, so its nodes
+        # can be freed. Functions and classes may still be called, so they
+        # keep theirs.
+        pending = [node]
+
+        while pending:
+            node = pending.pop()
+            if node.__class__ is Function or node.__class__ is Class:
+                continue
+
+            self.forget(node)
+
+            # Quickened nodes add no slots of their own, so the fields come
+            # from every class the node is.
+            for cls in node.__class__.__mro__:
+                for name in cls.__dict__.get("__slots__", ()):
+                    value = getattr(node, name)
+
+                    if isinstance(value, (Expr, Stmt)):
+                        pending.append(value)
+                    elif value.__class__ is list:
+                        pending.extend(
+                            item for item in value
+                            if isinstance(item, (Expr, Stmt))
+                        )
+
+    def forget(self, node):
+        self.locals.pop(node, None)
+        self.slots.pop(node, None)
 
     def execute(self, stmt: Stmt):
-        stmt.accept(self)
+        # Returns the statement's completion signal, see completion.py.
+        return stmt.accept(self)
 
     def execute_block(self, statements: list[Stmt], environment):
         previous = self.environment
@@ -95,18 +157,26 @@ class Interpreter(ExprVisitor, StmtVisitor):
             self.environment = environment
 
             for statement in statements:
-                self.execute(statement)
+                signal = statement.accept(self)
+                if signal is not None:
+                    return signal
         finally:
             self.environment = previous
 
     def evaluate(self, expr: Expr):
+        # This is the hottest call in the tree-walker. 'accept' is a single
+        # method call with no table lookup, which measured faster here than
+        # indexing expr_dispatch(self) by kind, so it stays.
         return expr.accept(self)
 
     def visit_block_stmt(self, stmt: Block):
-        self.execute_block(stmt.statements, Environment(self.environment))
+        return self.execute_block(
+            stmt.statements,
+            Environment(self.environment, self.slots[stmt])
+        )
 
     def visit_break_stmt(self, stmt: Break):
-        raise BreakException(stmt.keyword)
+        return BREAK
 
     def visit_class_stmt(self, stmt: Class):
         superclass = None
@@ -119,11 +189,11 @@ class Interpreter(ExprVisitor, StmtVisitor):
                     "Superclass must be a class."
                 )
 
-        self.environment.define(stmt.name.lexeme, None)
+        self.declare(stmt, stmt.name, None)
 
         if stmt.superclass != None:
-            self.environment = Environment(self.environment)
-            self.environment.define("super", superclass)
+            self.environment = Environment(self.environment, 1)
+            self.environment.slots[0] = superclass
 
         methods = {}
         for method in stmt.methods:
@@ -131,7 +201,8 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 method,
                 self.environment,
                 (method.name.lexeme == "init" or
-                    method.name.lexeme == stmt.name.lexeme)
+                    method.name.lexeme == stmt.name.lexeme),
+                self.slots[method]
             )
             methods[method.name.lexeme] = function
 
@@ -140,14 +211,19 @@ class Interpreter(ExprVisitor, StmtVisitor):
         if superclass != None:
             self.environment = self.environment.enclosing
 
-        self.environment.assign(stmt.name, klass)
+        self.declare(stmt, stmt.name, klass)
 
     def visit_const_stmt(self, stmt: Const):
         value = self.evaluate(stmt.initializer)
-        self.environment.define_const(stmt.name.lexeme, value)
+
+        slot = self.locals.get(stmt)
+        if slot != None:
+            self.environment.slots[slot[1]] = value
+        else:
+            self.environment.define_const(stmt.name.lexeme, value)
 
     def visit_continue_stmt(self, stmt: Continue):
-        raise ContinueException(stmt.keyword)
+        return CONTINUE
 
     def visit_echo_stmt(self, stmt: Echo):
         value = self.evaluate(stmt.expression)
@@ -158,63 +234,109 @@ class Interpreter(ExprVisitor, StmtVisitor):
 
     def visit_for_stmt(self, stmt: For):
         if stmt.initializer != None:
-            self.evaluate(stmt.initializer)
+            self.execute(stmt.initializer)
 
-        try:
-            self.loop_depth += 1
-            while self.is_truthy(self.evaluate(stmt.condition)):
-                try:
-                    self.evaluate(stmt.body)
-                except BreakException:
-                    return
-                except ContinueException:
-                    if isinstance(stmt.body, Block):
-                        self.execute_block(
-                            [stmt.body.statements[-1]],
-                            Environment(self.environment)
-                        )
-        finally:
-            self.loop_depth -= 1
+        while self.is_truthy(self.evaluate(stmt.condition)):
+            signal = self.execute(stmt.body)
+            if signal is None:
+                continue
+
+            if signal is BREAK:
+                return
+
+            if signal is CONTINUE:
+                # The body was cut short before the increment the parser
+                # appended to it, so run that on its own.
+                if stmt.increment != None:
+                    self.execute_block(
+                        [stmt.body.statements[-1]],
+                        Environment(self.environment, self.slots[stmt.body])
+                    )
+                continue
+
+            return signal
 
     def visit_function_stmt(self, stmt: Function):
-        function = LoxFunction(stmt, self.environment, False)
-        self.environment.define(stmt.name.lexeme, function)
+        function = LoxFunction(
+            stmt,
+            self.environment,
+            False,
+            self.slots[stmt]
+        )
+
+        if self.memoize and stmt.pure:
+            function.memo = self.memo_cache(stmt)
+
+        self.declare(stmt, stmt.name, function)
 
     def visit_if_stmt(self, stmt: If):
         if self.is_truthy(self.evaluate(stmt.condition)):
-            self.execute(stmt.then_branch)
+            return self.execute(stmt.then_branch)
 
         elif stmt.else_branch != None:
-            self.execute(stmt.else_branch)
+            return self.execute(stmt.else_branch)
 
     def visit_return_stmt(self, stmt: Return):
-        value = None
-        if stmt.value != None:
-            value = self.evaluate(stmt.value)
+        if stmt.value == None:
+            return NULL_RETURN
+
+        if stmt.tail_call:
+            return self.tail_call(stmt.value)
+
+        return (self.evaluate(stmt.value),)
+
+    def tail_call(self, expr: Call):
+        # Calls to Lox functions and methods come back as a TailCall for
+        # the trampoline in LoxFunction to run. Anything else is called
+        # right away and returned as usual.
+        if expr.callee.__class__ is Get:
+            result = self.invoke(expr.callee, expr, True)
+        elif expr.callee.__class__ is Super:
+            result = self.invoke_super(expr.callee, expr, True)
+        else:
+            callee = self.evaluate(expr.callee)
+            arguments = [self.evaluate(argument) for argument in expr.arguments]
+            result = self.call(callee, arguments, expr, True)
 
-        raise ReturnException(stmt.keyword.lexeme, value)
+        if result.__class__ is TailCall:
+            return result
+
+        return (result,)
 
     def visit_var_stmt(self, stmt: Var):
         value = None
         if stmt.initializer != None:
             value = self.evaluate(stmt.initializer)
 
-        self.environment.define(stmt.name.lexeme, value)
+        self.declare(stmt, stmt.name, value)
 
     def visit_while_stmt(self, stmt: While):
         while self.is_truthy(self.evaluate(stmt.condition)):
-            self.execute(stmt.body)
+            signal = self.execute(stmt.body)
+            if signal is None or signal is CONTINUE:
+                continue
+
+            if signal is BREAK:
+                return
+
+            return signal
 
     def visit_assign_expr(self, expr: Assign):
-        value = self.evaluate(expr.value)
+        return self.assign(expr, self.evaluate(expr.value))
 
+    def assign(self, expr: Assign, value):
+        # Stores the already evaluated right-hand side.
         match expr.operator.type:
             case TokenType.EQ:
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, value)
+                    self.environment.assign_at(distance[0], distance[1], value)
                 else:
-                    self.environment.assign(expr.name, value)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        value
+                    )
 
                 return value
 
@@ -222,14 +344,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 if not isinstance(value, float):
                     raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
 
-                initial = self.environment.get(expr.name)
+                initial = self.look_up_variable(expr.name, expr)
+                if not isinstance(initial, float):
+                    raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
+
                 initial -= value
 
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, initial)
+                    self.environment.assign_at(distance[0], distance[1], initial)
                 else:
-                    self.environment.assign(expr.name, initial)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        initial
+                    )
 
                 return value
 
@@ -240,14 +369,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 if value == 0:
                     raise LoxRuntimeError(expr.operator, "Cannot divide by Zero.")
 
-                initial = self.environment.get(expr.name)
+                initial = self.look_up_variable(expr.name, expr)
+                if not isinstance(initial, float):
+                    raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
+
                 initial %= value
 
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, initial)
+                    self.environment.assign_at(distance[0], distance[1], initial)
                 else:
-                    self.environment.assign(expr.name, initial)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        initial
+                    )
 
                 return value
 
@@ -255,14 +391,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 if not isinstance(value, float):
                     raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
 
-                initial = self.environment.get(expr.name)
+                initial = self.look_up_variable(expr.name, expr)
+                if not isinstance(initial, float):
+                    raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
+
                 initial += value
 
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, initial)
+                    self.environment.assign_at(distance[0], distance[1], initial)
                 else:
-                    self.environment.assign(expr.name, initial)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        initial
+                    )
 
                 return value
 
@@ -273,14 +416,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 if value == 0:
                     raise LoxRuntimeError(expr.operator, "Cannot divide by Zero.")
 
-                initial = self.environment.get(expr.name)
+                initial = self.look_up_variable(expr.name, expr)
+                if not isinstance(initial, float):
+                    raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
+
                 initial /= value
 
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, initial)
+                    self.environment.assign_at(distance[0], distance[1], initial)
                 else:
-                    self.environment.assign(expr.name, initial)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        initial
+                    )
 
                 return value
 
@@ -288,14 +438,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 if not isinstance(value, float):
                     raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
 
-                initial = self.environment.get(expr.name)
+                initial = self.look_up_variable(expr.name, expr)
+                if not isinstance(initial, float):
+                    raise LoxRuntimeError(expr.operator, "Cannot use augmented assignment on non-number values.")
+
                 initial *= value
 
                 distance = self.locals.get(expr)
                 if distance != None:
-                    self.environment.assign_at(distance, expr.name, initial)
+                    self.environment.assign_at(distance[0], distance[1], initial)
                 else:
-                    self.environment.assign(expr.name, initial)
+                    self.globals.assign_slot(
+                        self.global_slot(expr, expr.name),
+                        expr.name,
+                        initial
+                    )
 
                 return value
 
@@ -303,6 +460,29 @@ class Interpreter(ExprVisitor, StmtVisitor):
         left = self.evaluate(expr.left)
         right = self.evaluate(expr.right)
 
+        if expr.hits < QUICKEN_AFTER:
+            expr.hits += 1
+            if expr.hits == QUICKEN_AFTER:
+                quicken_binary(expr, left, right)
+
+        return self.binary(expr, left, right)
+
+    def visit_quick_binary_expr(self, expr: QuickBinary):
+        left = self.evaluate(expr.left)
+        right = self.evaluate(expr.right)
+
+        guard = expr.guard
+        if left.__class__ is guard and right.__class__ is guard:
+            try:
+                return expr.op(left, right)
+            except ZeroDivisionError:
+                raise LoxRuntimeError(expr.operator, "Cannot divide by Zero.")
+
+        deoptimize(expr)
+        return self.binary(expr, left, right)
+
+    def binary(self, expr: Binary, left, right):
+        # Applies the operator to already evaluated operands.
         match expr.operator.type:
             case TokenType.MINUS:
                 if self.check_operands(expr.operator, left, right) == True:
@@ -367,26 +547,105 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 return self.is_equal(left, right)
 
     def visit_call_expr(self, expr: Call):
+        if expr.callee.__class__ is Get:
+            return self.invoke(expr.callee, expr)
+
+        if expr.callee.__class__ is Super:
+            return self.invoke_super(expr.callee, expr)
+
         callee = self.evaluate(expr.callee)
 
         arguments = []
         for argument in expr.arguments:
             arguments.append(self.evaluate(argument))
 
+        return self.call(callee, arguments, expr)
+
+    def invoke(self, get: Get, expr: Call, tail=False):
+        # 'obj.name(...)': a method found on the receiver's class is called
+        # with the receiver directly, so no bound method is made. Fields
+        # and everything else take the usual Get-then-call route.
+        obj = self.evaluate(get.obj)
+
+        if not isinstance(obj, LoxInstance):
+            raise LoxRuntimeError(
+                get.name,
+                "Only instances of an object have properties."
+            )
+
+        cache = get.cache
+        if cache == None:
+            cache = get.cache = PropertyCache(get.name)
+
+        method = cache.find_method(obj)
+        if method == None:
+            callee = cache.get(obj)
+            arguments = [self.evaluate(argument) for argument in expr.arguments]
+            return self.call(callee, arguments, expr, tail)
+
+        arguments = [self.evaluate(argument) for argument in expr.arguments]
+        return self.invoke_method(method, obj, arguments, expr, tail)
+
+    def invoke_super(self, super_: Super, expr: Call, tail=False):
+        # 'super.name(...)': the method is invoked on the receiver just like
+        # in invoke(), without binding it first.
+        method, obj = self.super_method(super_)
+
+        arguments = [self.evaluate(argument) for argument in expr.arguments]
+        return self.invoke_method(method, obj, arguments, expr, tail)
+
+    def invoke_method(self, method, obj, arguments, expr: Call, tail=False):
+        if method is not expr.cache:
+            self.check_arity(method, arguments, expr.paren)
+            expr.cache = method
+
+        if tail:
+            return TailCall(method, method.receiver(obj), arguments)
+
+        return method.invoke(self, obj, arguments)
+
+    def call(self, callee, arguments, expr: Call, tail=False):
+        # Each call site keeps the last callee that passed the checks. A
+        # site always passes the same number of arguments, so that callee
+        # can be called again straight away.
+        if callee is not expr.cache:
+            self.check_callee(callee, arguments, expr.paren)
+            expr.cache = callee
+
+        # A memoized function has to go through its cache, so it can't be
+        # run in place of the caller.
+        if tail and callee.__class__ is LoxFunction and callee.memo is None:
+            return TailCall(callee, callee.closure, arguments)
+
+        try:
+            return callee.call(self, arguments)
+        except NativeError as e:
+            raise LoxRuntimeError(expr.paren, e.message)
+
+    def check_callee(self, callee, arguments, paren: Token):
         if not isinstance(callee, LoxCallable):
             raise LoxRuntimeError(
-                expr.paren,
+                paren,
                 "Only classes, functions or methods can be called."
             )
 
-        function = callee
-        if len(arguments) != function.arity():
+        self.check_arity(callee, arguments, paren)
+
+    def check_arity(self, callee, arguments, paren: Token):
+        arity = callee.arity()
+        if len(arguments) != arity:
             raise LoxRuntimeError(
-                expr.paren,
-                f"Expected {function.arity()} arguments " +
+                paren,
+                f"Expected {arity} arguments " +
                 f"but got {len(arguments)} instead."
             )
-        return function.call(self, arguments)
+
+    def memo_cache(self, declaration):
+        cache = self.memos.get(declaration)
+        if cache == None:
+            cache = self.memos[declaration] = MemoCache()
+
+        return cache
 
     def visit_conditional_expr(self, expr: Conditional):
         if self.is_truthy(self.evaluate(expr.condition)):
@@ -397,7 +656,11 @@ class Interpreter(ExprVisitor, StmtVisitor):
     def visit_get_expr(self, expr: Get):
         obj = self.evaluate(expr.obj)
         if isinstance(obj, LoxInstance):
-            return obj.get(expr.name)
+            cache = expr.cache
+            if cache == None:
+                cache = expr.cache = PropertyCache(expr.name)
+
+            return cache.get(obj)
 
         raise LoxRuntimeError(
             expr.name,
@@ -435,16 +698,32 @@ class Interpreter(ExprVisitor, StmtVisitor):
             )
 
         value = self.evaluate(expr.value)
-        obj.set_(expr.name, value)
+
+        cache = expr.cache
+        if cache == None:
+            cache = expr.cache = PropertyCache(expr.name)
+
+        cache.set_(obj, value)
         return value
 
     def visit_super_expr(self, expr: Super):
-        distance = self.locals.get(expr)
-        superclass = self.environment.get_at(distance, "super")
+        method, obj = self.super_method(expr)
+        return method.bind(obj)
+
+    def super_method(self, expr: Super):
+        # Returns the method 'super.name' refers to and the receiver.
+        environment = self.environment.ancestor(self.locals[expr][0] - 1)
 
-        obj = self.environment.get_at(distance - 1, "self")
-        if obj == None:
-            obj = self.environment.get_at(distance - 1, "this")
+        # 'this' and 'self' share the receiver, so either slot will do.
+        obj = environment.slots[0]
+        superclass = environment.enclosing.slots[0]
+
+        # A class's superclass never changes, but a class declared in a
+        # function body gets a new one each time the body runs. So the
+        # cache holds the superclass it was filled in for.
+        cache = expr.cache
+        if cache is not None and cache[0] is superclass:
+            return cache[1], obj
 
         method = superclass.find_method(expr.method.lexeme)
 
@@ -454,11 +733,29 @@ class Interpreter(ExprVisitor, StmtVisitor):
                 f"Undefined Property '{expr.method.lexeme}'."
             )
 
-        return method.bind(obj)
+        expr.cache = (superclass, method)
+        return method, obj
 
     def visit_unary_expr(self, expr: Unary):
         right = self.evaluate(expr.right)
 
+        if expr.hits < QUICKEN_AFTER:
+            expr.hits += 1
+            if expr.hits == QUICKEN_AFTER:
+                quicken_unary(expr, right)
+
+        return self.unary(expr, right)
+
+    def visit_quick_unary_expr(self, expr: QuickUnary):
+        right = self.evaluate(expr.right)
+
+        if right.__class__ is expr.guard:
+            return expr.op(right)
+
+        deoptimize(expr)
+        return self.unary(expr, right)
+
+    def unary(self, expr: Unary, right):
         match expr.operator.type:
             case TokenType.BANG:
                 return not self.is_truthy(right)
@@ -471,30 +768,29 @@ class Interpreter(ExprVisitor, StmtVisitor):
         # return self.environment.get(expr.name)
         return self.look_up_variable(expr.name, expr)
 
+    def declare(self, stmt, name, value):
+        slot = self.locals.get(stmt)
+        if slot != None:
+            self.environment.slots[slot[1]] = value
+        else:
+            self.environment.define(name.lexeme, value)
+
     def look_up_variable(self, name, expr):
         distance = self.locals.get(expr)
         if distance != None:
-            return self.environment.get_at(distance, name.lexeme)
+            return self.environment.get_at(distance[0], distance[1])
         else:
-            return self.globals.get(name)
-
-    def is_truthy(self, obj):
-        if obj == None:
-            return False
+            return self.globals.get_slot(self.global_slot(expr, name), name)
 
-        if isinstance(obj, bool):
-            return obj
-
-        return True
-
-    def is_equal(self, a, b):
-        if (a == None) and (b == None):
-            return True
+    def global_slot(self, expr, name):
+        # Unresolved names are globals. Each use site asks the table for
+        # its slot once and keeps it.
+        slot = expr.global_slot
+        if slot == None:
+            slot = self.globals.index(name.lexeme)
+            expr.global_slot = slot
 
-        if a == None:
-            return False
-
-        return a == b
+        return slot
 
     def check_operand(self, operator, operand):
         if isinstance(operand, float):
@@ -507,16 +803,3 @@ class Interpreter(ExprVisitor, StmtVisitor):
             return True
 
         raise LoxRuntimeError(operator, "Operands must be numbers.")
-
-    def stringify(self, obj):
-        if obj == None:
-            return "null"
-
-        if isinstance(obj, float):
-            text = str(obj)
-            if text.endswith(".0"):
-                text = text[0 : len(text) - 2]
-
-            return text
-
-        return str(obj)
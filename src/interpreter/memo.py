@@ -0,0 +1,48 @@
+# Python Imports
+from collections import OrderedDict
+
+
+# How many results a memoized function keeps before evicting the oldest.
+MEMO_CAPACITY = 1024
+
+# Stands for "not cached" where None is a perfectly good result.
+MISSING = object()
+
+
+# Memo Cache
+#
+# Bounded LRU of a pure function's results, keyed on its arguments. The
+# Resolver only lets functions whose result depends on their arguments
+# alone be memoized, so one cache is shared by every closure made from the
+# same declaration.
+#
+# Arguments are keyed together with their types since True == 1.0 in
+# Python, and Lox tells them apart.
+class MemoCache:
+    def __init__(self, capacity = MEMO_CAPACITY):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, arguments):
+        return tuple([(argument.__class__, argument) for argument in arguments])
+
+    def lookup(self, key):
+        value = self.entries.get(key, MISSING)
+
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return value
+
+    def store(self, key, value):
+        self.entries[key] = value
+
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,93 @@
+# Python Imports
+import operator
+
+# Project Imports
+from src.ast.expr import ExprVisitor, Binary, Unary, add_expr_kind
+from src.scanner.token import TokenType
+
+
+# A Binary or Unary site runs generically this many times before it tries
+# to specialize on the operand types it sees.
+QUICKEN_AFTER = 8
+
+# (operator, operand type) -> the Python operation that does the same job
+# once both operands are known to be of that type. Power is left out since
+# Python raises its own errors for it, which a specialized site would
+# otherwise have to tell apart from the generic path's.
+BINARY_OPERATIONS = {
+    (TokenType.PLUS, float): operator.add,
+    (TokenType.PLUS, str): operator.add,
+    (TokenType.MINUS, float): operator.sub,
+    (TokenType.STAR, float): operator.mul,
+    (TokenType.SLASH, float): operator.truediv,
+    (TokenType.MODULUS, float): operator.mod,
+    (TokenType.GT, float): operator.gt,
+    (TokenType.GTEQ, float): operator.ge,
+    (TokenType.LT, float): operator.lt,
+    (TokenType.LTEQ, float): operator.le,
+    (TokenType.EQEQ, float): operator.eq,
+    (TokenType.EQEQ, str): operator.eq,
+    (TokenType.BANGEQ, float): operator.ne,
+    (TokenType.BANGEQ, str): operator.ne,
+}
+
+UNARY_OPERATIONS = {
+    (TokenType.MINUS, float): operator.neg,
+    (TokenType.BANG, bool): operator.not_,
+}
+
+
+# Quickened Nodes
+#
+# The tree-walker counts how often each Binary and Unary site runs. Once a
+# site has run QUICKEN_AFTER times, it looks at the operands in hand and,
+# if there is an operation for them above, the node rewrites itself into
+# one of these: 'guard' is the operand type and 'op' the operation, e.g.
+# (float, add) for a number-add or (str, add) for a string-concat.
+#
+# Nodes change class in place, so every dictionary keyed on them still
+# finds them. A quickened node checks its operands against the guard and,
+# when they don't match, deoptimizes back to the generic node for good,
+# which keeps a site that sees mixed types from flipping back and forth.
+# They add no slots of their own, so the layouts match and the swap works.
+class QuickBinary(Binary):
+    __slots__ = ()
+    kind = add_expr_kind("visit_quick_binary_expr")
+
+    def accept(self, visitor: ExprVisitor):
+        return visitor.visit_quick_binary_expr(self)
+
+
+class QuickUnary(Unary):
+    __slots__ = ()
+    kind = add_expr_kind("visit_quick_unary_expr")
+
+    def accept(self, visitor: ExprVisitor):
+        return visitor.visit_quick_unary_expr(self)
+
+
+def quicken_binary(expr: Binary, left, right):
+    guard = left.__class__
+    op = BINARY_OPERATIONS.get((expr.operator.type, guard))
+
+    if op != None and right.__class__ is guard:
+        expr.guard = guard
+        expr.op = op
+        expr.__class__ = QuickBinary
+
+
+def quicken_unary(expr: Unary, right):
+    guard = right.__class__
+    op = UNARY_OPERATIONS.get((expr.operator.type, guard))
+
+    if op != None:
+        expr.guard = guard
+        expr.op = op
+        expr.__class__ = QuickUnary
+
+
+def deoptimize(expr):
+    # 'hits' stays at QUICKEN_AFTER, so the site never specializes again.
+    expr.__class__ = expr.__class__.__bases__[0]
+    expr.guard = None
+    expr.op = None
@@ -0,0 +1,565 @@
+# Python Imports
+from types import GeneratorType
+
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Logical,
+    Set,
+    Super,
+    Unary
+)
+from src.ast.stmt import (
+    Stmt,
+    Block,
+    Const,
+    Echo,
+    Expression,
+    For,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.callable.lox_class import LoxClass
+from src.callable.lox_function import LoxFunction
+from src.callable.lox_instance import LoxInstance
+from src.interpreter.completion import BREAK, CONTINUE, NULL_RETURN, TailCall
+from src.interpreter.environment import Environment
+from src.interpreter.inline_cache import PropertyCache
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.memo import MISSING
+from src.interpreter.quicken import QuickBinary, QuickUnary
+from src.scanner.token import TokenType
+from src.util.errors import LoxRuntimeError, NativeError
+
+
+# Lox calls nested deeper than this report a stack overflow, unless
+# '--max-depth' says otherwise.
+DEFAULT_MAX_DEPTH = 10000
+
+# The sub-expressions of every expression kind that has any.
+CHILDREN = {
+    Assign: ("value",),
+    Binary: ("left", "right"),
+    Conditional: ("condition", "then_branch", "else_branch"),
+    Get: ("obj",),
+    Grouping: ("expression",),
+    Logical: ("left", "right"),
+    Set: ("obj", "value"),
+    Unary: ("right",),
+    QuickBinary: ("left", "right"),
+    QuickUnary: ("right",),
+}
+
+
+# Stack Interpreter
+#
+# Tree-walker that keeps Lox frames off the Python stack. Statements, and
+# expressions that contain a call, are run by generators that yield each
+# node they need evaluated and get its value sent back. run() drives them
+# from an explicit, heap-allocated list, so the Python stack stays just as
+# deep however deep the Lox calls go, and 'max_depth' alone bounds them.
+#
+# An expression without a call can't go any deeper than its own nesting,
+# so those are handed to the plain Interpreter methods.
+class StackInterpreter(Interpreter):
+    def __init__(self, err_manager, mode):
+        super().__init__(err_manager, mode)
+        self.max_depth = DEFAULT_MAX_DEPTH
+        self.depth = 0
+        self.calls = {}
+
+    def forget(self, node):
+        super().forget(node)
+        self.calls.pop(node, None)
+
+    def execute(self, stmt: Stmt):
+        return self.run(stmt)
+
+    def evaluate(self, expr: Expr):
+        return self.run(expr)
+
+    def execute_block(self, statements: list[Stmt], environment):
+        return self.drive(self.block(statements, environment))
+
+    def run(self, node):
+        value = node.accept(self)
+        if value.__class__ is not GeneratorType:
+            return value
+
+        return self.drive(value)
+
+    def drive(self, generator):
+        stack = [generator]
+        value = None
+
+        try:
+            while True:
+                try:
+                    node = stack[-1].send(value)
+                except StopIteration as done:
+                    stack.pop()
+                    if not stack:
+                        return done.value
+
+                    value = done.value
+                    continue
+
+                value = node.accept(self)
+                if value.__class__ is GeneratorType:
+                    stack.append(value)
+                    value = None
+        finally:
+            # On an error, unwind innermost first so every frame puts back
+            # the environment and depth it replaced.
+            while stack:
+                stack.pop().close()
+
+    def has_call(self, expr: Expr):
+        found = self.calls.get(expr)
+
+        if found == None:
+            if expr.__class__ is Call:
+                found = True
+            else:
+                found = any(
+                    self.has_call(getattr(expr, child))
+                    for child in CHILDREN.get(expr.__class__, ())
+                )
+
+            self.calls[expr] = found
+
+        return found
+
+    def block(self, statements: list[Stmt], environment):
+        previous = self.environment
+
+        try:
+            self.environment = environment
+
+            for statement in statements:
+                signal = yield statement
+                if signal is not None:
+                    return signal
+        finally:
+            self.environment = previous
+
+    def frame(self, function, closure, arguments, paren):
+        # One Lox call, with the same trampoline as LoxFunction.call.
+        if self.depth >= self.max_depth:
+            raise LoxRuntimeError(paren, "Stack overflow.")
+
+        self.depth += 1
+
+        try:
+            while True:
+                environment = Environment(closure, function.size)
+                environment.slots[0 : len(arguments)] = arguments
+
+                signal = yield from self.block(
+                    function.declaration.body,
+                    environment
+                )
+
+                if function.is_init:
+                    return closure.slots[0]
+
+                if signal.__class__ is tuple:
+                    return signal[0]
+
+                if signal.__class__ is not TailCall:
+                    return None
+
+                function = signal.function
+                closure = signal.closure
+                arguments = signal.arguments
+        finally:
+            self.depth -= 1
+
+    def call_value(self, callee, arguments, expr: Call, tail=False):
+        # Interpreter.call, with Lox functions and initializers run as
+        # frames.
+        paren = expr.paren
+
+        if callee is not expr.cache:
+            self.check_callee(callee, arguments, paren)
+            expr.cache = callee
+
+        if callee.__class__ is LoxFunction:
+            if callee.memo is not None:
+                return (yield from self.memoized(callee, arguments, paren))
+
+            if tail:
+                return TailCall(callee, callee.closure, arguments)
+
+            return (yield from self.frame(
+                callee,
+                callee.closure,
+                arguments,
+                paren
+            ))
+
+        # Initializers run as frames here too, instead of LoxClass.call.
+        if callee.__class__ is LoxClass:
+            instance = LoxInstance(callee)
+
+            initializer = callee.initializer
+            if initializer != None:
+                yield from self.frame(
+                    initializer,
+                    initializer.receiver(instance),
+                    arguments,
+                    paren
+                )
+
+            return instance
+
+        try:
+            return callee.call(self, arguments)
+        except NativeError as e:
+            raise LoxRuntimeError(paren, e.message)
+
+    def memoized(self, function, arguments, paren):
+        # LoxFunction.memoized, with the body run as a frame.
+        memo = function.memo
+        key = memo.key(arguments)
+
+        value = memo.lookup(key)
+        if value is MISSING:
+            value = yield from self.frame(
+                function,
+                function.closure,
+                arguments,
+                paren
+            )
+            memo.store(key, value)
+
+        return value
+
+    def invoke_steps(self, get: Get, expr: Call, tail=False):
+        obj = yield get.obj
+
+        if not isinstance(obj, LoxInstance):
+            raise LoxRuntimeError(
+                get.name,
+                "Only instances of an object have properties."
+            )
+
+        cache = get.cache
+        if cache == None:
+            cache = get.cache = PropertyCache(get.name)
+
+        method = cache.find_method(obj)
+        if method == None:
+            callee = cache.get(obj)
+
+            arguments = []
+            for argument in expr.arguments:
+                arguments.append((yield argument))
+
+            return (yield from self.call_value(
+                callee,
+                arguments,
+                expr,
+                tail
+            ))
+
+        arguments = []
+        for argument in expr.arguments:
+            arguments.append((yield argument))
+
+        return (yield from self.method_steps(
+            method,
+            obj,
+            arguments,
+            expr,
+            tail
+        ))
+
+    def invoke_super_steps(self, super_: Super, expr: Call, tail=False):
+        method, obj = self.super_method(super_)
+
+        arguments = []
+        for argument in expr.arguments:
+            arguments.append((yield argument))
+
+        return (yield from self.method_steps(
+            method,
+            obj,
+            arguments,
+            expr,
+            tail
+        ))
+
+    def method_steps(self, method, obj, arguments, expr: Call, tail=False):
+        if method is not expr.cache:
+            self.check_arity(method, arguments, expr.paren)
+            expr.cache = method
+
+        if tail:
+            return TailCall(method, method.receiver(obj), arguments)
+
+        return (yield from self.frame(
+            method,
+            method.receiver(obj),
+            arguments,
+            expr.paren
+        ))
+
+    def call_steps(self, expr: Call, tail=False):
+        if expr.callee.__class__ is Get:
+            return (yield from self.invoke_steps(expr.callee, expr, tail))
+
+        if expr.callee.__class__ is Super:
+            return (yield from self.invoke_super_steps(expr.callee, expr, tail))
+
+        callee = yield expr.callee
+
+        arguments = []
+        for argument in expr.arguments:
+            arguments.append((yield argument))
+
+        return (yield from self.call_value(
+            callee,
+            arguments,
+            expr,
+            tail
+        ))
+
+    # Statements
+
+    def visit_block_stmt(self, stmt: Block):
+        return self.block(
+            stmt.statements,
+            Environment(self.environment, self.slots[stmt])
+        )
+
+    def visit_const_stmt(self, stmt: Const):
+        if not self.has_call(stmt.initializer):
+            return super().visit_const_stmt(stmt)
+
+        return self.const_steps(stmt)
+
+    def const_steps(self, stmt: Const):
+        value = yield stmt.initializer
+
+        slot = self.locals.get(stmt)
+        if slot != None:
+            self.environment.slots[slot[1]] = value
+        else:
+            self.environment.define_const(stmt.name.lexeme, value)
+
+    def visit_echo_stmt(self, stmt: Echo):
+        if not self.has_call(stmt.expression):
+            return super().visit_echo_stmt(stmt)
+
+        return self.echo_steps(stmt)
+
+    def echo_steps(self, stmt: Echo):
+        value = yield stmt.expression
+        print(self.stringify(value))
+
+    def visit_expression_stmt(self, stmt: Expression):
+        if not self.has_call(stmt.expression):
+            return super().visit_expression_stmt(stmt)
+
+        return self.expression_steps(stmt)
+
+    def expression_steps(self, stmt: Expression):
+        yield stmt.expression
+
+    def visit_for_stmt(self, stmt: For):
+        if stmt.initializer != None:
+            yield stmt.initializer
+
+        while self.is_truthy((yield stmt.condition)):
+            signal = yield stmt.body
+            if signal is None:
+                continue
+
+            if signal is BREAK:
+                return
+
+            if signal is CONTINUE:
+                if stmt.increment != None:
+                    yield from self.block(
+                        [stmt.body.statements[-1]],
+                        Environment(self.environment, self.slots[stmt.body])
+                    )
+                continue
+
+            return signal
+
+    def visit_if_stmt(self, stmt: If):
+        if self.is_truthy((yield stmt.condition)):
+            return (yield stmt.then_branch)
+
+        elif stmt.else_branch != None:
+            return (yield stmt.else_branch)
+
+    def visit_return_stmt(self, stmt: Return):
+        if stmt.value == None:
+            return NULL_RETURN
+
+        if stmt.tail_call:
+            return self.tail_call_steps(stmt.value)
+
+        if not self.has_call(stmt.value):
+            return (self.evaluate(stmt.value),)
+
+        return self.return_steps(stmt)
+
+    def return_steps(self, stmt: Return):
+        return ((yield stmt.value),)
+
+    def tail_call_steps(self, expr: Call):
+        result = yield from self.call_steps(expr, True)
+        if result.__class__ is TailCall:
+            return result
+
+        return (result,)
+
+    def visit_var_stmt(self, stmt: Var):
+        if stmt.initializer == None or not self.has_call(stmt.initializer):
+            return super().visit_var_stmt(stmt)
+
+        return self.var_steps(stmt)
+
+    def var_steps(self, stmt: Var):
+        value = yield stmt.initializer
+        self.declare(stmt, stmt.name, value)
+
+    def visit_while_stmt(self, stmt: While):
+        while self.is_truthy((yield stmt.condition)):
+            signal = yield stmt.body
+            if signal is None or signal is CONTINUE:
+                continue
+
+            if signal is BREAK:
+                return
+
+            return signal
+
+    # Expressions
+
+    def visit_assign_expr(self, expr: Assign):
+        if not self.has_call(expr):
+            return super().visit_assign_expr(expr)
+
+        return self.assign_steps(expr)
+
+    def assign_steps(self, expr: Assign):
+        return self.assign(expr, (yield expr.value))
+
+    def visit_binary_expr(self, expr: Binary):
+        if not self.has_call(expr):
+            return super().visit_binary_expr(expr)
+
+        return self.binary_steps(expr)
+
+    def binary_steps(self, expr: Binary):
+        left = yield expr.left
+        right = yield expr.right
+        return self.binary(expr, left, right)
+
+    def visit_call_expr(self, expr: Call):
+        return self.call_steps(expr)
+
+    def visit_conditional_expr(self, expr: Conditional):
+        if not self.has_call(expr):
+            return super().visit_conditional_expr(expr)
+
+        return self.conditional_steps(expr)
+
+    def conditional_steps(self, expr: Conditional):
+        if self.is_truthy((yield expr.condition)):
+            return (yield expr.then_branch)
+
+        return (yield expr.else_branch)
+
+    def visit_get_expr(self, expr: Get):
+        if not self.has_call(expr):
+            return super().visit_get_expr(expr)
+
+        return self.get_steps(expr)
+
+    def get_steps(self, expr: Get):
+        obj = yield expr.obj
+        if isinstance(obj, LoxInstance):
+            cache = expr.cache
+            if cache == None:
+                cache = expr.cache = PropertyCache(expr.name)
+
+            return cache.get(obj)
+
+        raise LoxRuntimeError(
+            expr.name,
+            "Only instances of an object have properties."
+        )
+
+    def visit_grouping_expr(self, expr: Grouping):
+        if not self.has_call(expr):
+            return super().visit_grouping_expr(expr)
+
+        return self.grouping_steps(expr)
+
+    def grouping_steps(self, expr: Grouping):
+        return (yield expr.expression)
+
+    def visit_logical_expr(self, expr: Logical):
+        if not self.has_call(expr):
+            return super().visit_logical_expr(expr)
+
+        return self.logical_steps(expr)
+
+    def logical_steps(self, expr: Logical):
+        left = yield expr.left
+
+        if expr.operator.type == TokenType.OR:
+            if self.is_truthy(left):
+                return left
+        else:
+            if not self.is_truthy(left):
+                return left
+
+        return (yield expr.right)
+
+    def visit_set_expr(self, expr: Set):
+        if not self.has_call(expr):
+            return super().visit_set_expr(expr)
+
+        return self.set_steps(expr)
+
+    def set_steps(self, expr: Set):
+        obj = yield expr.obj
+
+        if not isinstance(obj, LoxInstance):
+            raise LoxRuntimeError(
+                expr.name,
+                "Only instances of an object have fields."
+            )
+
+        value = yield expr.value
+
+        cache = expr.cache
+        if cache == None:
+            cache = expr.cache = PropertyCache(expr.name)
+
+        cache.set_(obj, value)
+        return value
+
+    def visit_unary_expr(self, expr: Unary):
+        if not self.has_call(expr):
+            return super().visit_unary_expr(expr)
+
+        return self.unary_steps(expr)
+
+    def unary_steps(self, expr: Unary):
+        return self.unary(expr, (yield expr.right))
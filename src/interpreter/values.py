@@ -0,0 +1,39 @@
+# Lox Values
+#
+# The rules for truthiness, equality and printing Lox values. The
+# Interpreter uses them at run time, and the ConstantFolder and
+# DeadCodeEliminator use them at compile time. A folded constant has to
+# mean the same thing as it would at run time, so all three share this one
+# definition.
+def is_truthy(obj):
+    if obj == None:
+        return False
+
+    if isinstance(obj, bool):
+        return obj
+
+    return True
+
+
+def is_equal(a, b):
+    if (a == None) and (b == None):
+        return True
+
+    if a == None:
+        return False
+
+    return a == b
+
+
+def stringify(obj):
+    if obj == None:
+        return "null"
+
+    if isinstance(obj, float):
+        text = str(obj)
+        if text.endswith(".0"):
+            text = text[0 : len(text) - 2]
+
+        return text
+
+    return str(obj)
@@ -0,0 +1,205 @@
+# Project Imports
+from src.ast.expr import Expr, Literal
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.interpreter.values import is_truthy
+
+
+# Dead Code Eliminator
+#
+# Runs after the ConstantFolder and drops statements that can never run:
+# whatever follows a 'return', 'break' or 'continue' in the same block, and
+# the branches and loops whose condition the folder left as a Literal. A
+# constant ?: is already collapsed by the folder itself.
+#
+# Every statement visitor returns the statement that should take its place,
+# or None when it goes away entirely. Where a statement is required, like
+# an 'if' branch or a loop body, an empty Block stands in and is handed to
+# the interpreter as a scope of size 0, just like the Resolver would.
+#
+# 'removed' counts every node dropped, expressions included. The
+# interpreter is told to release them too.
+class DeadCodeEliminator(StmtVisitor):
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.removed = 0
+
+    def eliminate_stmts(self, stmts: list[Stmt]):
+        live = []
+
+        for index, stmt in enumerate(stmts):
+            stmt = self.eliminate_stmt(stmt)
+            if stmt == None:
+                continue
+
+            live.append(stmt)
+
+            if self.terminates(stmt):
+                for dead in stmts[index + 1:]:
+                    self.remove(dead)
+                break
+
+        return live
+
+    def eliminate_stmt(self, stmt: Stmt):
+        return stmt.accept(self)
+
+    def required(self, stmt: Stmt):
+        stmt = self.eliminate_stmt(stmt)
+
+        if stmt == None:
+            stmt = Block([])
+            self.interpreter.resolve_scope(stmt, 0)
+
+        return stmt
+
+    def remove(self, node):
+        self.removed += self.count(node, set())
+        self.interpreter.release(node)
+
+    def count(self, node, seen):
+        # A For's increment is also the last statement of its body, so
+        # nodes are only counted the first time they are reached.
+        if id(node) in seen:
+            return 0
+
+        seen.add(id(node))
+        total = 1
+
+        for value in self.fields(node):
+            if isinstance(value, (Expr, Stmt)):
+                total += self.count(value, seen)
+
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, (Expr, Stmt)):
+                        total += self.count(item, seen)
+
+        return total
+
+    def fields(self, node):
+        # Nodes have no __dict__, their fields are the slots of their class.
+        return [getattr(node, name) for name in node.__slots__]
+
+    def terminates(self, stmt: Stmt):
+        # Whether the statement can never complete normally, which makes
+        # anything after it in the same block unreachable.
+        if isinstance(stmt, (Return, Break, Continue)):
+            return True
+
+        if isinstance(stmt, Block):
+            return (
+                len(stmt.statements) > 0 and
+                self.terminates(stmt.statements[-1])
+            )
+
+        if isinstance(stmt, If):
+            return (
+                stmt.else_branch != None and
+                self.terminates(stmt.then_branch) and
+                self.terminates(stmt.else_branch)
+            )
+
+        return False
+
+    def visit_block_stmt(self, stmt: Block):
+        stmt.statements = self.eliminate_stmts(stmt.statements)
+        return stmt
+
+    def visit_break_stmt(self, stmt: Break):
+        return stmt
+
+    def visit_class_stmt(self, stmt: Class):
+        for method in stmt.methods:
+            self.eliminate_stmt(method)
+
+        return stmt
+
+    def visit_const_stmt(self, stmt: Const):
+        return stmt
+
+    def visit_continue_stmt(self, stmt: Continue):
+        return stmt
+
+    def visit_echo_stmt(self, stmt: Echo):
+        return stmt
+
+    def visit_expression_stmt(self, stmt: Expression):
+        return stmt
+
+    def visit_for_stmt(self, stmt: For):
+        if (isinstance(stmt.condition, Literal) and
+                not is_truthy(stmt.condition.value)):
+            # The initializer still runs once. It never gets a scope of its
+            # own, so it can simply take the loop's place.
+            self.removed += 1
+            self.remove(stmt.condition)
+            self.remove(stmt.body)
+            return stmt.initializer
+
+        if stmt.increment == None:
+            stmt.body = self.required(stmt.body)
+            return stmt
+
+        # The parser appended the increment to the body and a 'continue'
+        # still has to reach it, so it is kept out of the pruning.
+        body = stmt.body.statements
+        stmt.body.statements = self.eliminate_stmts(body[:-1]) + body[-1:]
+        return stmt
+
+    def visit_function_stmt(self, stmt: Function):
+        stmt.body = self.eliminate_stmts(stmt.body)
+        return stmt
+
+    def visit_if_stmt(self, stmt: If):
+        if isinstance(stmt.condition, Literal):
+            self.removed += 1
+            self.remove(stmt.condition)
+
+            if is_truthy(stmt.condition.value):
+                if stmt.else_branch != None:
+                    self.remove(stmt.else_branch)
+                return self.eliminate_stmt(stmt.then_branch)
+
+            self.remove(stmt.then_branch)
+            if stmt.else_branch == None:
+                return None
+
+            return self.eliminate_stmt(stmt.else_branch)
+
+        stmt.then_branch = self.required(stmt.then_branch)
+
+        if stmt.else_branch != None:
+            stmt.else_branch = self.eliminate_stmt(stmt.else_branch)
+
+        return stmt
+
+    def visit_return_stmt(self, stmt: Return):
+        return stmt
+
+    def visit_var_stmt(self, stmt: Var):
+        return stmt
+
+    def visit_while_stmt(self, stmt: While):
+        if (isinstance(stmt.condition, Literal) and
+                not is_truthy(stmt.condition.value)):
+            self.remove(stmt)
+            return None
+
+        stmt.body = self.required(stmt.body)
+        return stmt
@@ -0,0 +1,301 @@
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    ExprVisitor,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Self,
+    Set,
+    Super,
+    Unary,
+    Variable
+)
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.interpreter.values import is_equal, is_truthy, stringify
+from src.scanner.token import TokenType
+
+
+# Stands for "leave this node alone" where None is a perfectly good value.
+NO_FOLD = object()
+
+
+# Constant Folder
+#
+# Runs between the Resolver and the interpreter and replaces expressions
+# whose operands are all literals with the Literal they evaluate to. Every
+# expression visitor returns the node that should take its place, and
+# statements store that back into their own fields.
+#
+# Folding follows the interpreter's rules exactly. Anything that would be
+# a runtime error, like dividing by zero or negating a string, is left as
+# it is so the error is still raised when, and if, the code runs, against
+# the operator's own token. Only literal operands are ever dropped, so
+# every node the Resolver resolved keeps its identity.
+class ConstantFolder(ExprVisitor, StmtVisitor):
+    def __init__(self):
+        self.folded = 0
+
+    def fold_stmts(self, stmts: list[Stmt]):
+        for stmt in stmts:
+            self.fold_stmt(stmt)
+
+    def fold_stmt(self, stmt: Stmt):
+        stmt.accept(self)
+
+    def fold_expr(self, expr: Expr):
+        return expr.accept(self)
+
+    def literal(self, value, token):
+        # The folded Literal takes the operator's token as its own.
+        self.folded += 1
+        return Literal(value, token)
+
+    def visit_block_stmt(self, stmt: Block):
+        self.fold_stmts(stmt.statements)
+
+    def visit_break_stmt(self, stmt: Break):
+        pass
+
+    def visit_class_stmt(self, stmt: Class):
+        for method in stmt.methods:
+            self.fold_stmt(method)
+
+    def visit_const_stmt(self, stmt: Const):
+        stmt.initializer = self.fold_expr(stmt.initializer)
+
+    def visit_continue_stmt(self, stmt: Continue):
+        pass
+
+    def visit_echo_stmt(self, stmt: Echo):
+        stmt.expression = self.fold_expr(stmt.expression)
+
+    def visit_expression_stmt(self, stmt: Expression):
+        stmt.expression = self.fold_expr(stmt.expression)
+
+    def visit_for_stmt(self, stmt: For):
+        if stmt.initializer != None:
+            self.fold_stmt(stmt.initializer)
+
+        stmt.condition = self.fold_expr(stmt.condition)
+
+        # The parser also appended the increment to the body. It is folded
+        # there and the For keeps pointing at the result.
+        self.fold_stmt(stmt.body)
+
+        if stmt.increment != None:
+            stmt.increment = stmt.body.statements[-1].expression
+
+    def visit_function_stmt(self, stmt: Function):
+        self.fold_stmts(stmt.body)
+
+    def visit_if_stmt(self, stmt: If):
+        stmt.condition = self.fold_expr(stmt.condition)
+        self.fold_stmt(stmt.then_branch)
+
+        if stmt.else_branch != None:
+            self.fold_stmt(stmt.else_branch)
+
+    def visit_return_stmt(self, stmt: Return):
+        if stmt.value != None:
+            stmt.value = self.fold_expr(stmt.value)
+
+    def visit_var_stmt(self, stmt: Var):
+        if stmt.initializer != None:
+            stmt.initializer = self.fold_expr(stmt.initializer)
+
+    def visit_while_stmt(self, stmt: While):
+        stmt.condition = self.fold_expr(stmt.condition)
+        self.fold_stmt(stmt.body)
+
+    def visit_assign_expr(self, expr: Assign):
+        expr.value = self.fold_expr(expr.value)
+        return expr
+
+    def visit_binary_expr(self, expr: Binary):
+        expr.left = self.fold_expr(expr.left)
+        expr.right = self.fold_expr(expr.right)
+
+        if (expr.left.__class__ is not Literal or
+                expr.right.__class__ is not Literal):
+            return expr
+
+        value = self.binary(
+            expr.operator.type,
+            expr.left.value,
+            expr.right.value
+        )
+
+        if value is NO_FOLD:
+            return expr
+
+        return self.literal(value, expr.operator)
+
+    def visit_call_expr(self, expr: Call):
+        expr.callee = self.fold_expr(expr.callee)
+        expr.arguments = [
+            self.fold_expr(argument) for argument in expr.arguments
+        ]
+        return expr
+
+    def visit_conditional_expr(self, expr: Conditional):
+        expr.condition = self.fold_expr(expr.condition)
+        expr.then_branch = self.fold_expr(expr.then_branch)
+        expr.else_branch = self.fold_expr(expr.else_branch)
+
+        if expr.condition.__class__ is not Literal:
+            return expr
+
+        self.folded += 1
+        if is_truthy(expr.condition.value):
+            return expr.then_branch
+
+        return expr.else_branch
+
+    def visit_get_expr(self, expr: Get):
+        expr.obj = self.fold_expr(expr.obj)
+        return expr
+
+    def visit_grouping_expr(self, expr: Grouping):
+        expr.expression = self.fold_expr(expr.expression)
+
+        if expr.expression.__class__ is Literal:
+            self.folded += 1
+            return expr.expression
+
+        return expr
+
+    def visit_literal_expr(self, expr: Literal):
+        return expr
+
+    def visit_logical_expr(self, expr: Logical):
+        expr.left = self.fold_expr(expr.left)
+        expr.right = self.fold_expr(expr.right)
+
+        if expr.left.__class__ is not Literal:
+            return expr
+
+        # A literal left operand settles which side the expression yields.
+        self.folded += 1
+        truthy = is_truthy(expr.left.value)
+
+        if expr.operator.type == TokenType.OR:
+            return expr.left if truthy else expr.right
+
+        return expr.right if truthy else expr.left
+
+    def visit_self_expr(self, expr: Self):
+        return expr
+
+    def visit_set_expr(self, expr: Set):
+        expr.obj = self.fold_expr(expr.obj)
+        expr.value = self.fold_expr(expr.value)
+        return expr
+
+    def visit_super_expr(self, expr: Super):
+        return expr
+
+    def visit_unary_expr(self, expr: Unary):
+        expr.right = self.fold_expr(expr.right)
+
+        if expr.right.__class__ is not Literal:
+            return expr
+
+        right = expr.right.value
+
+        match expr.operator.type:
+            case TokenType.BANG:
+                return self.literal(not is_truthy(right), expr.operator)
+
+            case TokenType.MINUS:
+                if right.__class__ is float:
+                    return self.literal(-right, expr.operator)
+
+        return expr
+
+    def visit_variable_expr(self, expr: Variable):
+        return expr
+
+    def binary(self, operator, left, right):
+        if operator == TokenType.EQEQ:
+            return is_equal(left, right)
+
+        if operator == TokenType.BANGEQ:
+            return not is_equal(left, right)
+
+        if operator == TokenType.PLUS:
+            if left.__class__ is str and right.__class__ is str:
+                return left + right
+
+            if left.__class__ is str and right.__class__ is float:
+                return left + stringify(right)
+
+            if left.__class__ is float and right.__class__ is str:
+                return stringify(left) + right
+
+        if left.__class__ is not float or right.__class__ is not float:
+            return NO_FOLD
+
+        match operator:
+            case TokenType.PLUS:
+                return left + right
+
+            case TokenType.MINUS:
+                return left - right
+
+            case TokenType.STAR:
+                return left * right
+
+            case TokenType.SLASH:
+                if right != 0:
+                    return left / right
+
+            case TokenType.MODULUS:
+                if right != 0:
+                    return left % right
+
+            case TokenType.POWER:
+                # Overflowing or complex powers stay as they are and behave
+                # at runtime just like they always did.
+                try:
+                    value = left ** right
+                except ArithmeticError:
+                    return NO_FOLD
+
+                if value.__class__ is float:
+                    return value
+
+            case TokenType.GT:
+                return left > right
+
+            case TokenType.GTEQ:
+                return left >= right
+
+            case TokenType.LT:
+                return left < right
+
+            case TokenType.LTEQ:
+                return left <= right
+
+        return NO_FOLD
@@ -33,16 +33,25 @@ from src.ast.stmt import (
     While
 )
 from src.scanner.scanner import TokenType
+from src.scanner.token_buffer import TOKEN_TYPES
 from src.util.errors import ParseError
 
 
+# Parser
+#
+# 'tokens' is the scanner's TokenBuffer and 'current' the parser's cursor
+# into it. Tokens are checked and skipped by type alone. A Token is only
+# made for the ones the tree keeps or an error is reported at, through
+# peek(), previous() and consume().
 class Parser:
     def __init__(self, tokens, err_manager):
         self.tokens = tokens
+        self.types = tokens.types
         self.debug = False
         self.err_manager = err_manager
         self.current = 0
         self.loop_depth = 0
+        self.had_error = False
 
     def parse(self):
         if self.debug:
@@ -57,6 +66,16 @@ class Parser:
 
         return statements
 
+    def declarations(self):
+        # Parses one top-level declaration at a time, for streaming. The
+        # tokens each one used are dropped from the buffer before the next,
+        # all but the last, which previous() may still need.
+        while not self.is_at_end():
+            yield self.declaration()
+
+            self.tokens.discard(self.current - 1)
+            self.current = 1
+
     def declaration(self):
         if self.debug:
             print("DECLARATION", file=sys.stderr)
@@ -212,7 +231,10 @@ class Parser:
         condition = None
         if not self.check(TokenType.SEMICOLON):
             condition = self.expression()
-        self.consume(TokenType.SEMICOLON, "Expected ';' after 'for' condition.")
+        semicolon = self.consume(
+            TokenType.SEMICOLON,
+            "Expected ';' after 'for' condition."
+        )
 
         increment = None
         if not self.check(TokenType.RPAREN):
@@ -222,6 +244,7 @@ class Parser:
         try:
             self.loop_depth += 1
             body = self.statement()
+            end = self.previous()
 
             if increment != None and isinstance(body, Block):
                 body.statements.append(Expression(increment))
@@ -229,9 +252,9 @@ class Parser:
                 body = Block([body, Expression(increment)])
 
             if condition == None:
-                condition = Literal(True)
+                condition = Literal(True, semicolon)
 
-            return For(initializer, condition, increment, body)
+            return For(initializer, condition, increment, body, end)
         finally:
             self.loop_depth -= 1
 
@@ -325,7 +348,7 @@ class Parser:
             self.loop_depth += 1
 
             body = self.statement()
-            return While(condition, body)
+            return While(condition, body, self.previous())
         finally:
             self.loop_depth -= 1
 
@@ -526,16 +549,17 @@ class Parser:
             print("EXPR: PRIMARY", file=sys.stderr)
 
         if self.match(TokenType.FALSE):
-            return Literal(False)
+            return Literal(False, self.previous())
 
         if self.match(TokenType.TRUE):
-            return Literal(True)
+            return Literal(True, self.previous())
 
         if self.match(TokenType.NULL):
-            return Literal(None)
+            return Literal(None, self.previous())
 
         if self.match(TokenType.NUMBER, TokenType.STRING):
-            return Literal(self.previous().literal)
+            token = self.previous()
+            return Literal(token.literal, token)
 
         if self.match(TokenType.SUPER):
             keyword = self.previous()
@@ -584,43 +608,52 @@ class Parser:
 
     def consume(self, type_, message):
         if self.check(type_):
-            return self.advance()
+            self.advance()
+            return self.previous()
 
         raise self.error(self.peek(), message)
 
     def check(self, type_):
-        if self.is_at_end():
-            return False
-
-        return self.peek().type == type_
+        # Never true at the end, not even for EOF itself.
+        kind = TOKEN_TYPES[self.types[self.current]]
+        return kind is type_ and kind is not TokenType.EOF
 
     def advance(self):
         if not self.is_at_end():
             self.current += 1
 
-        return self.previous()
+            # Only a streaming buffer ever runs out before EOF.
+            if self.current == len(self.types):
+                self.tokens.more()
 
     def is_at_end(self):
-        return self.peek().type == TokenType.EOF
+        return TOKEN_TYPES[self.types[self.current]] is TokenType.EOF
 
     def peek(self):
         return self.tokens[self.current]
 
     def previous(self):
-        return self.tokens[self.current - 1]
+        # The first token stands in for the one before it.
+        return self.tokens[self.current - 1 if self.current > 0 else 0]
 
     def error(self, token, message):
-        self.err_manager.parse_error(token, message)
+        self.had_error = True
+
+        # A streaming scanner can fail part way through. Batch mode would
+        # never have parsed its tokens, so what follows isn't reported.
+        if not self.err_manager.had_scan_error:
+            self.err_manager.parse_error(token, message)
+
         return ParseError()
 
     def synchronize(self):
         self.advance()
 
         while not self.is_at_end():
-            if self.previous().type == TokenType.SEMICOLON:
+            if self.tokens.type(self.current - 1) == TokenType.SEMICOLON:
                 return
 
-            match self.peek().type:
+            match self.tokens.type(self.current):
                 case TokenType.BREAK:
                     return
                 case TokenType.CLASS:
@@ -5,6 +5,7 @@ from enum import Enum
 from src.ast.expr import (
     Expr,
     ExprVisitor,
+    expr_dispatch,
     Assign,
     Binary,
     Call,
@@ -22,6 +23,7 @@ from src.ast.expr import (
 from src.ast.stmt import (
     Stmt,
     StmtVisitor,
+    stmt_dispatch,
     Block,
     Break,
     Class,
@@ -58,24 +60,48 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.current_class = ClassType.NONE
         self.current_func = FunctionType.NONE
         self.scopes = []
+        self.expr_table = expr_dispatch(self)
+        self.stmt_table = stmt_dispatch(self)
+
+        # Purity analysis. 'functions' are those being resolved, each with
+        # the index of its own scope in 'scopes'.
+        self.functions = []
+        self.resolved_functions = []
+        self.global_functions = {}
+        self.global_consts = set()
+        self.global_writes = set()
+
+        # When streaming, the Resolver is handed one top-level declaration
+        # at a time and purity is settled after each, see settle_purity().
+        self.streaming = False
 
     def resolve_stmts(self, stmts: list[Stmt]):
         for stmt in stmts:
             self.resolve_stmt(stmt)
 
+        # Back at the top level the whole program has been seen, so calls
+        # between functions can be settled.
+        if not self.scopes:
+            self.settle_purity()
+
     def resolve_stmt(self, stmt: Stmt):
-        stmt.accept(self)
+        self.stmt_table[stmt.kind](stmt)
 
     def resolve_expr(self, expr: Expr):
-        expr.accept(self)
+        self.expr_table[expr.kind](expr)
 
     def begin_scope(self):
         self.scopes.append({})
 
-    def end_scope(self):
-        self.scopes.pop()
+    def end_scope(self, node=None):
+        scope = self.scopes.pop()
 
-    def declare(self, name):
+        # Blocks and functions tell the interpreter how many slots their
+        # environment needs. Class scopes always hold the same names.
+        if node != None:
+            self.interpreter.resolve_scope(node, len(scope))
+
+    def declare(self, name, node=None):
         if not self.scopes:
             return
 
@@ -88,45 +114,200 @@ class Resolver(ExprVisitor, StmtVisitor):
 
         scope[name.lexeme] = False
 
+        if node != None:
+            self.interpreter.resolve(node, 0, self.slot(scope, name.lexeme))
+
     def define(self, name):
         if not self.scopes:
             return
 
         self.scopes[-1][name.lexeme] = True
 
+    def slot(self, scope, lexeme):
+        # Scopes keep declaration order, which is also the slot order.
+        return list(scope.keys()).index(lexeme)
+
     def resolve_local(self, expr, name):
         for i in range(len(self.scopes) - 1, -1, -1):
             if name.lexeme in self.scopes[i]:
-                self.interpreter.resolve(expr, len(self.scopes) - 1 - i)
+                self.interpreter.resolve(
+                    expr,
+                    len(self.scopes) - 1 - i,
+                    self.slot(self.scopes[i], name.lexeme)
+                )
+                self.touch_local(i)
                 return
 
+        self.touch_global(expr, name)
+
     def resolve_function(self, function, function_type):
         enclosing_func = self.current_func
         self.current_func = function_type
 
+        # Methods work on 'self', so only plain functions can be pure.
+        function.pure = function_type == FunctionType.FUNCTION
+        function.calls = set()
+        self.resolved_functions.append(function)
+        self.functions.append((function, len(self.scopes)))
+
         self.begin_scope()
         for param in function.params:
             self.declare(param)
             self.define(param)
 
         self.resolve_stmts(function.body)
-        self.end_scope()
+        self.end_scope(function)
+        self.functions.pop()
         self.current_func = enclosing_func
 
+    # Purity
+    #
+    # A function is pure when its result depends on nothing but its
+    # arguments, so a call can be memoized. Anything it does with the
+    # outside world makes it impure:
+    #
+    #   - echo/print
+    #   - reading or setting a field, or using 'self' or 'super'
+    #   - touching a local of an enclosing function, since the function
+    #     may be called after that has changed, which also makes the
+    #     enclosing function impure, since it hands out that state
+    #   - declaring a function or class, which is a new one every call
+    #   - assigning to a global, or reading one that isn't a function or
+    #     a constant declared just once
+    #   - calling through a local variable, whose value isn't known here
+    #
+    # Everything a nested function does counts against the functions
+    # around it too. A global function it calls has to be pure as well,
+    # which settle_purity() works out once every function has been seen,
+    # or when streaming, once every function it calls has been.
+    def impure(self):
+        for function, _ in self.functions:
+            function.pure = False
+
+    def touch_local(self, index):
+        # A local captured from an enclosing function, rather than one of
+        # the innermost function's own.
+        if self.functions and index < self.functions[-1][1]:
+            self.impure()
+
+    def touch_global(self, expr, name):
+        if isinstance(expr, Assign):
+            self.global_writes.add(name.lexeme)
+            self.impure()
+            return
+
+        for function, _ in self.functions:
+            function.calls.add(name.lexeme)
+
+    def is_local(self, name):
+        for scope in self.scopes:
+            if name.lexeme in scope:
+                return True
+
+        return False
+
+    def declare_global(self, name, node=None):
+        if self.scopes:
+            return
+
+        lexeme = name.lexeme
+        if (lexeme in self.global_functions or
+                lexeme in self.global_consts):
+            self.global_writes.add(lexeme)
+
+        if isinstance(node, Function):
+            self.global_functions[lexeme] = node
+        elif isinstance(node, Const):
+            self.global_consts.add(lexeme)
+        else:
+            self.global_writes.add(lexeme)
+
+    def is_pure_global(self, lexeme):
+        if lexeme in self.global_writes:
+            return False
+
+        if lexeme in self.global_consts:
+            return True
+
+        function = self.global_functions.get(lexeme)
+        if function != None:
+            return function.pure
+
+        return self.streaming and self.is_undeclared(lexeme)
+
+    def is_undeclared(self, lexeme):
+        # Natives are globals too, defined before any code is resolved.
+        return (
+            lexeme not in self.global_writes and
+            lexeme not in self.global_consts and
+            lexeme not in self.global_functions and
+            lexeme not in self.interpreter.globals.indices
+        )
+
+    def settle_purity(self):
+        # Functions start out pure unless they did something impure
+        # themselves, and lose it when they read a global that isn't
+        # pure, until nothing changes. Mutually recursive functions that
+        # only call each other stay pure.
+        for function in self.resolved_functions:
+            if function.pure == None:
+                function.pure = True
+
+        changed = True
+        while changed:
+            changed = False
+
+            for function in self.resolved_functions:
+                if function.pure and not all(
+                        self.is_pure_global(lexeme)
+                        for lexeme in function.calls):
+                    function.pure = False
+                    changed = True
+
+        if not self.streaming:
+            self.resolved_functions = []
+            return
+
+        # While streaming, a global that hasn't been declared yet counts as
+        # pure, since a later declaration may make it so. Functions that
+        # call one, or call a function still waiting on one, are left
+        # with 'pure' as None, so nothing memoizes them yet, and are
+        # settled again after the next declaration.
+        pending = set()
+        changed = True
+        while changed:
+            changed = False
+
+            for function in self.resolved_functions:
+                if (function.pure and function not in pending and any(
+                        self.is_undeclared(lexeme) or
+                        self.global_functions.get(lexeme) in pending
+                        for lexeme in function.calls)):
+                    pending.add(function)
+                    changed = True
+
+        for function in pending:
+            function.pure = None
+
+        self.resolved_functions = list(pending)
+
     def visit_block_stmt(self, stmt: Block):
         self.begin_scope()
         self.resolve_stmts(stmt.statements)
-        self.end_scope()
+        self.end_scope(stmt)
 
     def visit_break_stmt(self, stmt: Break):
         pass
 
     def visit_class_stmt(self, stmt: Class):
+        self.impure()
+
         enclosing_class = self.current_class
         self.current_class = ClassType.CLASS
 
-        self.declare(stmt.name)
+        self.declare(stmt.name, stmt)
         self.define(stmt.name)
+        self.declare_global(stmt.name)
 
         if stmt.superclass != None:
             if stmt.name.lexeme == stmt.superclass.name.lexeme:
@@ -135,7 +316,8 @@ class Resolver(ExprVisitor, StmtVisitor):
                     "A class cannot inherit from itself."
                 )
 
-            self.resolve_stmt(stmt.superclass)
+            self.current_class = ClassType.SUBCLASS
+            self.resolve_expr(stmt.superclass)
 
             self.begin_scope()
             self.scopes[-1] |= {"super": True}
@@ -148,7 +330,7 @@ class Resolver(ExprVisitor, StmtVisitor):
             declaration = FunctionType.METHOD
 
             if method.name.lexeme == "init" or  \
-                method.name.lexeme == stmt.name:
+                method.name.lexeme == stmt.name.lexeme:
 
                 declaration = FunctionType.INITIALIZER
 
@@ -162,7 +344,8 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.current_class = enclosing_class
 
     def visit_const_stmt(self, stmt: Const):
-        self.declare(stmt.name)
+        self.declare(stmt.name, stmt)
+        self.declare_global(stmt.name, stmt)
         self.resolve_expr(stmt.initializer)
         self.define(stmt.name)
 
@@ -170,6 +353,7 @@ class Resolver(ExprVisitor, StmtVisitor):
         pass
 
     def visit_echo_stmt(self, stmt: Echo):
+        self.impure()
         self.resolve_expr(stmt.expression)
 
     def visit_expression_stmt(self, stmt: Expression):
@@ -177,7 +361,7 @@ class Resolver(ExprVisitor, StmtVisitor):
 
     def visit_for_stmt(self, stmt: For):
         if stmt.initializer != None:
-            self.resolve_expr(stmt.initializer)
+            self.resolve_stmt(stmt.initializer)
 
         self.resolve_expr(stmt.condition)
 
@@ -187,8 +371,10 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.resolve_stmt(stmt.body)
 
     def visit_function_stmt(self, stmt: Function):
-        self.declare(stmt.name)
+        self.impure()
+        self.declare(stmt.name, stmt)
         self.define(stmt.name)
+        self.declare_global(stmt.name, stmt)
 
         self.resolve_function(stmt, FunctionType.FUNCTION)
 
@@ -215,13 +401,21 @@ class Resolver(ExprVisitor, StmtVisitor):
 
             self.resolve_expr(stmt.value)
 
+            # 'return f(...)' leaves nothing to do once the call is made, so
+            # the interpreter can run it in place of the returning function.
+            if isinstance(stmt.value, Call) and (
+                    self.current_func == FunctionType.FUNCTION or
+                    self.current_func == FunctionType.METHOD):
+                stmt.tail_call = True
+
     def visit_var_stmt(self, stmt: Var):
-        self.declare(stmt.name)
+        self.declare(stmt.name, stmt)
+        self.declare_global(stmt.name)
         if stmt.initializer != None:
             self.resolve_expr(stmt.initializer)
         self.define(stmt.name)
 
-    def visit_while_stmt(Self, stmt: While):
+    def visit_while_stmt(self, stmt: While):
         self.resolve_expr(stmt.condition)
         self.resolve_stmt(stmt.body)
 
@@ -234,17 +428,22 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.resolve_expr(expr.right)
 
     def visit_call_expr(self, expr: Call):
+        if not isinstance(expr.callee, Variable) or \
+                self.is_local(expr.callee.name):
+            self.impure()
+
         self.resolve_expr(expr.callee)
 
         for argument in expr.arguments:
             self.resolve_expr(argument)
 
     def visit_conditional_expr(self, expr: Conditional):
-        self.resolve_expr(stmt.condition)
-        self.resolve_expr(stmt.then_branch)
-        self.resolve_expr(stmt.else_branch)
+        self.resolve_expr(expr.condition)
+        self.resolve_expr(expr.then_branch)
+        self.resolve_expr(expr.else_branch)
 
     def visit_get_expr(self, expr: Get):
+        self.impure()
         self.resolve_expr(expr.obj)
 
     def visit_grouping_expr(self, expr: Grouping):
@@ -267,6 +466,7 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.resolve_local(expr, expr.keyword)
 
     def visit_set_expr(self, expr: Set):
+        self.impure()
         self.resolve_expr(expr.value)
         self.resolve_expr(expr.obj)
 
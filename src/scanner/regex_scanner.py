@@ -0,0 +1,225 @@
+# Python Imports
+import re
+from bisect import bisect_right
+
+# Project Imports
+from src.scanner.scanner import Scanner
+from src.scanner.token import TokenType
+
+
+SYMBOLS = {
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    "?": TokenType.QUESTION,
+    ":": TokenType.COLON,
+    ";": TokenType.SEMICOLON,
+    "-": TokenType.MINUS,
+    "-=": TokenType.MINUSEQ,
+    "%": TokenType.MODULUS,
+    "%=": TokenType.MODEQ,
+    "+": TokenType.PLUS,
+    "+=": TokenType.PLUSEQ,
+    "*": TokenType.STAR,
+    "**": TokenType.POWER,
+    "*=": TokenType.STAREQ,
+    "/": TokenType.SLASH,
+    "/=": TokenType.SLASHEQ,
+    "&&": TokenType.AND,
+    "||": TokenType.OR,
+    "!": TokenType.BANG,
+    "!=": TokenType.BANGEQ,
+    "=": TokenType.EQ,
+    "==": TokenType.EQEQ,
+    ">": TokenType.GT,
+    ">=": TokenType.GTEQ,
+    "<": TokenType.LT,
+    "<=": TokenType.LTEQ,
+}
+
+# TokenType values by lexeme, which is what the TokenBuffer stores.
+SYMBOL_VALUES = {symbol: type_.value for symbol, type_ in SYMBOLS.items()}
+
+IDENTIFIER = TokenType.IDENTIFIER.value
+NUMBER = TokenType.NUMBER.value
+STRING = TokenType.STRING.value
+
+# Alternatives are tried in order, so comments come before '/' and every
+# two-character symbol before its one-character prefix. WORD is an
+# identifier starting with a non-ASCII letter, and OTHER takes any single
+# character nothing else did.
+PATTERN = "|".join([
+    r"(?P<SPACE>[ \r\t\n]+)",
+    r"(?P<IDENTIFIER>[A-Za-z_]\w*)",
+    r"(?P<NUMBER>\d+(?:\.\d+)?)",
+    r'(?P<STRING>"[^"]*"?)',
+    r"(?P<COMMENT>//[^\n]*)",
+    r"(?P<BLOCK>/\*[\s\S]*?(?:\*/|\Z))",
+    "(?P<SYMBOL>" + "|".join(
+        re.escape(symbol) for symbol in sorted(SYMBOLS, key=len, reverse=True)
+    ) + ")",
+    r"(?P<WORD>[^\W\d]\w*)",
+    r"(?P<OTHER>[\s\S])",
+])
+
+MASTER = re.compile(PATTERN)
+
+# The same for ASCII bytes, such as a memory-mapped source file. Only ASCII
+# sources are scanned as bytes, so WORD never matches there and OTHER is
+# always a whole character.
+BYTES_MASTER = re.compile(PATTERN.encode())
+BYTES_SYMBOL_VALUES = {
+    symbol.encode(): value for symbol, value in SYMBOL_VALUES.items()
+}
+
+
+# Regex Scanner
+#
+# Produces the same tokens and errors as the Scanner, but finds each token
+# with a single match of MASTER against the source rather than a character
+# at a time. Matches run back to back through the source and 'lastgroup'
+# names the kind of token found. The branches below are in the order
+# tokens turn up most often in a typical script.
+#
+# The TokenBuffer works out every token's line for itself, so lines are
+# only looked up here to report an error.
+#
+# The source can also be ASCII bytes, in which case tokens are matched with
+# BYTES_MASTER and the buffer's offsets are into the bytes.
+#
+# scan() is a generator that stops after every token it adds, so that the
+# whole source can be scanned in one go or a token at a time.
+class RegexScanner(Scanner):
+    scans_bytes = True
+
+    def __init__(self, source, err_manager):
+        super().__init__(source, err_manager)
+
+        # The scan() a streaming scanner is part way through.
+        self.scanning = None
+
+    def scan_tokens(self):
+        for _ in self.scan():
+            pass
+
+        return self.tokens
+
+    def scan_next(self):
+        if self.scanning == None:
+            self.scanning = self.scan()
+
+        next(self.scanning, None)
+
+    def scan(self):
+        source = self.source
+
+        if isinstance(source, str):
+            master = MASTER
+            symbols = SYMBOL_VALUES
+            quote, close = '"', "*/"
+            keywords = {
+                keyword: type_.value
+                for keyword, type_ in self.keywords.items()
+            }
+        else:
+            master = BYTES_MASTER
+            symbols = BYTES_SYMBOL_VALUES
+            quote, close = b'"', b"*/"
+            keywords = {
+                keyword.encode(): type_.value
+                for keyword, type_ in self.keywords.items()
+            }
+
+        add_type = self.tokens.types.append
+        add_start = self.tokens.starts.append
+        add_end = self.tokens.ends.append
+        pos = 0
+
+        while True:
+            for m in master.finditer(source, pos):
+                kind = m.lastgroup
+
+                if kind == "SPACE":
+                    continue
+
+                if kind == "IDENTIFIER":
+                    add_type(keywords.get(m.group(), IDENTIFIER))
+
+                elif kind == "SYMBOL":
+                    add_type(symbols[m.group()])
+
+                elif kind == "NUMBER":
+                    add_type(NUMBER)
+
+                elif kind == "STRING":
+                    text = m.group()
+
+                    if len(text) < 2 or not text.endswith(quote):
+                        self.err_manager.scan_error(
+                            self.line_at(m.end()),
+                            "\0",
+                            "Unterminated String."
+                        )
+                        continue
+
+                    add_type(STRING)
+
+                elif kind == "COMMENT":
+                    continue
+
+                elif kind == "BLOCK":
+                    text = m.group()
+
+                    if len(text) < 4 or not text.endswith(close):
+                        self.err_manager.scan_error(
+                            self.line_at(m.end()),
+                            "/",
+                            "Unterminated comment block."
+                        )
+                    continue
+
+                elif kind == "WORD":
+                    text = m.group()
+
+                    # A numeral like '½' is a word character but not a
+                    # letter. It is an error on its own, and scanning
+                    # starts over right after it.
+                    if not text[0].isalpha():
+                        self.err_manager.scan_error(
+                            self.line_at(m.start()),
+                            text[0],
+                            "Unexpected Character"
+                        )
+                        pos = m.start() + 1
+                        break
+
+                    add_type(keywords.get(text, IDENTIFIER))
+
+                else:
+                    char = m.group()
+                    if not isinstance(char, str):
+                        char = char.decode()
+
+                    self.err_manager.scan_error(
+                        self.line_at(m.start()),
+                        char,
+                        "Unexpected Character"
+                    )
+                    continue
+
+                add_start(m.start())
+                add_end(m.end())
+                yield
+            else:
+                break
+
+        self.start = self.current = len(source)
+        self.line = self.line_at(self.current)
+        self.tokens.add(TokenType.EOF, self.current, self.current)
+        yield
+
+    def line_at(self, position: int):
+        return bisect_right(self.tokens.line_starts, position)
@@ -1,11 +1,19 @@
-from src.scanner.token import Token, TokenType
+from src.scanner.token import TokenType
+from src.scanner.token_buffer import ByteTokenBuffer, TokenBuffer
 
 
 class Scanner:
+    # Whether the scanner can take its source as bytes as well as a string.
+    scans_bytes = False
+
     def __init__(self, source, err_manager):
         self.source = source
         self.err_manager = err_manager
-        self.tokens = []
+
+        if isinstance(source, str):
+            self.tokens = TokenBuffer(source)
+        else:
+            self.tokens = ByteTokenBuffer(source)
 
         self.start = 0
         self.current = 0
@@ -42,9 +50,38 @@ class Scanner:
             self.start = self.current
             self.scan_token()
 
-        self.tokens.append(Token(TokenType.EOF, "", None, self.line))
+        self.tokens.add(TokenType.EOF, self.current, self.current)
         return self.tokens
 
+    def stream_tokens(self):
+        # Hands back the buffer holding just the first token. The Parser
+        # scans the rest as it needs them, through the buffer's 'more'.
+        self.tokens.more = self.scan_next
+        self.scan_next()
+        return self.tokens
+
+    def scan_next(self):
+        # Scans until one more token, at least, is in the buffer.
+        count = len(self.tokens)
+
+        while len(self.tokens) == count:
+            if self.is_at_end():
+                self.tokens.add(TokenType.EOF, self.current, self.current)
+                return
+
+            self.start = self.current
+            self.scan_token()
+
+    def scan_rest(self):
+        # Scans what is left of a streaming source only for its errors,
+        # dropping the tokens as they come.
+        eof = TokenType.EOF.value
+        types = self.tokens.types
+
+        while not types or types[-1] != eof:
+            self.tokens.discard(len(types))
+            self.scan_next()
+
     def scan_token(self):
         c = self.advance()
 
@@ -220,10 +257,7 @@ class Scanner:
             while self.peek().isdigit():
                 self.advance()
 
-        self.add_token(
-            TokenType.NUMBER,
-            float(self.source[self.start: self.current])
-        )
+        self.add_token(TokenType.NUMBER)
 
     def string(self):
         while self.peek() != '"' and not self.is_at_end():
@@ -241,13 +275,11 @@ class Scanner:
             return
 
         self.advance()
+        self.add_token(TokenType.STRING)
 
-        value = self.source[self.start + 1: self.current - 1]
-        self.add_token(TokenType.STRING, value)
-
-    def add_token(self, type_, literal=None):
-        lexeme = self.source[self.start: self.current]
-        self.tokens.append(Token(type_, lexeme, literal, self.line))
+    def add_token(self, type_):
+        # The buffer works out the lexeme, literal and line when asked.
+        self.tokens.add(type_, self.start, self.current)
 
     def is_at_end(self):
         return self.current >= len(self.source)
@@ -79,6 +79,8 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ("type", "lexeme", "literal", "line")
+
     def __init__(self, type_, lexeme, literal, line):
         self.type = type_
         self.lexeme = lexeme
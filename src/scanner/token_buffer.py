@@ -0,0 +1,145 @@
+# Python Imports
+from array import array
+from bisect import bisect_right
+
+# Project Imports
+from src.scanner.token import Token, TokenType
+
+
+# Every TokenType at the index of its value, which is what the buffer
+# stores. The values start from 1, so index 0 is left empty.
+TOKEN_TYPES = [None] * (len(TokenType) + 1)
+for type_ in TokenType:
+    TOKEN_TYPES[type_.value] = type_
+
+
+# Token Buffer
+#
+# The scanners' output, kept as parallel columns rather than one Token per
+# token: 'types' holds each token's TokenType value and 'starts' and 'ends'
+# its offsets into the source. That is 9 bytes a token, where a Token with
+# its lexeme string takes well over a hundred.
+#
+# Everything else is worked out from the source when asked for. A lexeme is
+# sliced out of it, a literal parsed from the lexeme, and a line looked up
+# in 'line_starts', the offset every line begins at. A token's line is the
+# one its last character is on, as the scanners count lines, which for a
+# string spanning several is the line it ends on.
+#
+# Indexing the buffer makes a Token, so the Parser only ever makes the ones
+# it keeps in the tree or reports an error at.
+#
+# When streaming, the buffer starts out nearly empty and 'more' is the
+# scanner's scan_next(), which the Parser calls whenever it runs out of
+# tokens. Tokens the Parser is done with can be discarded from the front.
+class TokenBuffer:
+    __slots__ = ("source", "types", "starts", "ends", "line_starts", "more")
+
+    newline = "\n"
+
+    def __init__(self, source):
+        self.source = source
+        self.types = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.more = None
+
+        self.line_starts = array("I", [0])
+        position = source.find(self.newline)
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = source.find(self.newline, position + 1)
+
+    def add(self, type_: TokenType, start: int, end: int):
+        self.types.append(type_.value)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def discard(self, count: int):
+        # Drops the first 'count' tokens, so every index moves down by it.
+        del self.types[:count]
+        del self.starts[:count]
+        del self.ends[:count]
+
+    def type(self, index: int):
+        return TOKEN_TYPES[self.types[index]]
+
+    def lexeme(self, index: int):
+        return self.source[self.starts[index] : self.ends[index]]
+
+    def literal(self, index: int):
+        return self.literal_of(self.type(index), index)
+
+    def literal_of(self, type_: TokenType, index: int):
+        if type_ is TokenType.NUMBER:
+            return float(self.lexeme(index))
+
+        if type_ is TokenType.STRING:
+            return self.source[self.starts[index] + 1 : self.ends[index] - 1]
+
+        return None
+
+    def line(self, index: int):
+        # The EOF token is empty and sits past the last character.
+        position = max(self.starts[index], self.ends[index] - 1)
+        return bisect_right(self.line_starts, position)
+
+    def token(self, index: int):
+        type_ = TOKEN_TYPES[self.types[index]]
+        start = self.starts[index]
+        end = self.ends[index]
+
+        return Token(
+            type_,
+            self.source[start:end],
+            self.literal_of(type_, index),
+            bisect_right(self.line_starts, max(start, end - 1))
+        )
+
+    def __getitem__(self, index: int):
+        return self.token(index)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield self.token(index)
+
+
+# Byte Token Buffer
+#
+# A TokenBuffer over bytes rather than a string, such as a memory-mapped
+# file. The offsets are byte offsets, and a lexeme or string literal is
+# only decoded when it is asked for, so the source itself is never copied.
+class ByteTokenBuffer(TokenBuffer):
+    __slots__ = ()
+
+    newline = b"\n"
+
+    def lexeme(self, index: int):
+        return str(self.source[self.starts[index] : self.ends[index]], "utf-8")
+
+    def literal_of(self, type_: TokenType, index: int):
+        if type_ is TokenType.NUMBER:
+            return float(self.source[self.starts[index] : self.ends[index]])
+
+        if type_ is TokenType.STRING:
+            return str(
+                self.source[self.starts[index] + 1 : self.ends[index] - 1],
+                "utf-8"
+            )
+
+        return None
+
+    def token(self, index: int):
+        type_ = TOKEN_TYPES[self.types[index]]
+        start = self.starts[index]
+        end = self.ends[index]
+
+        return Token(
+            type_,
+            str(self.source[start:end], "utf-8"),
+            self.literal_of(type_, index),
+            bisect_right(self.line_starts, max(start, end - 1))
+        )
@@ -0,0 +1,291 @@
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    ExprVisitor,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Self,
+    Set,
+    Super,
+    Unary,
+    Variable
+)
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+
+
+class Binding:
+    def __init__(self, name, function, in_loop, is_const=False):
+        self.name = name
+        self.function = function
+        self.in_loop = in_loop
+        self.is_const = is_const
+        self.captured = False
+        self.defined = False
+
+    @property
+    def is_global(self):
+        return self.function == None
+
+    @property
+    def boxed(self):
+        # Python closures share one cell per function call, but every pass
+        # through a Lox loop body declares fresh variables. Captured locals
+        # declared inside a loop therefore live in a one-element list.
+        return self.captured and self.in_loop
+
+
+class FunctionInfo:
+    def __init__(self, parent):
+        self.parent = parent
+        self.loop_depth = 0
+        self.uses = set()
+        self.assigns = set()
+
+
+# Scope Analyzer
+#
+# First transpiler pass. Gives every Lox declaration a unique Python name
+# and records, per function, which outer bindings it reads and writes so
+# the emitter knows where 'global', 'nonlocal' and boxed captures go.
+class ScopeAnalyzer(ExprVisitor, StmtVisitor):
+    def __init__(self, globals_, counter):
+        self.globals = globals_
+        self.counter = counter
+        self.scopes = []
+        self.function = FunctionInfo(None)
+        self.main = self.function
+
+        self.declarations = {}
+        self.references = {}
+        self.functions = {}
+        self.continues = set()
+        self.checked = set()
+        self.loops = []
+
+    def analyze(self, statements: list[Stmt]):
+        for statement in statements:
+            self.analyze_stmt(statement)
+
+    def analyze_stmt(self, stmt: Stmt):
+        stmt.accept(self)
+
+    def analyze_expr(self, expr: Expr):
+        expr.accept(self)
+
+    def fresh(self, name):
+        self.counter[0] += 1
+        return f"{name}_{self.counter[0]}"
+
+    def declare(self, node, name, is_const=False):
+        if not self.scopes:
+            binding = self.globals.get(name)
+            if binding == None:
+                binding = Binding(f"{name}_g", None, False)
+                self.globals[name] = binding
+
+            binding.is_const = is_const
+            binding.defined = True
+            self.function.assigns.add(binding)
+        else:
+            binding = Binding(
+                self.fresh(name),
+                self.function,
+                self.function.loop_depth > 0,
+                is_const
+            )
+            self.scopes[-1][name] = binding
+
+        self.declarations[node] = binding
+        return binding
+
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                binding = scope[name]
+                if binding.function is not self.function:
+                    binding.captured = True
+
+                self.function.uses.add(binding)
+                return binding
+
+        binding = self.globals.get(name)
+        if binding == None:
+            binding = Binding(f"{name}_g", None, False)
+            self.globals[name] = binding
+
+        return binding
+
+    def function_body(self, node, params, body):
+        self.function = FunctionInfo(self.function)
+        self.functions[node] = self.function
+
+        self.scopes.append({})
+        for param in params:
+            self.declare(param, param.lexeme)
+
+        for statement in body:
+            self.analyze_stmt(statement)
+        self.scopes.pop()
+
+        info = self.function
+        self.function = info.parent
+
+        # Whatever an inner function touches outside itself, its parent has
+        # to be able to hand down.
+        for binding in info.uses:
+            if binding.function is not info:
+                self.function.uses.add(binding)
+
+    def loop_body(self, loop, body):
+        self.function.loop_depth += 1
+        self.loops.append(loop)
+        self.analyze_stmt(body)
+        self.loops.pop()
+        self.function.loop_depth -= 1
+
+    def visit_block_stmt(self, stmt: Block):
+        self.scopes.append({})
+        for statement in stmt.statements:
+            self.analyze_stmt(statement)
+        self.scopes.pop()
+
+    def visit_break_stmt(self, stmt: Break):
+        pass
+
+    def visit_class_stmt(self, stmt: Class):
+        self.declare(stmt, stmt.name.lexeme)
+
+        if stmt.superclass != None:
+            self.analyze_expr(stmt.superclass)
+            self.scopes.append({})
+            self.declare(stmt.superclass, "super")
+
+        for method in stmt.methods:
+            self.function_body(method, method.params, method.body)
+
+        if stmt.superclass != None:
+            self.scopes.pop()
+
+    def visit_const_stmt(self, stmt: Const):
+        self.analyze_expr(stmt.initializer)
+        self.declare(stmt, stmt.name.lexeme, True)
+
+    def visit_continue_stmt(self, stmt: Continue):
+        if self.loops:
+            self.continues.add(self.loops[-1])
+
+    def visit_echo_stmt(self, stmt: Echo):
+        self.analyze_expr(stmt.expression)
+
+    def visit_expression_stmt(self, stmt: Expression):
+        self.analyze_expr(stmt.expression)
+
+    def visit_for_stmt(self, stmt: For):
+        if stmt.initializer != None:
+            self.analyze_stmt(stmt.initializer)
+
+        self.analyze_expr(stmt.condition)
+        self.loop_body(stmt, stmt.body)
+
+    def visit_function_stmt(self, stmt: Function):
+        self.declare(stmt, stmt.name.lexeme)
+        self.function_body(stmt, stmt.params, stmt.body)
+
+    def visit_if_stmt(self, stmt: If):
+        self.analyze_expr(stmt.condition)
+        self.analyze_stmt(stmt.then_branch)
+
+        if stmt.else_branch != None:
+            self.analyze_stmt(stmt.else_branch)
+
+    def visit_return_stmt(self, stmt: Return):
+        if stmt.value != None:
+            self.analyze_expr(stmt.value)
+
+    def visit_var_stmt(self, stmt: Var):
+        if stmt.initializer != None:
+            self.analyze_expr(stmt.initializer)
+
+        self.declare(stmt, stmt.name.lexeme)
+
+    def visit_while_stmt(self, stmt: While):
+        self.analyze_expr(stmt.condition)
+        self.loop_body(stmt, stmt.body)
+
+    def visit_assign_expr(self, expr: Assign):
+        self.analyze_expr(expr.value)
+
+        binding = self.lookup(expr.name.lexeme)
+        self.references[expr] = binding
+        self.function.assigns.add(binding)
+
+        # A global nobody has declared yet might still be undefined when
+        # this runs, so the store has to read it first.
+        if binding.is_global and not binding.defined:
+            self.checked.add(expr)
+
+    def visit_binary_expr(self, expr: Binary):
+        self.analyze_expr(expr.left)
+        self.analyze_expr(expr.right)
+
+    def visit_call_expr(self, expr: Call):
+        self.analyze_expr(expr.callee)
+
+        for argument in expr.arguments:
+            self.analyze_expr(argument)
+
+    def visit_conditional_expr(self, expr: Conditional):
+        self.analyze_expr(expr.condition)
+        self.analyze_expr(expr.then_branch)
+        self.analyze_expr(expr.else_branch)
+
+    def visit_get_expr(self, expr: Get):
+        self.analyze_expr(expr.obj)
+
+    def visit_grouping_expr(self, expr: Grouping):
+        self.analyze_expr(expr.expression)
+
+    def visit_literal_expr(self, expr: Literal):
+        pass
+
+    def visit_logical_expr(self, expr: Logical):
+        self.analyze_expr(expr.left)
+        self.analyze_expr(expr.right)
+
+    def visit_self_expr(self, expr: Self):
+        pass
+
+    def visit_set_expr(self, expr: Set):
+        self.analyze_expr(expr.obj)
+        self.analyze_expr(expr.value)
+
+    def visit_super_expr(self, expr: Super):
+        self.references[expr] = self.lookup("super")
+
+    def visit_unary_expr(self, expr: Unary):
+        self.analyze_expr(expr.right)
+
+    def visit_variable_expr(self, expr: Variable):
+        self.references[expr] = self.lookup(expr.name.lexeme)
@@ -0,0 +1,145 @@
+# Python Imports
+import sys
+from types import FunctionType, MethodType
+
+# Project Imports
+from src.ast.stmt import Stmt
+from src.callable.natives import define_natives
+from src.interpreter.environment import GlobalEnvironment
+from src.scanner.token import Token, TokenType
+from src.transpiler import runtime
+from src.transpiler.analyzer import Binding, ScopeAnalyzer
+from src.transpiler.transpiler import Transpiler
+from src.util.errors import LoxRuntimeError
+from src.util.mode import RunMode
+
+
+# Python Backend
+#
+# Transpiles each resolved program to Python source, hands it to compile()
+# and runs it with exec(). Globals live in one namespace that survives
+# between REPL lines, next to the runtime helpers and the tokens the
+# generated code reports its errors against.
+class PythonBackend:
+    def __init__(self, err_manager, mode):
+        self.err_manager = err_manager
+        self.mode = mode
+        self.dump = False
+
+        self.globals = GlobalEnvironment()
+        self.bindings = {}
+        self.counter = [0]
+        self.sources = {}
+
+        self.namespace = {
+            "_lox_add": runtime.add,
+            "_lox_augment_divisor": runtime.augment_divisor,
+            "_lox_augment_operand": runtime.augment_operand,
+            "_lox_augment_target": runtime.augment_target,
+            "_lox_callable": runtime.make_callable(self),
+            "_lox_class": runtime.make_class,
+            "_lox_divide": runtime.divide,
+            "_lox_function": FunctionType,
+            "_lox_meta": runtime.LoxPyClass,
+            "_lox_method": MethodType,
+            "_lox_no_fields": runtime.no_fields,
+            "_lox_not_instance": runtime.not_instance,
+            "_lox_number": runtime.number,
+            "_lox_numbers": runtime.numbers,
+            "_lox_reassign": runtime.reassign,
+            "_lox_store": runtime.store,
+            "_lox_str": runtime.stringify,
+            "_lox_super": runtime.super_method,
+        }
+
+        # Native Functions
+        define_natives(self)
+
+        for name, slot in self.globals.indices.items():
+            value = self.globals.slots[slot]
+            binding = Binding(f"{name}_g", None, False, True)
+            binding.defined = True
+            self.bindings[name] = binding
+            self.namespace[binding.name] = value
+
+    def resolve(self, expr, depth, slot):
+        # Scoping is redone by the ScopeAnalyzer, which needs every
+        # declaration and not just the resolved uses.
+        pass
+
+    def resolve_scope(self, node, size):
+        pass
+
+    def release(self, node):
+        pass
+
+    def interpret(self, statements: list[Stmt]):
+        analyzer = ScopeAnalyzer(self.bindings, self.counter)
+        analyzer.analyze(statements)
+
+        transpiler = Transpiler(
+            analyzer,
+            self.namespace,
+            self.err_manager,
+            self.mode == RunMode.REPL
+        )
+        source = transpiler.transpile(statements)
+
+        if self.err_manager.had_error:
+            return
+
+        if self.dump:
+            print(source, file=sys.stderr)
+
+        file_name = f"<lox-{len(self.sources)}>"
+        self.sources[file_name] = transpiler.line_map
+        exec(compile(source, file_name, "exec"), self.namespace)
+
+        try:
+            self.namespace["_lox_main"]()
+        except LoxRuntimeError as e:
+            self.err_manager.runtime_error(e)
+        except NameError as e:
+            name = e.name[:-2]
+            self.err_manager.runtime_error(self.translate(
+                e,
+                Token(TokenType.IDENTIFIER, name, None, 0),
+                f"Undefined Variable '{name}'."
+            ))
+        except AttributeError as e:
+            name = runtime.unmangle(e.name)
+            self.err_manager.runtime_error(self.translate(
+                e,
+                Token(TokenType.IDENTIFIER, name, None, 0),
+                f"Undefined Property '{name}'."
+            ))
+        except RecursionError as e:
+            self.err_manager.runtime_error(self.translate(
+                e,
+                Token(TokenType.RPAREN, ")", None, 0),
+                "Stack overflow.",
+                True
+            ))
+
+    def translate(self, error, token, message, anywhere=False):
+        # Generated code lets Python raise for undefined globals and
+        # properties. The failing generated line maps back to the Lox line
+        # the other engines would have reported. Unless 'anywhere' is set,
+        # the error must come from generated code itself, anything else is
+        # a bug and is raised as it is.
+        line = None
+        traceback = error.__traceback__
+        while traceback != None:
+            line_map = self.sources.get(traceback.tb_frame.f_code.co_filename)
+            if line_map != None:
+                line = line_map[traceback.tb_lineno - 1]
+            elif not anywhere:
+                line = None
+
+            traceback = traceback.tb_next
+
+        if line == None:
+            raise error
+
+        token.line = line
+        return LoxRuntimeError(token, message)
@@ -0,0 +1,223 @@
+# Python Imports
+from types import FunctionType, MethodType
+
+# Project Imports
+from src.callable.lox_callable import LoxCallable
+from src.util.errors import LoxRuntimeError
+
+
+# Transpiled Runtime
+#
+# Lox classes become real Python classes built on LoxPyClass, instances
+# keep their fields in the ordinary instance __dict__ and methods sit in
+# the class dict. Every Lox property is stored under a '_p' suffix so no
+# field or method can ever shadow a Python dunder or one of the 'lox_'
+# attributes below.
+class LoxPyClass(type):
+    def __str__(cls):
+        return f"<Class : {cls.lox_name}>"
+
+
+class LoxPyInstance(metaclass=LoxPyClass):
+    lox_name = None
+
+    def __str__(self):
+        return f"<Instance of : {self.__class__.lox_name}>"
+
+
+def mangle(name):
+    return f"{name}_p"
+
+
+def unmangle(name):
+    return name[:-2]
+
+
+def find_method(klass, key):
+    for base in klass.__mro__:
+        method = base.__dict__.get(key)
+        if method is not None:
+            return method
+
+    return None
+
+
+def fail(token, message):
+    def raise_(*arguments):
+        raise LoxRuntimeError(token, message)
+
+    return raise_
+
+
+def make_class(name, superclass, methods, token):
+    if superclass is None:
+        superclass = LoxPyInstance
+    elif superclass.__class__ is not LoxPyClass:
+        raise LoxRuntimeError(token, "Superclass must be a class.")
+
+    klass = LoxPyClass(name, (superclass,), methods)
+    klass.lox_name = name
+
+    initializer = find_method(klass, mangle("init"))
+    if initializer is None:
+        initializer = find_method(klass, mangle(name))
+
+    new = object.__new__
+
+    if initializer is None:
+        klass.lox_arity = 0
+
+        def construct():
+            return new(klass)
+    else:
+        klass.lox_arity = initializer.__code__.co_argcount - 1
+
+        def construct(*arguments):
+            instance = new(klass)
+            initializer(instance, *arguments)
+            return instance
+
+    klass.lox_construct = construct
+    return klass
+
+
+def make_callable(interpreter):
+    # Slow path of every transpiled call. Returns the Python callable the
+    # call site should invoke with its arguments, or one that raises the
+    # Lox error once those arguments have been evaluated.
+    def callable_(callee, token, count):
+        kind = callee.__class__
+
+        if kind is FunctionType:
+            arity = callee.__code__.co_argcount
+        elif kind is MethodType:
+            arity = callee.__func__.__code__.co_argcount - 1
+        elif kind is LoxPyClass:
+            arity = callee.lox_arity
+            callee = callee.lox_construct
+        elif isinstance(callee, LoxCallable):
+            arity = callee.arity()
+            native = callee
+
+            def callee(*arguments):
+                return native.call(interpreter, list(arguments))
+        else:
+            return fail(
+                token,
+                "Only classes, functions or methods can be called."
+            )
+
+        if count != arity:
+            return fail(
+                token,
+                f"Expected {arity} arguments " +
+                f"but got {count} instead."
+            )
+
+        return callee
+
+    return callable_
+
+
+def super_method(superclass, instance, key, token):
+    method = find_method(superclass, key)
+
+    if method is None:
+        raise LoxRuntimeError(
+            token,
+            f"Undefined Property '{unmangle(key)}'."
+        )
+
+    return MethodType(method, instance)
+
+
+def add(left, right, token):
+    if left.__class__ is str:
+        if right.__class__ is str:
+            return left + right
+
+        if right.__class__ is float:
+            return left + stringify(right)
+
+    elif left.__class__ is float and right.__class__ is str:
+        return stringify(left) + right
+
+    raise LoxRuntimeError(
+        token,
+        "Operands must be numbers or strings. Combining the two is allowed."
+    )
+
+
+def divide(left, right, token):
+    numbers(left, right, token)
+    raise LoxRuntimeError(token, "Cannot divide by Zero.")
+
+
+def numbers(left, right, token):
+    if left.__class__ is not float or right.__class__ is not float:
+        raise LoxRuntimeError(token, "Operands must be numbers.")
+
+
+def number(token):
+    raise LoxRuntimeError(token, "Operand must be a number.")
+
+
+def augment_operand(value, token):
+    if value.__class__ is not float:
+        augment_target(token)
+
+    return value
+
+
+def augment_divisor(value, token):
+    augment_operand(value, token)
+    if value == 0:
+        raise LoxRuntimeError(token, "Cannot divide by Zero.")
+
+    return value
+
+
+def augment_target(token):
+    raise LoxRuntimeError(
+        token,
+        "Cannot use augmented assignment on non-number values."
+    )
+
+
+def not_instance(token):
+    raise LoxRuntimeError(token, "Only instances of an object have properties.")
+
+
+def no_fields(token):
+    raise LoxRuntimeError(token, "Only instances of an object have fields.")
+
+
+def reassign(value, token):
+    raise LoxRuntimeError(token, "Cannot reassign a constant.")
+
+
+def store(box, value):
+    box[0] = value
+    return value
+
+
+def stringify(obj):
+    if obj is None:
+        return "null"
+
+    kind = obj.__class__
+
+    if kind is float:
+        text = str(obj)
+        if text.endswith(".0"):
+            text = text[0 : len(text) - 2]
+
+        return text
+
+    if kind is FunctionType:
+        return f"<User Fn - {obj.__name__.rsplit('_', 1)[0]}>"
+
+    if kind is MethodType:
+        return f"<User Fn - {obj.__func__.__name__.rsplit('_', 1)[0]}>"
+
+    return str(obj)
@@ -0,0 +1,710 @@
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    ExprVisitor,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Self,
+    Set,
+    Super,
+    Unary,
+    Variable
+)
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.scanner.token import TokenType
+from src.transpiler.runtime import mangle
+
+
+ARITHMETIC = {
+    TokenType.MINUS: "-",
+    TokenType.STAR: "*",
+    TokenType.POWER: "**",
+    TokenType.GT: ">",
+    TokenType.GTEQ: ">=",
+    TokenType.LT: "<",
+    TokenType.LTEQ: "<=",
+}
+
+AUGMENTED = {
+    TokenType.MINUSEQ: "-",
+    TokenType.MODEQ: "%",
+    TokenType.PLUSEQ: "+",
+    TokenType.SLASHEQ: "/",
+    TokenType.STAREQ: "*",
+}
+
+# Expressions that always evaluate to a Python bool, so they can be used
+# as a condition as they are.
+COMPARISONS = {
+    TokenType.GT,
+    TokenType.GTEQ,
+    TokenType.LT,
+    TokenType.LTEQ,
+    TokenType.BANGEQ,
+    TokenType.EQEQ,
+}
+
+
+# Transpiler
+#
+# Second transpiler pass. Emits Python source for a resolved program using
+# the names the ScopeAnalyzer picked. Statements are written out as lines,
+# expressions come back as strings. Every operation Lox checks at runtime
+# gets an inline guard for the common case and falls back to a helper
+# from the runtime module that performs the coercion or raises the error.
+class Transpiler(ExprVisitor, StmtVisitor):
+    def __init__(self, analyzer, namespace, err_manager, echo_expressions):
+        self.analyzer = analyzer
+        self.namespace = namespace
+        self.err_manager = err_manager
+        self.echo_expressions = echo_expressions
+
+        self.lines = []
+        self.line_map = []
+        self.line = 0
+        self.depth = 0
+
+        self.function = analyzer.main
+        self.is_init = False
+        self.loop_depth = 0
+
+    def transpile(self, statements: list[Stmt]):
+        self.emit("def _lox_main():")
+        self.depth += 1
+        self.declarations(self.function)
+
+        start = len(self.lines)
+        for statement in statements:
+            self.transpile_stmt(statement, True)
+
+        if len(self.lines) == start:
+            self.emit("pass")
+        self.depth -= 1
+
+        return "\n".join(self.lines) + "\n"
+
+    def transpile_stmt(self, stmt: Stmt, top_level=False):
+        if top_level and self.echo_expressions and isinstance(stmt, Expression):
+            if not isinstance(stmt.expression, Assign):
+                value = self.transpile_expr(stmt.expression)
+                self.emit(f"print(_lox_str({value}))")
+                return
+
+        stmt.accept(self)
+
+    def transpile_expr(self, expr: Expr):
+        return expr.accept(self)
+
+    def transpile_body(self, statements):
+        self.depth += 1
+
+        start = len(self.lines)
+        for statement in statements:
+            self.transpile_stmt(statement)
+
+        if len(self.lines) == start:
+            self.emit("pass")
+        self.depth -= 1
+
+    def emit(self, line):
+        self.lines.append("    " * self.depth + line)
+        self.line_map.append(self.line)
+
+    def token(self, token):
+        name = f"_lox_t{len(self.namespace)}"
+        self.namespace[name] = token
+        self.line = token.line
+        return name
+
+    def temp(self):
+        self.analyzer.counter[0] += 1
+        return f"_t{self.analyzer.counter[0]}"
+
+    def declarations(self, info):
+        globals_ = sorted(
+            binding.name for binding in info.assigns if binding.is_global
+        )
+        if globals_:
+            self.emit(f"global {', '.join(globals_)}")
+
+        nonlocals = sorted(
+            binding.name for binding in info.assigns
+            if not binding.is_global
+            and binding.function is not info
+            and not binding.boxed
+        )
+        if nonlocals:
+            self.emit(f"nonlocal {', '.join(nonlocals)}")
+
+    def read(self, binding):
+        if binding.boxed:
+            return f"{binding.name}[0]"
+
+        return binding.name
+
+    def define(self, binding, value):
+        if binding.boxed:
+            self.emit(f"{binding.name} = [{value}]")
+        else:
+            self.emit(f"{binding.name} = {value}")
+
+    def test(self, expr: Expr):
+        # Python truthiness of the returned code matches Lox truthiness of
+        # the expression. Used wherever only the outcome of a test matters.
+        if isinstance(expr, Grouping):
+            return self.test(expr.expression)
+
+        if isinstance(expr, Literal):
+            if expr.value is None or expr.value is False:
+                return "False"
+
+            return "True"
+
+        if self.is_bool(expr):
+            return self.transpile_expr(expr)
+
+        if isinstance(expr, Logical):
+            keyword = "or" if expr.operator.type == TokenType.OR else "and"
+            return f"({self.test(expr.left)} {keyword} {self.test(expr.right)})"
+
+        value = self.transpile_expr(expr)
+        temp = self.temp()
+        return f"(({temp} := {value}) is not None and {temp} is not False)"
+
+    def is_bool(self, expr: Expr):
+        if isinstance(expr, Grouping):
+            return self.is_bool(expr.expression)
+
+        if isinstance(expr, Binary):
+            return expr.operator.type in COMPARISONS
+
+        if isinstance(expr, Unary):
+            return expr.operator.type == TokenType.BANG
+
+        return isinstance(expr, Literal) and isinstance(expr.value, bool)
+
+    def is_number(self, expr: Expr):
+        return isinstance(expr, Literal) and isinstance(expr.value, float)
+
+    def operand(self, expr, code, checks):
+        if expr != None and self.is_number(expr):
+            return code
+
+        temp = self.temp()
+        checks.append(f"(({temp} := {code}).__class__ is float)")
+        return temp
+
+    def arithmetic(self, type_, left_expr, left, right_expr, right, operator):
+        if (type_ == TokenType.PLUS and
+                (self.is_string(left_expr) or self.is_string(right_expr))):
+            return f"_lox_add({left}, {right}, {self.token(operator)})"
+
+        checks = []
+        left = self.operand(left_expr, left, checks)
+        right = self.operand(right_expr, right, checks)
+        condition = " & ".join(checks)
+
+        match type_:
+            case TokenType.PLUS:
+                result = f"{left} + {right}"
+                fallback = f"_lox_add({left}, {right}, {self.token(operator)})"
+
+            case TokenType.SLASH | TokenType.MODULUS:
+                symbol = "/" if type_ == TokenType.SLASH else "%"
+                result = f"{left} {symbol} {right}"
+                fallback = f"_lox_divide({left}, {right}, {self.token(operator)})"
+
+                if not (self.is_number(right_expr) and right_expr.value != 0):
+                    condition = " and ".join(filter(None, [condition, right]))
+
+            case _:
+                result = f"{left} {ARITHMETIC[type_]} {right}"
+                fallback = f"_lox_numbers({left}, {right}, {self.token(operator)})"
+
+        if not condition:
+            return f"({result})"
+
+        return f"({result} if {condition} else {fallback})"
+
+    def augment(self, binding, expr: Assign, value, symbol):
+        # Code for the new value of an augmented assignment and for the
+        # right-hand side the expression evaluates to. As in the
+        # tree-walker, the right-hand side is checked before the target is
+        # read and both have to be numbers.
+        token = self.token(expr.operator)
+        divides = symbol == "/" or symbol == "%"
+
+        right = value
+        check = None
+        if not self.is_number(expr.value) or (divides and expr.value.value == 0):
+            right = self.temp()
+            helper = "_lox_augment_divisor" if divides else "_lox_augment_operand"
+            check = f"({right} := {helper}({value}, {token}))"
+
+        current = self.temp()
+        result = (
+            f"({current} {symbol} {right} "
+            f"if ({current} := {self.read(binding)}).__class__ is float "
+            f"else _lox_augment_target({token}))"
+        )
+
+        if check != None:
+            result = f"({check}, {result})[1]"
+
+        return result, right
+
+    def is_string(self, expr):
+        return isinstance(expr, Literal) and isinstance(expr.value, str)
+
+    def instance(self, expr: Expr, error, name):
+        # Code evaluating to the receiver of a property access, and the
+        # guard that makes sure it is an instance. 'this' needs no guard.
+        if isinstance(expr, Self):
+            return "this", None
+
+        temp = self.temp()
+        obj = self.transpile_expr(expr)
+        return temp, (
+            f"({temp} := {obj}).__class__.__class__ is _lox_meta",
+            f"{error}({self.token(name)})"
+        )
+
+    def emit_function(self, node, name, params, body, is_method, is_init):
+        info = self.analyzer.functions[node]
+        declarations = self.analyzer.declarations
+
+        parameters = ["this"] if is_method else []
+        parameters += [declarations[param].name for param in params]
+
+        # Variables captured from a loop body are passed in as defaults, so
+        # every iteration's closure keeps its own box.
+        boxes = sorted(
+            binding.name for binding in info.uses
+            if binding.boxed and binding.function is not info
+        )
+        if boxes:
+            parameters.append("*")
+            parameters += [f"{box}={box}" for box in boxes]
+
+        self.line = node.name.line
+        self.emit(f"def {name}({', '.join(parameters)}):")
+
+        enclosing = (self.function, self.is_init, self.loop_depth)
+        self.function = info
+        self.is_init = is_init
+        self.loop_depth = 0
+
+        self.depth += 1
+        self.declarations(info)
+
+        for param in params:
+            binding = declarations[param]
+            if binding.boxed:
+                self.emit(f"{binding.name} = [{binding.name}]")
+        self.depth -= 1
+
+        self.transpile_body(body)
+
+        if is_init:
+            self.depth += 1
+            self.emit("return this")
+            self.depth -= 1
+
+        self.function, self.is_init, self.loop_depth = enclosing
+
+    def loop_body(self, statements):
+        self.loop_depth += 1
+        self.transpile_body(statements)
+        self.loop_depth -= 1
+
+    def statements(self, stmt: Stmt):
+        if isinstance(stmt, Block):
+            return stmt.statements
+
+        return [stmt]
+
+    def visit_block_stmt(self, stmt: Block):
+        for statement in stmt.statements:
+            self.transpile_stmt(statement)
+
+    def visit_break_stmt(self, stmt: Break):
+        if self.loop_depth == 0:
+            self.err_manager.compile_error(
+                stmt.keyword,
+                "Cannot use 'break' outside of a loop."
+            )
+
+        self.emit("break")
+
+    def visit_class_stmt(self, stmt: Class):
+        binding = self.analyzer.declarations[stmt]
+        self.line = stmt.name.line
+
+        superclass = "None"
+        token = "None"
+        if stmt.superclass != None:
+            value = self.transpile_expr(stmt.superclass)
+            token = self.token(stmt.superclass.name)
+
+            super_ = self.analyzer.declarations[stmt.superclass]
+            self.define(super_, value)
+            superclass = self.read(super_)
+
+        if binding.boxed:
+            self.emit(f"{binding.name} = [None]")
+
+        methods = []
+        for method in stmt.methods:
+            name = self.analyzer.fresh(method.name.lexeme)
+            is_init = (
+                method.name.lexeme == "init" or
+                method.name.lexeme == stmt.name.lexeme
+            )
+            self.emit_function(method, name, method.params, method.body, True, is_init)
+            methods.append(f"{mangle(method.name.lexeme)!r}: {name}")
+
+        value = (
+            f"_lox_class({stmt.name.lexeme!r}, {superclass}, " +
+            f"{{{', '.join(methods)}}}, {token})"
+        )
+
+        if binding.boxed:
+            self.emit(f"{binding.name}[0] = {value}")
+        else:
+            self.emit(f"{binding.name} = {value}")
+
+    def visit_const_stmt(self, stmt: Const):
+        value = self.transpile_expr(stmt.initializer)
+        self.line = stmt.name.line
+        self.define(self.analyzer.declarations[stmt], value)
+
+    def visit_continue_stmt(self, stmt: Continue):
+        if self.loop_depth == 0:
+            self.err_manager.compile_error(
+                stmt.keyword,
+                "Cannot use 'continue' outside of a loop."
+            )
+
+        self.emit("continue")
+
+    def visit_echo_stmt(self, stmt: Echo):
+        if self.is_string(stmt.expression):
+            self.emit(f"print({stmt.expression.value!r})")
+            return
+
+        value = self.transpile_expr(stmt.expression)
+        self.emit(f"print(_lox_str({value}))")
+
+    def visit_expression_stmt(self, stmt: Expression):
+        expr = stmt.expression
+
+        if isinstance(expr, Assign):
+            self.assign(expr, True)
+        elif isinstance(expr, Set):
+            self.set_(expr, True)
+        else:
+            self.emit(self.transpile_expr(expr))
+
+    def visit_for_stmt(self, stmt: For):
+        if stmt.initializer != None:
+            self.transpile_stmt(stmt.initializer)
+
+        body = self.statements(stmt.body)
+        condition = self.test(stmt.condition)
+
+        if stmt.increment == None or stmt not in self.analyzer.continues:
+            self.emit(f"while {condition}:")
+            self.loop_body(body)
+            return
+
+        # A 'continue' has to land on the increment the parser appended to
+        # the body, so the increment moves to the top of the next pass.
+        started = self.temp()
+        self.emit(f"{started} = False")
+        self.emit("while True:")
+        self.depth += 1
+        self.emit(f"if {started}:")
+        self.transpile_body(body[-1:])
+        self.emit(f"{started} = True")
+        if condition != "True":
+            self.emit(f"if not {condition}:")
+            self.depth += 1
+            self.emit("break")
+            self.depth -= 1
+        self.depth -= 1
+        self.loop_body(body[:-1])
+
+    def visit_function_stmt(self, stmt: Function):
+        binding = self.analyzer.declarations[stmt]
+
+        if not binding.boxed:
+            self.emit_function(stmt, binding.name, stmt.params, stmt.body, False, False)
+            return
+
+        name = self.analyzer.fresh(stmt.name.lexeme)
+        self.emit(f"{binding.name} = [None]")
+        self.emit_function(stmt, name, stmt.params, stmt.body, False, False)
+        self.emit(f"{binding.name}[0] = {name}")
+
+    def visit_if_stmt(self, stmt: If):
+        keyword = "if"
+
+        while True:
+            self.emit(f"{keyword} {self.test(stmt.condition)}:")
+            self.transpile_body(self.statements(stmt.then_branch))
+
+            if stmt.else_branch == None:
+                return
+
+            if not isinstance(stmt.else_branch, If):
+                break
+
+            keyword = "elif"
+            stmt = stmt.else_branch
+
+        self.emit("else:")
+        self.transpile_body(self.statements(stmt.else_branch))
+
+    def visit_return_stmt(self, stmt: Return):
+        self.line = stmt.keyword.line
+
+        if self.is_init:
+            if stmt.value != None:
+                self.emit(self.transpile_expr(stmt.value))
+
+            self.emit("return this")
+        elif stmt.value != None:
+            self.emit(f"return {self.transpile_expr(stmt.value)}")
+        else:
+            self.emit("return")
+
+    def visit_var_stmt(self, stmt: Var):
+        value = "None"
+        if stmt.initializer != None:
+            value = self.transpile_expr(stmt.initializer)
+
+        self.line = stmt.name.line
+        self.define(self.analyzer.declarations[stmt], value)
+
+    def visit_while_stmt(self, stmt: While):
+        self.emit(f"while {self.test(stmt.condition)}:")
+        self.loop_body(self.statements(stmt.body))
+
+    def assign(self, expr: Assign, statement):
+        binding = self.analyzer.references[expr]
+        value = self.transpile_expr(expr.value)
+
+        right = None
+        symbol = AUGMENTED.get(expr.operator.type)
+        if symbol != None:
+            value, right = self.augment(binding, expr, value, symbol)
+
+        if binding.is_const:
+            if not binding.is_global:
+                self.err_manager.compile_error(
+                    expr.name,
+                    "Cannot reassign a constant."
+                )
+
+            value = f"_lox_reassign({value}, {self.token(expr.name)})"
+        elif expr in self.analyzer.checked:
+            self.token(expr.name)
+            value = f"({value}, {binding.name})[0]"
+
+        if binding.boxed:
+            if statement:
+                self.emit(f"{binding.name}[0] = {value}")
+                return
+
+            result = f"_lox_store({binding.name}, {value})"
+        else:
+            if statement:
+                self.emit(f"{binding.name} = {value}")
+                return
+
+            result = f"({binding.name} := {value})"
+
+        # Augmented assignment evaluates to its right-hand side.
+        if right != None:
+            return f"({result}, {right})[1]"
+
+        return result
+
+    def set_(self, expr: Set, statement):
+        obj, guard = self.instance(expr.obj, "_lox_no_fields", expr.name)
+        attribute = mangle(expr.name.lexeme)
+
+        if statement:
+            if guard != None:
+                check, error = guard
+                self.emit(f"if not {check}:")
+                self.depth += 1
+                self.emit(error)
+                self.depth -= 1
+
+            value = self.transpile_expr(expr.value)
+            self.emit(f"{obj}.{attribute} = {value}")
+            return
+
+        temp = self.temp()
+        value = self.transpile_expr(expr.value)
+        result = f"(setattr({obj}, {attribute!r}, ({temp} := {value})) or {temp})"
+
+        if guard == None:
+            return result
+
+        check, error = guard
+        return f"({result} if {check} else {error})"
+
+    def visit_assign_expr(self, expr: Assign):
+        return self.assign(expr, False)
+
+    def visit_binary_expr(self, expr: Binary):
+        left = self.transpile_expr(expr.left)
+        right = self.transpile_expr(expr.right)
+
+        if expr.operator.type in (TokenType.EQEQ, TokenType.BANGEQ):
+            # Python compares bound methods by function and receiver, but
+            # every Lox property access makes a distinct bound method.
+            a = self.temp()
+            b = self.temp()
+            equal = (
+                f"({a} := {left}) == ({b} := {right}) and " +
+                f"({a}.__class__ is not _lox_method or {a} is {b})"
+            )
+
+            if expr.operator.type == TokenType.EQEQ:
+                return f"({equal})"
+
+            return f"(not ({equal}))"
+
+        return self.arithmetic(
+            expr.operator.type,
+            expr.left,
+            left,
+            expr.right,
+            right,
+            expr.operator
+        )
+
+    def visit_call_expr(self, expr: Call):
+        count = len(expr.arguments)
+        callee = self.transpile_expr(expr.callee)
+        temp = self.temp()
+
+        # Lox functions are plain Python functions and methods come back as
+        # bound methods, so the arity check reads the code object directly.
+        if isinstance(expr.callee, (Get, Super)):
+            check = (
+                f"({temp} := {callee}).__class__ is _lox_method and " +
+                f"{temp}.__func__.__code__.co_argcount == {count + 1}"
+            )
+        else:
+            check = (
+                f"({temp} := {callee}).__class__ is _lox_function and " +
+                f"{temp}.__code__.co_argcount == {count}"
+            )
+
+        arguments = ", ".join(
+            self.transpile_expr(argument) for argument in expr.arguments
+        )
+        paren = self.token(expr.paren)
+
+        return (
+            f"({temp} if {check} else _lox_callable({temp}, {paren}, {count}))" +
+            f"({arguments})"
+        )
+
+    def visit_conditional_expr(self, expr: Conditional):
+        condition = self.test(expr.condition)
+        then_branch = self.transpile_expr(expr.then_branch)
+        else_branch = self.transpile_expr(expr.else_branch)
+
+        return f"({then_branch} if {condition} else {else_branch})"
+
+    def visit_get_expr(self, expr: Get):
+        obj, guard = self.instance(expr.obj, "_lox_not_instance", expr.name)
+        attribute = f"{obj}.{mangle(expr.name.lexeme)}"
+        self.line = expr.name.line
+
+        if guard == None:
+            return attribute
+
+        check, error = guard
+        return f"({attribute} if {check} else {error})"
+
+    def visit_grouping_expr(self, expr: Grouping):
+        return self.transpile_expr(expr.expression)
+
+    def visit_literal_expr(self, expr: Literal):
+        return repr(expr.value)
+
+    def visit_logical_expr(self, expr: Logical):
+        keyword = "or" if expr.operator.type == TokenType.OR else "and"
+        right = self.transpile_expr(expr.right)
+
+        # A bool on the left is its own truthiness, so Python's operators
+        # already hand back the value Lox expects.
+        if self.is_bool(expr.left):
+            return f"({self.transpile_expr(expr.left)} {keyword} {right})"
+
+        temp = self.temp()
+        left = self.transpile_expr(expr.left)
+        truthy = f"({temp} := {left}) is not None and {temp} is not False"
+
+        if keyword == "or":
+            return f"({temp} if {truthy} else {right})"
+
+        return f"({right} if {truthy} else {temp})"
+
+    def visit_self_expr(self, expr: Self):
+        return "this"
+
+    def visit_set_expr(self, expr: Set):
+        return self.set_(expr, False)
+
+    def visit_super_expr(self, expr: Super):
+        superclass = self.read(self.analyzer.references[expr])
+        key = mangle(expr.method.lexeme)
+
+        return f"_lox_super({superclass}, this, {key!r}, {self.token(expr.method)})"
+
+    def visit_unary_expr(self, expr: Unary):
+        if expr.operator.type == TokenType.BANG:
+            return f"(not {self.test(expr.right)})"
+
+        right = self.transpile_expr(expr.right)
+        if self.is_number(expr.right):
+            return f"(-{right})"
+
+        temp = self.temp()
+        return (
+            f"(-{temp} if ({temp} := {right}).__class__ is float " +
+            f"else _lox_number({self.token(expr.operator)}))"
+        )
+
+    def visit_variable_expr(self, expr: Variable):
+        self.line = expr.name.line
+        return self.read(self.analyzer.references[expr])
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+# Python Imports
+import sys
+import time
+import tracemalloc
+
+# Project Imports
+from src.ast.expr import Expr
+from src.ast.stmt import Stmt
+from src.parser.parser import Parser
+from src.scanner.scanner import Scanner
+from src.util.errors import LoxError
+
+
+# AST Memory Benchmark
+#
+# Builds a large synthetic program out of copies of the unit below, each
+# with its own names, scans it, and then measures what parsing it costs:
+# the memory the finished tree holds on to, traced with tracemalloc, and
+# the time it takes without tracing. Tokens are scanned beforehand so they
+# are left out of both. The same is then measured for scanning and parsing
+# together, which is what running a script keeps alive until it is done.
+#
+# Run it from the repository root:
+#
+#     python3 -m src.util.astmem [units]
+UNIT = """
+class Shape{n} {{
+    init(width, height) {{
+        this.width = width;
+        this.height = height;
+    }}
+
+    area() {{
+        return this.width * this.height;
+    }}
+}}
+
+fun work{n}(limit) {{
+    var total = 0;
+    for (var i = 0; i < limit; i = i + 1) {{
+        if (i % 3 == 0 and i > 1) {{
+            total = total + i * 2 - 1;
+        }} else {{
+            total = total - (i / 2);
+        }}
+    }}
+
+    let shape = Shape{n}(limit, total);
+    while (total > 100) total = total / 2;
+    return shape.area() + total > 0 ? total : -total;
+}}
+
+echo work{n}({n});
+"""
+
+
+def generate(units):
+    return "".join(UNIT.format(n=n) for n in range(units))
+
+
+def count_nodes(node, seen):
+    if id(node) in seen:
+        return 0
+
+    seen.add(id(node))
+    total = 1
+
+    for cls in type(node).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            total += count_value(getattr(node, name), seen)
+
+    if hasattr(node, "__dict__"):
+        for value in vars(node).values():
+            total += count_value(value, seen)
+
+    return total
+
+
+def count_value(value, seen):
+    if isinstance(value, (Expr, Stmt)):
+        return count_nodes(value, seen)
+
+    if isinstance(value, list):
+        return sum(count_value(item, seen) for item in value)
+
+    return 0
+
+
+def parse(tokens):
+    err_manager = LoxError()
+    statements = Parser(tokens, err_manager).parse()
+
+    if err_manager.had_error:
+        sys.exit(65)
+
+    return statements
+
+
+def front_end(source):
+    tokens = Scanner(source, LoxError()).scan_tokens()
+    return tokens, parse(tokens)
+
+
+def traced(build):
+    # Returns what 'build' makes and the memory it still holds on to.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    made = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return made, after - before
+
+
+def best_of(runs, build):
+    best = None
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+
+        if best == None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def main(units):
+    source = generate(units)
+    tokens = Scanner(source, LoxError()).scan_tokens()
+
+    # Parsing twice keeps the copy being measured from paying for the
+    # first-time costs of the parser itself.
+    parse(tokens)
+
+    statements, retained = traced(lambda: parse(tokens))
+
+    nodes = 0
+    seen = set()
+    for statement in statements:
+        nodes += count_nodes(statement, seen)
+
+    best = best_of(5, lambda: parse(tokens))
+
+    print(f"Source    : {len(source)} bytes, {len(tokens)} tokens")
+    print(f"Nodes     : {nodes}")
+    print(f"Retained  : {retained} bytes, {retained / nodes:.1f} per node")
+    print(f"Parse     : {best:.3f}s (best of 5)")
+
+    _, retained = traced(lambda: front_end(source))
+    best = best_of(5, lambda: front_end(source))
+
+    print(f"Front end : {retained} bytes retained, " + \
+          f"scan and parse {best:.3f}s (best of 5)")
+
+
+if __name__ == "__main__":
+    exec, *argv = sys.argv
+
+    if len(argv) > 1:
+        print(f"Usage: {exec} [units]")
+        sys.exit(64)
+
+    main(int(argv[0]) if argv else 500)
@@ -12,17 +12,22 @@ class LoxError(BaseException):
     def __init__(self, message = None):
         self.message = message
         self.had_error = False
+        self.had_scan_error = False
         self.had_runtime_error = False
 
     def error(self, type_, message):
         print(f"[{type_.value}] {message}", file=sys.stderr)
 
     def scan_error(self, line, where, message):
+        self.had_scan_error = True
         self.report("scan", line, where, message)
 
     def parse_error(self, token, message):
         self.report("parse", token.line, f"{token.lexeme}", message)
 
+    def compile_error(self, token, message):
+        self.report("compile", token.line, f"{token.lexeme}", message)
+
     def runtime_error(self, error):
         result = f"\n[RUNTIME ERROR]\n{error.message}\n"
         result += f"at [ '{error.token.lexeme}' ]\n"
@@ -50,3 +55,10 @@ class LoxRuntimeError(LoxError, RuntimeError):
         self.token = token
         self.message = message
         super().__init__(self.message)
+
+
+class NativeError(LoxError, RuntimeError):
+    # Raised by native functions, which don't know where they were called
+    # from. The interpreter reports it against the call's parenthesis.
+    def __init__(self, message):
+        super().__init__(message)
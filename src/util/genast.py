@@ -7,28 +7,41 @@ from plox.src.util.writer import Writer
 
 
 class AstGenerator:
+    def __init__(self, spans=False):
+        # With 'spans', every node also gets a 'span' field, passed as an
+        # optional keyword argument, for tools that want to keep track of
+        # where in the source each node came from.
+        self.spans = spans
+
     def defineAst(self, output_dir, basename, types):
         path = f"{output_dir}/{basename.lower()}.py"
         writer = Writer(path)
         print(f"Generating {basename} AST -> {path}")
 
+        classnames = [type_.split("|")[0].strip() for type_ in types]
+
         self.define_imports(writer, basename)
+        self.define_kinds(writer, basename, classnames)
         self.define_base_class(writer, basename)
-        self.define_visitor(writer, path, basename, types)
+        self.define_visitor(writer, path, basename)
 
         for type_ in types:
             classname = type_.split("|")[0].strip()
             fields = type_.split("|")[1].strip()
-            self.define_type(writer, basename, classname, fields)
+
+            # An optional third column names per-node annotations filled in
+            # after parsing, by the Resolver or by the interpreter as it
+            # runs. They start out as None unless given a value.
+            caches = ""
+            if type_.count("|") > 1:
+                caches = type_.split("|")[2].strip()
+
+            self.define_type(writer, basename, classname, fields, caches)
 
         writer.write()
         print(f"{basename} AST Generation complete.")
 
     def define_imports(self, writer, basename):
-        writer.addln("# Python Imports")
-        writer.addln("from abc import ABC, abstractmethod")
-        writer.addln()
-
         writer.addln("# Project Imports")
         if basename == "Stmt":
             writer.addln("from src.ast.expr import Expr")
@@ -36,30 +49,104 @@ class AstGenerator:
         writer.addln("from src.scanner.token import Token")
         writer.addln()
 
+    def define_kinds(self, writer, basename, classnames):
+        upper = basename.upper()
+        lower = basename.lower()
+
+        writer.addln()
+        writer.addln("# Kind Tags")
+        writer.addln("#")
+        writer.addln("# Every node class has an integer 'kind', and " + \
+                     f"{upper}_VISITS names the")
+        writer.addln("# visit method for each kind in the same order. " + \
+                     "A visitor builds a table")
+        writer.addln(f"# of its own methods once with {lower}_dispatch() " + \
+                     "and then visits a node")
+        writer.addln("# with table[node.kind](node).")
+
+        for kind, classname in enumerate(classnames):
+            writer.addln(f"{classname.upper()} = {kind}")
+
+        writer.addln()
+        writer.addln(f"{upper}_VISITS = [")
+        for classname in classnames:
+            writer.addln(f'    "visit_{classname.lower()}_{lower}",')
+        writer.addln("]")
+        writer.addln()
+
+        writer.addln(f"# Every {basename}Visitor has to cover the first " + \
+                     f"{upper}_NODES kinds,")
+        writer.addln("# the node classes defined in this file.")
+        writer.addln(f"{upper}_NODES = len({upper}_VISITS)")
+        writer.addln()
+        writer.addln()
+
+        writer.addln(f"def add_{lower}_kind(visit):")
+        writer.addln("    # Gives a node class defined elsewhere a kind " + \
+                     "of its own. Visitors")
+        writer.addln("    # that have no such method get None in its place.")
+        writer.addln(f"    {upper}_VISITS.append(visit)")
+        writer.addln(f"    return len({upper}_VISITS) - 1")
+        writer.addln()
+        writer.addln()
+
+        writer.addln(f"def {lower}_dispatch(visitor):")
+        writer.addln("    return [getattr(visitor, visit, None) " + \
+                     f"for visit in {upper}_VISITS]")
+        writer.addln()
+
     def define_base_class(self, writer, basename):
         writer.addln()
-        writer.addln(f"class {basename}(ABC):")
-        writer.addln("    @abstractmethod")
+        writer.addln(f"class {basename}:")
+        writer.addln("    # Nodes keep their fields in __slots__ rather than a " + \
+                     "__dict__, which")
+        writer.addln("    # makes every node smaller and its fields faster " + \
+                     "to get at. The")
+        writer.addln("    # base has to declare them too, even if empty, or " + \
+                     "every node would")
+        writer.addln("    # get a __dict__ anyway.")
+        writer.addln("    __slots__ = ()")
+        writer.addln("    kind = None")
+        writer.addln()
         writer.addln("    def accept(self, visitor):")
-        writer.addln("        ...")
+        writer.addln("        raise NotImplementedError")
         writer.addln()
 
-    def define_type(self, writer, basename, classname, field_list):
+    def define_type(self, writer, basename, classname, field_list, cache_list):
+        fields = field_list.split(", ") if field_list else []
+        caches = cache_list.split(", ") if cache_list else []
+
+        names = [field.split(":")[0].strip() for field in fields]
+        names += [cache.partition("=")[0].strip() for cache in caches]
+        if self.spans:
+            names.append("span")
+
         writer.addln()
         writer.addln(f"class {classname}({basename}):")
-        writer.add("    def __init__(self")
+        writer.addln(f"    __slots__ = ({self.slots(names)})")
+        writer.addln(f"    kind = {classname.upper()}")
+        writer.addln()
 
-        if not field_list:
-            writer.addln("):")
+        params = ["self"] + fields
+        if self.spans:
+            params.append("span=None")
+
+        writer.addln(f"    def __init__({', '.join(params)}):")
+
+        if not names:
             writer.addln("        pass")
-        else:
-            writer.addln(f", {field_list}):")
 
-            fields = field_list.split(", ")
+        for field in fields:
+            name = field.split(":")[0].strip()
+            writer.addln(f"        self.{name} = {name}")
 
-            for field in fields:
-                name = field.split(":")[0].strip()
-                writer.addln(f"        self.{name} = {name}")
+        for cache in caches:
+            name, _, value = cache.partition("=")
+            value = value.strip() or "None"
+            writer.addln(f"        self.{name.strip()} = {value}")
+
+        if self.spans:
+            writer.addln("        self.span = span")
 
         writer.addln()
         if basename == "Stmt":
@@ -71,54 +158,73 @@ class AstGenerator:
         writer.addln(f"{basename.lower()}(self)")
         writer.addln()
 
-    def define_visitor(self, writer, path, basename, types):
+    def slots(self, names):
+        if len(names) == 1:
+            return f'"{names[0]}",'
+
+        return ", ".join(f'"{name}"' for name in names)
+
+    def define_visitor(self, writer, path, basename):
         print(f"Generating {basename} Visitor Patterns -> {path}")
-        writer.addln()
-        writer.addln(f"class {basename}Visitor(ABC):")
+        upper = basename.upper()
 
-        for type_ in types:
-            typename = type_.split("|")[0].strip()
-            writer.addln("    @abstractmethod")
-            writer.add(f"    def visit_{typename.lower()}_{basename.lower()}")
-            writer.add(f"(self, {basename.lower()}: {basename})")
-            if basename == "Stmt":
-                writer.addln(f" -> None:")
-            else:
-                writer.addln(f" -> object | None:")
-
-            writer.addln("        ...")
-            writer.addln()
+        writer.addln()
+        writer.addln(f"class {basename}Visitor:")
+        writer.addln("    # A visitor class must have a visit method for " + \
+                     "every node class,")
+        writer.addln("    # its own or inherited. That is checked as soon " + \
+                     "as it is defined.")
+        writer.addln("    def __init_subclass__(cls, **kwargs):")
+        writer.addln("        super().__init_subclass__(**kwargs)")
+        writer.addln()
+        writer.addln("        missing = [")
+        writer.addln(f"            visit for visit in {upper}_VISITS" + \
+                     f"[:{upper}_NODES]")
+        writer.addln("            if not callable(getattr(cls, visit, None))")
+        writer.addln("        ]")
+        writer.addln()
+        writer.addln("        if missing:")
+        writer.addln("            raise TypeError(")
+        writer.addln("                f\"{cls.__name__} is missing " + \
+                     "{', '.join(missing)}.\"")
+        writer.addln("            )")
+        writer.addln()
 
         print(f"{basename} Visitor Pattern generation complete.")
 
 
 if __name__ == "__main__":
     exec, *argv = sys.argv
-    generator = AstGenerator()
+
+    spans = "--spans" in argv
+    if spans:
+        argv.remove("--spans")
 
     if len(argv) != 1:
-        print(f"Usage: {exec} <output directory>")
+        print(f"Usage: {exec} [--spans] <output directory>")
         sys.exit(64)
 
+    generator = AstGenerator(spans)
+
     output_dir = argv[0]
 
     generator.defineAst(
         output_dir,
         "Expr",
         [
-            "Assign         | name: Token, operator: Token, value: Expr",
-            "Binary         | left: Expr, operator: Token, right: Expr",
-            "Call           | callee: Expr, paren: Token, arguments: list[Expr]",
+            "Assign         | name: Token, operator: Token, value: Expr | global_slot",
+            "Binary         | left: Expr, operator: Token, right: Expr | hits = 0, guard, op",
+            "Call           | callee: Expr, paren: Token, arguments: list[Expr] | cache",
             "Conditional    | condition: Expr, then_branch: Expr, else_branch: Expr",
-            "Get            | obj: Expr, name: Token",
+            "Get            | obj: Expr, name: Token | cache",
             "Grouping       | expression: Expr",
-            "Literal        | value: object",
+            "Literal        | value: object, token: Token",
             "Logical        | left: Expr, operator: Token, right: Token",
             "Self           | keyword: Token",
-            "Set            | obj: Expr, name: Token, value: Expr",
-            "Super          | keyword: Token, method: Token",
-            "Unary          | operator: Token, right: Expr",
-            "Variable       | name: Token"
+            "Set            | obj: Expr, name: Token, value: Expr | cache",
+            "Super          | keyword: Token, method: Token | cache",
+            "Unary          | operator: Token, right: Expr | hits = 0, guard, op",
+            "Variable       | name: Token | global_slot"
         ]
     )
 
@@ -133,11 +239,11 @@ if __name__ == "__main__":
             "Continue       | keyword: Token",
             "Echo           | expression: Expr",
             "Expression     | expression: Expr",
-            "For            | initializer: Stmt, condition: Expr, increment: Expr, body: Stmt",
-            "Function       | name: Token, params: list[Token], body: list[Stmt]",
+            "For            | initializer: Stmt, condition: Expr, increment: Expr, body: Stmt, end: Token",
+            "Function       | name: Token, params: list[Token], body: list[Stmt] | pure, calls",
             "If             | condition: Expr, then_branch: Stmt, else_branch: Stmt",
-            "Return         | keyword: Token, value: Expr",
+            "Return         | keyword: Token, value: Expr | tail_call",
             "Var            | name: Token, keyword: Token, initializer: Expr",
-            "While          | condition: Expr, body: Stmt",
+            "While          | condition: Expr, body: Stmt, end: Token",
         ]
     )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# Python Imports
+import contextlib
+import glob
+import io
+import sys
+import time
+import tracemalloc
+
+# Project Imports
+from src.scanner.regex_scanner import RegexScanner
+from src.scanner.scanner import Scanner
+from src.util.astmem import generate
+from src.util.errors import LoxError
+
+
+SCANNERS = {
+    "char": Scanner,
+    "regex": RegexScanner,
+}
+
+
+# Scanner Benchmark
+#
+# Scans every file under test/scanning, then a large synthetic program
+# built by astmem.py, with each scanner and reports its throughput in
+# tokens per second, best of five. Before timing anything it scans the
+# whole test corpus with both and checks they produce the same tokens,
+# lines and error output. Last, it compares the memory the synthetic
+# program's TokenBuffer takes with the same tokens as a list of Tokens,
+# which is what the scanners used to hand the Parser.
+#
+# Run it from the repository root:
+#
+#     python3 -m src.util.scanbench [units]
+def scan(scanner, source):
+    # Returns the tokens and whatever errors were reported.
+    errors = io.StringIO()
+
+    with contextlib.redirect_stderr(errors):
+        tokens = scanner(source, LoxError()).scan_tokens()
+
+    return tokens, errors.getvalue()
+
+
+def stream(tokens):
+    return [
+        (token.type, token.lexeme, token.literal, token.line)
+        for token in tokens
+    ]
+
+
+def verify(paths):
+    for path in paths:
+        with open(path, "rt") as f:
+            source = f.read()
+
+        tokens, errors = scan(Scanner, source)
+        expected = (stream(tokens), errors)
+
+        tokens, errors = scan(RegexScanner, source)
+        if (stream(tokens), errors) != expected:
+            print(f"Token streams differ on {path}.")
+            sys.exit(1)
+
+    print(f"Identical token streams on {len(paths)} files.")
+
+
+def measure(name, sources):
+    print(f"{name}:")
+
+    for key, scanner in SCANNERS.items():
+        best = None
+
+        for _ in range(5):
+            count = 0
+            start = time.perf_counter()
+
+            for source in sources:
+                tokens, _ = scan(scanner, source)
+                count += len(tokens)
+
+            elapsed = time.perf_counter() - start
+            if best == None or elapsed < best:
+                best = elapsed
+
+        print(
+            f"    {key:<6}: {count} tokens in {best:.3f}s, " + \
+            f"{count / best:,.0f} tokens/sec"
+        )
+
+
+def traced(build):
+    # Returns what 'build' makes and the memory it still holds on to.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    made = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return made, after - before
+
+
+def memory(source):
+    tokens, buffer = traced(lambda: scan(RegexScanner, source)[0])
+    _, listed = traced(lambda: list(tokens))
+
+    print("memory:")
+    print(f"    buffer: {buffer} bytes, {buffer / len(tokens):.1f} per token")
+    print(f"    Tokens: {listed} bytes, {listed / len(tokens):.1f} per token")
+
+
+def main(units):
+    verify(sorted(glob.glob("test/**/*.lox", recursive=True)))
+
+    sources = []
+    for path in sorted(glob.glob("test/scanning/*.lox")):
+        with open(path, "rt") as f:
+            sources.append(f.read())
+
+    measure("test/scanning", sources)
+
+    source = generate(units)
+    measure(f"synthetic ({len(source)} bytes)", [source])
+    memory(source)
+
+
+if __name__ == "__main__":
+    exec, *argv = sys.argv
+
+    if len(argv) > 1:
+        print(f"Usage: {exec} [units]")
+        sys.exit(64)
+
+    main(int(argv[0]) if argv else 2000)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Python Imports
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Streaming Benchmark
+#
+# Writes a generated script of the given number of top-level statements
+# and runs it through plox.py, once as usual and once with --stream. For
+# each run it reports how long the first line of output took to show up,
+# the total run time and the peak RSS of the process.
+#
+# Run it from the repository root:
+#
+#     python3 -m src.util.streambench [statements] [plox.py arguments]
+UNIT = """var v{n} = {n} * 2 + 1;
+fun f{n}(x) {{ return x + v{n}; }}
+if (v{n} > 10) {{ v{n} = v{n} - 1; }} else {{ v{n} = v{n} + 1; }}
+print f{n}(v{n});
+"""
+
+STATEMENTS_PER_UNIT = 4
+
+
+def generate(statements):
+    units = statements // STATEMENTS_PER_UNIT
+    return "".join(UNIT.format(n=n) for n in range(units))
+
+
+def run(path, arguments):
+    # Returns seconds to the first line of output, seconds in total and
+    # the peak RSS in KiB.
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-u", "plox.py", *arguments, path],
+        stdout=subprocess.PIPE
+    )
+
+    process.stdout.readline()
+    first = time.perf_counter() - start
+
+    for _ in process.stdout:
+        pass
+
+    _, status, usage = os.wait4(process.pid, 0)
+    total = time.perf_counter() - start
+
+    if status != 0:
+        print(f"plox.py exited with status {status}.")
+        sys.exit(1)
+
+    return first, total, usage.ru_maxrss
+
+
+def main(statements, arguments):
+    with tempfile.NamedTemporaryFile("w", suffix=".lox") as f:
+        f.write(generate(statements))
+        f.flush()
+
+        print(f"{statements} statements, {os.path.getsize(f.name)} bytes")
+
+        for name, extra in (("batch", []), ("stream", ["--stream"])):
+            first, total, rss = run(f.name, arguments + extra)
+            print(
+                f"    {name:<6}: first output {first:.3f}s, " + \
+                f"total {total:.3f}s, peak RSS {rss} KiB"
+            )
+
+
+if __name__ == "__main__":
+    exec, *argv = sys.argv
+
+    statements = 100000
+    if argv and argv[0].isdigit():
+        statements = int(argv.pop(0))
+
+    main(statements, argv)
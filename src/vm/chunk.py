@@ -0,0 +1,69 @@
+from enum import IntEnum
+
+
+class OpCode(IntEnum):
+    CONSTANT = 0
+    NULL = 1
+    TRUE = 2
+    FALSE = 3
+    POP = 4
+    GET_LOCAL = 5
+    SET_LOCAL = 6
+    GET_GLOBAL = 7
+    DEFINE_GLOBAL = 8
+    DEFINE_CONST = 9
+    SET_GLOBAL = 10
+    GET_UPVALUE = 11
+    SET_UPVALUE = 12
+    GET_PROPERTY = 13
+    SET_PROPERTY = 14
+    GET_SUPER = 15
+    EQUAL = 16
+    NOT_EQUAL = 17
+    GREATER = 18
+    GREATER_EQUAL = 19
+    LESS = 20
+    LESS_EQUAL = 21
+    ADD = 22
+    SUBTRACT = 23
+    MULTIPLY = 24
+    DIVIDE = 25
+    MODULUS = 26
+    POWER = 27
+    NOT = 28
+    NEGATE = 29
+    ECHO = 30
+    JUMP = 31
+    JUMP_IF_FALSE = 32
+    LOOP = 33
+    CALL = 34
+    INVOKE = 35
+    SUPER_INVOKE = 36
+    CLOSURE = 37
+    CLOSE_UPVALUE = 38
+    RETURN = 39
+    CLASS = 40
+    INHERIT = 41
+    METHOD = 42
+    CHECK_AUGMENT = 43
+    AUGMENT = 44
+
+
+# Chunk
+#
+# 'code' holds opcodes and their operands as plain ints, one operand per
+# slot. 'tokens' runs parallel to 'code' so runtime errors can report the
+# same token the tree-walker would.
+class Chunk:
+    def __init__(self):
+        self.code = []
+        self.tokens = []
+        self.constants = []
+
+    def write(self, byte, token):
+        self.code.append(int(byte))
+        self.tokens.append(token)
+
+    def add_constant(self, value):
+        self.constants.append(value)
+        return len(self.constants) - 1
@@ -0,0 +1,759 @@
+# Python Imports
+from enum import Enum
+
+# Project Imports
+from src.ast.expr import (
+    Expr,
+    ExprVisitor,
+    Assign,
+    Binary,
+    Call,
+    Conditional,
+    Get,
+    Grouping,
+    Literal,
+    Logical,
+    Self,
+    Set,
+    Super,
+    Unary,
+    Variable
+)
+from src.ast.stmt import (
+    Stmt,
+    StmtVisitor,
+    Block,
+    Break,
+    Class,
+    Const,
+    Continue,
+    Echo,
+    Expression,
+    For,
+    Function,
+    If,
+    Return,
+    Var,
+    While
+)
+from src.scanner.token import Token, TokenType
+from src.vm.chunk import OpCode
+from src.vm.object import ObjFunction
+
+
+# Limits (matching clox)
+MAX_CONSTANTS = 256
+MAX_LOCALS = 256
+MAX_UPVALUES = 256
+MAX_JUMP = 65535
+
+
+class FunctionType(Enum):
+    FUNCTION = 0
+    INITIALIZER = 1
+    METHOD = 2
+    SCRIPT = 3
+
+
+class Local:
+    def __init__(self, name, depth, is_const=False):
+        self.name = name
+        self.depth = depth
+        self.is_const = is_const
+        self.is_captured = False
+
+
+class Loop:
+    def __init__(self, start, scope_depth):
+        self.start = start
+        self.scope_depth = scope_depth
+        self.continue_target = start
+        self.break_jumps = []
+        self.continue_jumps = []
+
+
+class FunctionState:
+    def __init__(self, enclosing, function, type_):
+        self.enclosing = enclosing
+        self.function = function
+        self.type = type_
+        self.upvalues = []
+        self.loops = []
+        self.scope_depth = 0
+        self.identifiers = {}
+
+        # Slot zero holds the callee, or the receiver for methods.
+        if type_ == FunctionType.FUNCTION or type_ == FunctionType.SCRIPT:
+            self.locals = [Local("", 0)]
+        else:
+            self.locals = [Local("this", 0)]
+
+
+class ClassState:
+    def __init__(self, enclosing):
+        self.enclosing = enclosing
+        self.has_superclass = False
+
+
+class Compiler(ExprVisitor, StmtVisitor):
+    def __init__(self, err_manager, globals_, echo_expressions=False):
+        self.err_manager = err_manager
+        self.globals = globals_
+        self.echo_expressions = echo_expressions
+        self.current = None
+        self.current_class = None
+
+        # Token attributed to the bytes being emitted. A few statements
+        # carry no token of their own, so they inherit the last one seen.
+        self.token = None
+
+        # Set by an error and cleared at the next statement, so that one
+        # mistake, like a loop too large to jump over, is reported once.
+        self.panic_mode = False
+
+    def compile(self, statements: list[Stmt]):
+        self.current = FunctionState(None, ObjFunction(), FunctionType.SCRIPT)
+
+        for statement in statements:
+            self.panic_mode = False
+
+            if (self.echo_expressions and
+                    isinstance(statement, Expression) and
+                    not isinstance(statement.expression, Assign)):
+                self.compile_expr(statement.expression)
+                self.emit(OpCode.ECHO)
+            else:
+                self.compile_stmt(statement)
+
+        return self.end_function()
+
+    def compile_stmt(self, stmt: Stmt):
+        self.panic_mode = False
+        stmt.accept(self)
+
+    def compile_expr(self, expr: Expr):
+        expr.accept(self)
+
+    def error(self, message, token=None):
+        if self.panic_mode:
+            return
+
+        self.panic_mode = True
+
+        if token == None:
+            token = self.token
+
+        self.err_manager.compile_error(token, message)
+
+    # Emission
+    def chunk(self):
+        return self.current.function.chunk
+
+    def emit(self, *bytes_):
+        chunk = self.chunk()
+        for byte in bytes_:
+            chunk.write(byte, self.token)
+
+    def emit_return(self):
+        if self.current.type == FunctionType.INITIALIZER:
+            self.emit(OpCode.GET_LOCAL, 0)
+        else:
+            self.emit(OpCode.NULL)
+
+        self.emit(OpCode.RETURN)
+
+    def make_constant(self, value, token=None):
+        chunk = self.chunk()
+        if len(chunk.constants) >= MAX_CONSTANTS:
+            self.error("Too many constants in one chunk.", token)
+            return 0
+
+        return chunk.add_constant(value)
+
+    def identifier_constant(self, name: str):
+        # Names are interned per function so repeated global accesses
+        # don't eat into the constant budget.
+        index = self.current.identifiers.get(name)
+        if index == None:
+            index = self.make_constant(name)
+            self.current.identifiers[name] = index
+
+        return index
+
+    def global_slot(self, name: str):
+        # Globals are addressed by their slot in the VM's global table, so
+        # they don't take up constants at all.
+        return self.globals.index(name)
+
+    def emit_jump(self, instruction):
+        self.emit(instruction, 0)
+        return len(self.chunk().code) - 1
+
+    def patch_jump(self, offset):
+        jump = len(self.chunk().code) - offset - 1
+        if jump > MAX_JUMP:
+            self.error("Too much code to jump over.")
+
+        self.chunk().code[offset] = jump
+
+    def emit_loop(self, loop_start):
+        self.emit(OpCode.LOOP)
+
+        offset = len(self.chunk().code) - loop_start + 1
+        if offset > MAX_JUMP:
+            self.error("Loop body too large.")
+
+        self.emit(offset)
+
+    def end_function(self):
+        self.emit_return()
+        function = self.current.function
+        self.current = self.current.enclosing
+        return function
+
+    # Scopes and Variables
+    def begin_scope(self):
+        self.current.scope_depth += 1
+
+    def end_scope(self):
+        state = self.current
+        state.scope_depth -= 1
+
+        while state.locals and state.locals[-1].depth > state.scope_depth:
+            if state.locals[-1].is_captured:
+                self.emit(OpCode.CLOSE_UPVALUE)
+            else:
+                self.emit(OpCode.POP)
+
+            state.locals.pop()
+
+    def discard_locals(self, depth):
+        for local in reversed(self.current.locals):
+            if local.depth <= depth:
+                break
+
+            if local.is_captured:
+                self.emit(OpCode.CLOSE_UPVALUE)
+            else:
+                self.emit(OpCode.POP)
+
+    def add_local(self, name, is_const=False):
+        if len(self.current.locals) >= MAX_LOCALS:
+            self.error("Too many local variables in function.", name)
+            return
+
+        # Depth -1 marks the local as declared but not yet initialized.
+        self.current.locals.append(Local(name.lexeme, -1, is_const))
+
+    def declare_variable(self, name, is_const=False):
+        if self.current.scope_depth == 0:
+            return
+
+        self.add_local(name, is_const)
+
+    def mark_initialized(self):
+        if self.current.scope_depth == 0:
+            return
+
+        self.current.locals[-1].depth = self.current.scope_depth
+
+    def define_variable(self, global_, is_const=False):
+        if self.current.scope_depth > 0:
+            self.mark_initialized()
+            return
+
+        if is_const:
+            self.emit(OpCode.DEFINE_CONST, global_)
+        else:
+            self.emit(OpCode.DEFINE_GLOBAL, global_)
+
+    def resolve_local(self, state, name):
+        for i in range(len(state.locals) - 1, -1, -1):
+            if state.locals[i].name == name:
+                return i
+
+        return -1
+
+    def add_upvalue(self, state, index, is_local):
+        for i, upvalue in enumerate(state.upvalues):
+            if upvalue == (is_local, index):
+                return i
+
+        if len(state.upvalues) >= MAX_UPVALUES:
+            self.error("Too many closure variables in function.")
+            return 0
+
+        state.upvalues.append((is_local, index))
+        state.function.upvalue_count = len(state.upvalues)
+        return len(state.upvalues) - 1
+
+    def resolve_upvalue(self, state, name):
+        if state.enclosing == None:
+            return -1
+
+        local = self.resolve_local(state.enclosing, name)
+        if local != -1:
+            state.enclosing.locals[local].is_captured = True
+            return self.add_upvalue(state, local, True)
+
+        upvalue = self.resolve_upvalue(state.enclosing, name)
+        if upvalue != -1:
+            return self.add_upvalue(state, upvalue, False)
+
+        return -1
+
+    def named_variable(self, name: str):
+        arg = self.resolve_local(self.current, name)
+        if arg != -1:
+            self.emit(OpCode.GET_LOCAL, arg)
+            return
+
+        arg = self.resolve_upvalue(self.current, name)
+        if arg != -1:
+            self.emit(OpCode.GET_UPVALUE, arg)
+            return
+
+        self.emit(OpCode.GET_GLOBAL, self.global_slot(name))
+
+    def store_variable(self, name):
+        arg = self.resolve_local(self.current, name.lexeme)
+        if arg != -1:
+            if self.current.locals[arg].is_const:
+                self.error("Cannot reassign a constant.", name)
+
+            self.emit(OpCode.SET_LOCAL, arg)
+            return
+
+        arg = self.resolve_upvalue(self.current, name.lexeme)
+        if arg != -1:
+            self.emit(OpCode.SET_UPVALUE, arg)
+            return
+
+        self.emit(OpCode.SET_GLOBAL, self.global_slot(name.lexeme))
+
+    def function(self, stmt: Function, type_):
+        self.current = FunctionState(
+            self.current,
+            ObjFunction(stmt.name.lexeme),
+            type_
+        )
+        self.begin_scope()
+
+        self.current.function.arity = len(stmt.params)
+        for param in stmt.params:
+            self.token = param
+            self.declare_variable(param)
+            self.define_variable(0)
+
+        for statement in stmt.body:
+            self.compile_stmt(statement)
+
+        upvalues = self.current.upvalues
+        function = self.end_function()
+
+        self.token = stmt.name
+        self.emit(OpCode.CLOSURE, self.make_constant(function))
+        for is_local, index in upvalues:
+            self.emit(1 if is_local else 0, index)
+
+    # Statements
+    def visit_block_stmt(self, stmt: Block):
+        self.begin_scope()
+        for statement in stmt.statements:
+            self.compile_stmt(statement)
+        self.end_scope()
+
+    def visit_break_stmt(self, stmt: Break):
+        self.token = stmt.keyword
+        loop = self.current.loops[-1]
+        self.discard_locals(loop.scope_depth)
+        loop.break_jumps.append(self.emit_jump(OpCode.JUMP))
+
+    def visit_class_stmt(self, stmt: Class):
+        self.token = stmt.name
+        name_constant = self.identifier_constant(stmt.name.lexeme)
+        global_ = 0
+        if self.current.scope_depth == 0:
+            global_ = self.global_slot(stmt.name.lexeme)
+
+        self.declare_variable(stmt.name)
+
+        self.emit(OpCode.CLASS, name_constant)
+        self.define_variable(global_)
+
+        self.current_class = ClassState(self.current_class)
+
+        if stmt.superclass != None:
+            self.compile_expr(stmt.superclass)
+
+            self.begin_scope()
+            self.add_local(Token(
+                TokenType.SUPER,
+                "super",
+                None,
+                stmt.superclass.name.line
+            ))
+            self.define_variable(0)
+
+            self.token = stmt.superclass.name
+            self.named_variable(stmt.name.lexeme)
+            self.emit(OpCode.INHERIT)
+            self.current_class.has_superclass = True
+
+        self.token = stmt.name
+        self.named_variable(stmt.name.lexeme)
+
+        for method in stmt.methods:
+            self.token = method.name
+            constant = self.identifier_constant(method.name.lexeme)
+
+            type_ = FunctionType.METHOD
+            if (method.name.lexeme == "init" or
+                    method.name.lexeme == stmt.name.lexeme):
+                type_ = FunctionType.INITIALIZER
+
+            self.function(method, type_)
+            self.emit(OpCode.METHOD, constant)
+
+        self.emit(OpCode.POP)
+
+        if self.current_class.has_superclass:
+            self.end_scope()
+
+        self.current_class = self.current_class.enclosing
+
+    def visit_const_stmt(self, stmt: Const):
+        self.token = stmt.name
+        global_ = 0
+        if self.current.scope_depth == 0:
+            global_ = self.global_slot(stmt.name.lexeme)
+
+        self.declare_variable(stmt.name, True)
+        self.compile_expr(stmt.initializer)
+        self.define_variable(global_, True)
+
+    def visit_continue_stmt(self, stmt: Continue):
+        self.token = stmt.keyword
+        loop = self.current.loops[-1]
+        self.discard_locals(loop.scope_depth)
+
+        if loop.continue_target == None:
+            loop.continue_jumps.append(self.emit_jump(OpCode.JUMP))
+        else:
+            self.emit_loop(loop.continue_target)
+
+    def visit_echo_stmt(self, stmt: Echo):
+        self.compile_expr(stmt.expression)
+        self.emit(OpCode.ECHO)
+
+    def visit_expression_stmt(self, stmt: Expression):
+        self.compile_expr(stmt.expression)
+        self.emit(OpCode.POP)
+
+    def visit_for_stmt(self, stmt: For):
+        if stmt.initializer != None:
+            self.compile_stmt(stmt.initializer)
+
+        loop = Loop(len(self.chunk().code), self.current.scope_depth)
+        self.current.loops.append(loop)
+
+        self.compile_expr(stmt.condition)
+        exit_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.emit(OpCode.POP)
+
+        if stmt.increment == None:
+            self.compile_stmt(stmt.body)
+        else:
+            # The parser appended the increment to the body. Compile it after
+            # the body's scope closes so 'continue' can jump straight to it.
+            loop.continue_target = None
+            self.begin_scope()
+            for statement in stmt.body.statements[:-1]:
+                self.compile_stmt(statement)
+            self.end_scope()
+
+            for jump in loop.continue_jumps:
+                self.patch_jump(jump)
+
+            self.compile_expr(stmt.increment)
+            self.emit(OpCode.POP)
+
+        # The jump back belongs to the end of the body.
+        self.token = stmt.end
+        self.emit_loop(loop.start)
+        self.end_loop(loop, exit_jump)
+
+    def end_loop(self, loop, exit_jump):
+        self.patch_jump(exit_jump)
+        self.emit(OpCode.POP)
+
+        for jump in loop.break_jumps:
+            self.patch_jump(jump)
+
+        self.current.loops.pop()
+
+    def visit_function_stmt(self, stmt: Function):
+        self.token = stmt.name
+        global_ = 0
+        if self.current.scope_depth == 0:
+            global_ = self.global_slot(stmt.name.lexeme)
+
+        self.declare_variable(stmt.name)
+        self.mark_initialized()
+        self.function(stmt, FunctionType.FUNCTION)
+        self.define_variable(global_)
+
+    def visit_if_stmt(self, stmt: If):
+        self.compile_expr(stmt.condition)
+
+        then_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.emit(OpCode.POP)
+        self.compile_stmt(stmt.then_branch)
+
+        else_jump = self.emit_jump(OpCode.JUMP)
+        self.patch_jump(then_jump)
+        self.emit(OpCode.POP)
+
+        if stmt.else_branch != None:
+            self.compile_stmt(stmt.else_branch)
+
+        self.patch_jump(else_jump)
+
+    def visit_return_stmt(self, stmt: Return):
+        self.token = stmt.keyword
+
+        if stmt.value == None:
+            self.emit_return()
+            return
+
+        self.compile_expr(stmt.value)
+        self.token = stmt.keyword
+
+        if self.current.type == FunctionType.INITIALIZER:
+            self.emit(OpCode.POP)
+            self.emit_return()
+            return
+
+        self.emit(OpCode.RETURN)
+
+    def visit_var_stmt(self, stmt: Var):
+        self.token = stmt.name
+        global_ = 0
+        if self.current.scope_depth == 0:
+            global_ = self.global_slot(stmt.name.lexeme)
+
+        self.declare_variable(stmt.name)
+
+        if stmt.initializer != None:
+            self.compile_expr(stmt.initializer)
+        else:
+            self.emit(OpCode.NULL)
+
+        self.token = stmt.name
+        self.define_variable(global_)
+
+    def visit_while_stmt(self, stmt: While):
+        loop = Loop(len(self.chunk().code), self.current.scope_depth)
+        self.current.loops.append(loop)
+
+        self.compile_expr(stmt.condition)
+        exit_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.emit(OpCode.POP)
+
+        self.compile_stmt(stmt.body)
+
+        self.token = stmt.end
+        self.emit_loop(loop.start)
+        self.end_loop(loop, exit_jump)
+
+    # Expressions
+    def visit_assign_expr(self, expr: Assign):
+        if expr.operator.type == TokenType.EQ:
+            self.compile_expr(expr.value)
+            self.token = expr.name
+            self.store_variable(expr.name)
+            return
+
+        # Augmented assignment follows the tree-walker: the right-hand side is
+        # evaluated and checked before the target is read, and the expression
+        # leaves that right-hand side, not the new value, on the stack.
+        match expr.operator.type:
+            case TokenType.MINUSEQ:
+                kind = OpCode.SUBTRACT
+            case TokenType.MODEQ:
+                kind = OpCode.MODULUS
+            case TokenType.PLUSEQ:
+                kind = OpCode.ADD
+            case TokenType.SLASHEQ:
+                kind = OpCode.DIVIDE
+            case TokenType.STAREQ:
+                kind = OpCode.MULTIPLY
+
+        self.compile_expr(expr.value)
+        self.token = expr.operator
+        self.emit(OpCode.CHECK_AUGMENT, kind)
+
+        self.token = expr.name
+        self.named_variable(expr.name.lexeme)
+
+        self.token = expr.operator
+        self.emit(OpCode.AUGMENT, kind)
+
+        self.token = expr.name
+        self.store_variable(expr.name)
+        self.emit(OpCode.POP)
+
+    def visit_binary_expr(self, expr: Binary):
+        self.compile_expr(expr.left)
+        self.compile_expr(expr.right)
+
+        self.token = expr.operator
+        match expr.operator.type:
+            case TokenType.MINUS:
+                self.emit(OpCode.SUBTRACT)
+            case TokenType.MODULUS:
+                self.emit(OpCode.MODULUS)
+            case TokenType.PLUS:
+                self.emit(OpCode.ADD)
+            case TokenType.POWER:
+                self.emit(OpCode.POWER)
+            case TokenType.SLASH:
+                self.emit(OpCode.DIVIDE)
+            case TokenType.STAR:
+                self.emit(OpCode.MULTIPLY)
+            case TokenType.GT:
+                self.emit(OpCode.GREATER)
+            case TokenType.GTEQ:
+                self.emit(OpCode.GREATER_EQUAL)
+            case TokenType.LT:
+                self.emit(OpCode.LESS)
+            case TokenType.LTEQ:
+                self.emit(OpCode.LESS_EQUAL)
+            case TokenType.BANGEQ:
+                self.emit(OpCode.NOT_EQUAL)
+            case TokenType.EQEQ:
+                self.emit(OpCode.EQUAL)
+
+    def visit_call_expr(self, expr: Call):
+        argc = len(expr.arguments)
+
+        if isinstance(expr.callee, Get):
+            self.compile_expr(expr.callee.obj)
+            for argument in expr.arguments:
+                self.compile_expr(argument)
+
+            # The opcode carries the paren for arity errors, the name operand
+            # carries the property name for lookup errors.
+            name = self.identifier_constant(expr.callee.name.lexeme)
+            self.chunk().write(OpCode.INVOKE, expr.paren)
+            self.chunk().write(name, expr.callee.name)
+            self.chunk().write(argc, expr.paren)
+            self.token = expr.paren
+            return
+
+        if isinstance(expr.callee, Super):
+            self.token = expr.callee.keyword
+            self.named_variable("this")
+            for argument in expr.arguments:
+                self.compile_expr(argument)
+
+            self.token = expr.callee.keyword
+            self.named_variable("super")
+
+            name = self.identifier_constant(expr.callee.method.lexeme)
+            self.chunk().write(OpCode.SUPER_INVOKE, expr.paren)
+            self.chunk().write(name, expr.callee.method)
+            self.chunk().write(argc, expr.paren)
+            self.token = expr.paren
+            return
+
+        self.compile_expr(expr.callee)
+        for argument in expr.arguments:
+            self.compile_expr(argument)
+
+        self.token = expr.paren
+        self.emit(OpCode.CALL, argc)
+
+    def visit_conditional_expr(self, expr: Conditional):
+        self.compile_expr(expr.condition)
+
+        then_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+        self.emit(OpCode.POP)
+        self.compile_expr(expr.then_branch)
+
+        else_jump = self.emit_jump(OpCode.JUMP)
+        self.patch_jump(then_jump)
+        self.emit(OpCode.POP)
+        self.compile_expr(expr.else_branch)
+
+        self.patch_jump(else_jump)
+
+    def visit_get_expr(self, expr: Get):
+        self.compile_expr(expr.obj)
+        self.token = expr.name
+        self.emit(OpCode.GET_PROPERTY, self.identifier_constant(expr.name.lexeme))
+
+    def visit_grouping_expr(self, expr: Grouping):
+        self.compile_expr(expr.expression)
+
+    def visit_literal_expr(self, expr: Literal):
+        if expr.value == None:
+            self.emit(OpCode.NULL)
+        elif expr.value is True:
+            self.emit(OpCode.TRUE)
+        elif expr.value is False:
+            self.emit(OpCode.FALSE)
+        else:
+            self.emit(
+                OpCode.CONSTANT,
+                self.make_constant(expr.value, expr.token)
+            )
+
+    def visit_logical_expr(self, expr: Logical):
+        self.compile_expr(expr.left)
+
+        if expr.operator.type == TokenType.OR:
+            else_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+            end_jump = self.emit_jump(OpCode.JUMP)
+
+            self.patch_jump(else_jump)
+            self.emit(OpCode.POP)
+            self.compile_expr(expr.right)
+            self.patch_jump(end_jump)
+        else:
+            end_jump = self.emit_jump(OpCode.JUMP_IF_FALSE)
+            self.emit(OpCode.POP)
+            self.compile_expr(expr.right)
+            self.patch_jump(end_jump)
+
+    def visit_self_expr(self, expr: Self):
+        # 'self' and 'this' both name the receiver in slot zero.
+        self.token = expr.keyword
+        self.named_variable("this")
+
+    def visit_set_expr(self, expr: Set):
+        self.compile_expr(expr.obj)
+        self.compile_expr(expr.value)
+        self.token = expr.name
+        self.emit(OpCode.SET_PROPERTY, self.identifier_constant(expr.name.lexeme))
+
+    def visit_super_expr(self, expr: Super):
+        self.token = expr.keyword
+        self.named_variable("this")
+        self.named_variable("super")
+
+        self.token = expr.method
+        self.emit(OpCode.GET_SUPER, self.identifier_constant(expr.method.lexeme))
+
+    def visit_unary_expr(self, expr: Unary):
+        self.compile_expr(expr.right)
+
+        self.token = expr.operator
+        if expr.operator.type == TokenType.BANG:
+            self.emit(OpCode.NOT)
+        else:
+            self.emit(OpCode.NEGATE)
+
+    def visit_variable_expr(self, expr: Variable):
+        self.token = expr.name
+        self.named_variable(expr.name.lexeme)
@@ -0,0 +1,123 @@
+# Python Imports
+import sys
+
+# Project Imports
+from src.vm.chunk import OpCode
+from src.vm.object import ObjFunction
+
+
+CONSTANT_INSTRUCTIONS = (
+    OpCode.CONSTANT,
+    OpCode.GET_PROPERTY,
+    OpCode.SET_PROPERTY,
+    OpCode.GET_SUPER,
+    OpCode.CLASS,
+    OpCode.METHOD,
+)
+
+GLOBAL_INSTRUCTIONS = (
+    OpCode.GET_GLOBAL,
+    OpCode.DEFINE_GLOBAL,
+    OpCode.DEFINE_CONST,
+    OpCode.SET_GLOBAL,
+)
+
+BYTE_INSTRUCTIONS = (
+    OpCode.GET_LOCAL,
+    OpCode.SET_LOCAL,
+    OpCode.GET_UPVALUE,
+    OpCode.SET_UPVALUE,
+    OpCode.CALL,
+    OpCode.CHECK_AUGMENT,
+    OpCode.AUGMENT,
+)
+
+
+def disassemble_function(function, globals_):
+    disassemble_chunk(function.chunk, str(function), globals_)
+
+    for constant in function.chunk.constants:
+        if isinstance(constant, ObjFunction):
+            disassemble_function(constant, globals_)
+
+
+def disassemble_chunk(chunk, name, globals_):
+    print(f"== {name} ==", file=sys.stderr)
+
+    offset = 0
+    while offset < len(chunk.code):
+        offset = disassemble_instruction(chunk, offset, globals_)
+
+
+def disassemble_instruction(chunk, offset, globals_):
+    line = token_line(chunk, offset)
+    if offset > 0 and line == token_line(chunk, offset - 1):
+        prefix = f"{offset:04d}    | "
+    else:
+        prefix = f"{offset:04d} {line:4d} "
+
+    op = OpCode(chunk.code[offset])
+    name = f"OP_{op.name}"
+
+    if op in CONSTANT_INSTRUCTIONS:
+        constant = chunk.code[offset + 1]
+        value = chunk.constants[constant]
+        print(f"{prefix}{name:<16} {constant:4d} '{value}'", file=sys.stderr)
+        return offset + 2
+
+    if op in GLOBAL_INSTRUCTIONS:
+        slot = chunk.code[offset + 1]
+        value = globals_.names[slot]
+        print(f"{prefix}{name:<16} {slot:4d} '{value}'", file=sys.stderr)
+        return offset + 2
+
+    if op in BYTE_INSTRUCTIONS:
+        slot = chunk.code[offset + 1]
+        print(f"{prefix}{name:<16} {slot:4d}", file=sys.stderr)
+        return offset + 2
+
+    if op == OpCode.JUMP or op == OpCode.JUMP_IF_FALSE:
+        target = offset + 2 + chunk.code[offset + 1]
+        print(f"{prefix}{name:<16} {offset:4d} -> {target}", file=sys.stderr)
+        return offset + 2
+
+    if op == OpCode.LOOP:
+        target = offset + 2 - chunk.code[offset + 1]
+        print(f"{prefix}{name:<16} {offset:4d} -> {target}", file=sys.stderr)
+        return offset + 2
+
+    if op == OpCode.INVOKE or op == OpCode.SUPER_INVOKE:
+        constant = chunk.code[offset + 1]
+        argc = chunk.code[offset + 2]
+        value = chunk.constants[constant]
+        print(
+            f"{prefix}{name:<16} ({argc} args) {constant:4d} '{value}'",
+            file=sys.stderr
+        )
+        return offset + 3
+
+    if op == OpCode.CLOSURE:
+        constant = chunk.code[offset + 1]
+        function = chunk.constants[constant]
+        print(f"{prefix}{name:<16} {constant:4d} {function}", file=sys.stderr)
+
+        offset += 2
+        for _ in range(function.upvalue_count):
+            is_local = chunk.code[offset]
+            index = chunk.code[offset + 1]
+            kind = "local" if is_local else "upvalue"
+            print(f"{offset:04d}    |                     {kind} {index}", file=sys.stderr)
+            offset += 2
+
+        return offset
+
+    print(f"{prefix}{name}", file=sys.stderr)
+    return offset + 1
+
+
+def token_line(chunk, offset):
+    token = chunk.tokens[offset]
+    if token == None:
+        return 0
+
+    return token.line
@@ -0,0 +1,71 @@
+from src.vm.chunk import Chunk
+
+
+class ObjFunction:
+    def __init__(self, name=None):
+        self.arity = 0
+        self.upvalue_count = 0
+        self.chunk = Chunk()
+        self.name = name
+
+    def __str__(self):
+        if self.name == None:
+            return "<script>"
+
+        return f"<User Fn - {self.name}>"
+
+
+class ObjUpvalue:
+    # While open, 'cells' is the VM stack and 'location' an index into it.
+    # Closing moves the value into a private one-element list.
+    def __init__(self, cells, location):
+        self.cells = cells
+        self.location = location
+
+    def close(self):
+        self.cells = [self.cells[self.location]]
+        self.location = 0
+
+
+class ObjClosure:
+    def __init__(self, function):
+        self.function = function
+        self.upvalues = []
+
+    def __str__(self):
+        return str(self.function)
+
+
+class ObjClass:
+    def __init__(self, name):
+        self.name = name
+        self.methods = {}
+        self.initializer = None
+
+    def find_initializer(self):
+        initializer = self.methods.get("init")
+        if initializer == None:
+            initializer = self.methods.get(self.name)
+
+        self.initializer = initializer
+
+    def __str__(self):
+        return f"<Class : {self.name}>"
+
+
+class ObjInstance:
+    def __init__(self, klass):
+        self.klass = klass
+        self.fields = {}
+
+    def __str__(self):
+        return f"<Instance of : {self.klass.name}>"
+
+
+class ObjBoundMethod:
+    def __init__(self, receiver, method):
+        self.receiver = receiver
+        self.method = method
+
+    def __str__(self):
+        return str(self.method)
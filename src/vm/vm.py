@@ -0,0 +1,691 @@
+# Project Imports
+from src.callable.lox_callable import LoxCallable
+from src.callable.natives import define_natives
+from src.interpreter.environment import GlobalEnvironment, UNDEFINED
+from src.util.errors import LoxRuntimeError
+from src.util.mode import RunMode
+from src.vm.chunk import OpCode
+from src.vm.compiler import Compiler
+from src.vm.debug import disassemble_function
+from src.vm.object import (
+    ObjBoundMethod,
+    ObjClass,
+    ObjClosure,
+    ObjInstance,
+    ObjUpvalue
+)
+
+
+FRAMES_MAX = 64
+
+# Plain int aliases keep enum attribute lookups out of the dispatch loop.
+CONSTANT = OpCode.CONSTANT.value
+NULL = OpCode.NULL.value
+TRUE = OpCode.TRUE.value
+FALSE = OpCode.FALSE.value
+POP = OpCode.POP.value
+GET_LOCAL = OpCode.GET_LOCAL.value
+SET_LOCAL = OpCode.SET_LOCAL.value
+GET_GLOBAL = OpCode.GET_GLOBAL.value
+DEFINE_GLOBAL = OpCode.DEFINE_GLOBAL.value
+DEFINE_CONST = OpCode.DEFINE_CONST.value
+SET_GLOBAL = OpCode.SET_GLOBAL.value
+GET_UPVALUE = OpCode.GET_UPVALUE.value
+SET_UPVALUE = OpCode.SET_UPVALUE.value
+GET_PROPERTY = OpCode.GET_PROPERTY.value
+SET_PROPERTY = OpCode.SET_PROPERTY.value
+GET_SUPER = OpCode.GET_SUPER.value
+EQUAL = OpCode.EQUAL.value
+NOT_EQUAL = OpCode.NOT_EQUAL.value
+GREATER = OpCode.GREATER.value
+GREATER_EQUAL = OpCode.GREATER_EQUAL.value
+LESS = OpCode.LESS.value
+LESS_EQUAL = OpCode.LESS_EQUAL.value
+ADD = OpCode.ADD.value
+SUBTRACT = OpCode.SUBTRACT.value
+MULTIPLY = OpCode.MULTIPLY.value
+DIVIDE = OpCode.DIVIDE.value
+MODULUS = OpCode.MODULUS.value
+POWER = OpCode.POWER.value
+NOT = OpCode.NOT.value
+NEGATE = OpCode.NEGATE.value
+ECHO = OpCode.ECHO.value
+JUMP = OpCode.JUMP.value
+JUMP_IF_FALSE = OpCode.JUMP_IF_FALSE.value
+LOOP = OpCode.LOOP.value
+CALL = OpCode.CALL.value
+INVOKE = OpCode.INVOKE.value
+SUPER_INVOKE = OpCode.SUPER_INVOKE.value
+CLOSURE = OpCode.CLOSURE.value
+CLOSE_UPVALUE = OpCode.CLOSE_UPVALUE.value
+RETURN = OpCode.RETURN.value
+CLASS = OpCode.CLASS.value
+INHERIT = OpCode.INHERIT.value
+METHOD = OpCode.METHOD.value
+CHECK_AUGMENT = OpCode.CHECK_AUGMENT.value
+AUGMENT = OpCode.AUGMENT.value
+
+
+class CallFrame:
+    def __init__(self, closure, base):
+        chunk = closure.function.chunk
+        self.closure = closure
+        self.code = chunk.code
+        self.tokens = chunk.tokens
+        self.constants = chunk.constants
+        self.upvalues = closure.upvalues
+        self.base = base
+        self.ip = 0
+
+
+# VM
+#
+# Stack-based alternative to the tree-walking Interpreter. Lox calls push a
+# CallFrame instead of recursing in Python; locals live in one shared value
+# stack addressed relative to the frame's base slot.
+class VM:
+    def __init__(self, err_manager, mode):
+        self.err_manager = err_manager
+        self.mode = mode
+        self.disassemble = False
+        self.globals = GlobalEnvironment()
+        self.stack = []
+        self.frames = []
+        self.open_upvalues = {}
+
+        # Native Functions
+        define_natives(self)
+
+    def resolve(self, expr, depth, slot):
+        # The compiler assigns its own stack slots and upvalues.
+        pass
+
+    def resolve_scope(self, node, size):
+        pass
+
+    def release(self, node):
+        pass
+
+    def interpret(self, statements):
+        compiler = Compiler(
+            self.err_manager,
+            self.globals,
+            self.mode == RunMode.REPL
+        )
+        function = compiler.compile(statements)
+
+        if self.err_manager.had_error:
+            return
+
+        if self.disassemble:
+            disassemble_function(function, self.globals)
+
+        closure = ObjClosure(function)
+        self.stack = [closure]
+        self.frames = [CallFrame(closure, 0)]
+        self.open_upvalues = {}
+
+        try:
+            self.run()
+        except LoxRuntimeError as e:
+            self.err_manager.runtime_error(e)
+
+    def run(self):
+        stack = self.stack
+        push = stack.append
+        pop = stack.pop
+        frames = self.frames
+        globals_ = self.globals
+        gslots = globals_.slots
+        is_const = globals_.is_const
+        stringify = self.stringify
+
+        frame = frames[-1]
+        code = frame.code
+        constants = frame.constants
+        upvalues = frame.upvalues
+        base = frame.base
+        ip = frame.ip
+
+        while True:
+            op = code[ip]
+            ip += 1
+
+            if op == GET_LOCAL:
+                push(stack[base + code[ip]])
+                ip += 1
+
+            elif op == CONSTANT:
+                push(constants[code[ip]])
+                ip += 1
+
+            elif op == GET_GLOBAL:
+                value = gslots[code[ip]]
+                ip += 1
+
+                if value is UNDEFINED:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        f"Undefined Variable '{globals_.names[code[ip - 1]]}'."
+                    )
+
+                push(value)
+
+            elif op == JUMP_IF_FALSE:
+                value = stack[-1]
+                if value is None or value is False:
+                    ip += code[ip] + 1
+                else:
+                    ip += 1
+
+            elif op == POP:
+                pop()
+
+            elif op == ADD:
+                b = pop()
+                a = stack[-1]
+
+                if a.__class__ is float:
+                    if b.__class__ is float:
+                        stack[-1] = a + b
+                        continue
+                    if b.__class__ is str:
+                        stack[-1] = stringify(a) + b
+                        continue
+
+                elif a.__class__ is str:
+                    if b.__class__ is str:
+                        stack[-1] = a + b
+                        continue
+                    if b.__class__ is float:
+                        stack[-1] = a + stringify(b)
+                        continue
+
+                raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers or strings. Combining the two is allowed.")
+
+            elif op == SUBTRACT:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a - b
+
+            elif op == LESS:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a < b
+
+            elif op == CALL:
+                argc = code[ip]
+                ip += 1
+                callee = stack[-argc - 1]
+
+                if callee.__class__ is ObjClosure:
+                    if argc != callee.function.arity:
+                        raise LoxRuntimeError(
+                            frame.tokens[ip - 2],
+                            f"Expected {callee.function.arity} arguments " +
+                            f"but got {argc} instead."
+                        )
+
+                    if len(frames) == FRAMES_MAX:
+                        raise LoxRuntimeError(frame.tokens[ip - 2], "Stack overflow.")
+
+                    frame.ip = ip
+                    frame = CallFrame(callee, len(stack) - argc - 1)
+                    frames.append(frame)
+                elif self.call_value(callee, argc, frame.tokens[ip - 2]):
+                    frame.ip = ip
+                    frame = frames[-1]
+                else:
+                    continue
+
+                code = frame.code
+                constants = frame.constants
+                upvalues = frame.upvalues
+                base = frame.base
+                ip = 0
+
+            elif op == RETURN:
+                result = pop()
+                if self.open_upvalues:
+                    self.close_upvalues(base)
+
+                frames.pop()
+                if not frames:
+                    pop()
+                    return
+
+                del stack[base:]
+                push(result)
+
+                frame = frames[-1]
+                code = frame.code
+                constants = frame.constants
+                upvalues = frame.upvalues
+                base = frame.base
+                ip = frame.ip
+
+            elif op == INVOKE:
+                name = constants[code[ip]]
+                argc = code[ip + 1]
+                ip += 2
+                receiver = stack[-argc - 1]
+
+                if receiver.__class__ is not ObjInstance:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        "Only instances of an object have properties."
+                    )
+
+                fields = receiver.fields
+                if name in fields:
+                    callee = fields[name]
+                    stack[-argc - 1] = callee
+
+                    if not self.call_value(callee, argc, frame.tokens[ip - 3]):
+                        continue
+
+                    frame.ip = ip
+                    frame = frames[-1]
+                else:
+                    method = receiver.klass.methods.get(name)
+                    if method is None:
+                        raise LoxRuntimeError(
+                            frame.tokens[ip - 2],
+                            f"Undefined Property '{name}'."
+                        )
+
+                    if argc != method.function.arity:
+                        raise LoxRuntimeError(
+                            frame.tokens[ip - 3],
+                            f"Expected {method.function.arity} arguments " +
+                            f"but got {argc} instead."
+                        )
+
+                    if len(frames) == FRAMES_MAX:
+                        raise LoxRuntimeError(frame.tokens[ip - 3], "Stack overflow.")
+
+                    frame.ip = ip
+                    frame = CallFrame(method, len(stack) - argc - 1)
+                    frames.append(frame)
+
+                code = frame.code
+                constants = frame.constants
+                upvalues = frame.upvalues
+                base = frame.base
+                ip = 0
+
+            elif op == GET_PROPERTY:
+                instance = stack[-1]
+                name = constants[code[ip]]
+                ip += 1
+
+                if instance.__class__ is not ObjInstance:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        "Only instances of an object have properties."
+                    )
+
+                fields = instance.fields
+                if name in fields:
+                    stack[-1] = fields[name]
+                    continue
+
+                method = instance.klass.methods.get(name)
+                if method is None:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        f"Undefined Property '{name}'."
+                    )
+
+                stack[-1] = ObjBoundMethod(instance, method)
+
+            elif op == SET_PROPERTY:
+                value = pop()
+                instance = stack[-1]
+                name = constants[code[ip]]
+                ip += 1
+
+                if instance.__class__ is not ObjInstance:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        "Only instances of an object have fields."
+                    )
+
+                instance.fields[name] = value
+                stack[-1] = value
+
+            elif op == SET_LOCAL:
+                stack[base + code[ip]] = stack[-1]
+                ip += 1
+
+            elif op == GET_UPVALUE:
+                upvalue = upvalues[code[ip]]
+                push(upvalue.cells[upvalue.location])
+                ip += 1
+
+            elif op == SET_UPVALUE:
+                upvalue = upvalues[code[ip]]
+                upvalue.cells[upvalue.location] = stack[-1]
+                ip += 1
+
+            elif op == JUMP:
+                ip += code[ip] + 1
+
+            elif op == LOOP:
+                ip += 1 - code[ip]
+
+            elif op == NULL:
+                push(None)
+
+            elif op == TRUE:
+                push(True)
+
+            elif op == FALSE:
+                push(False)
+
+            elif op == EQUAL:
+                b = pop()
+                a = stack[-1]
+                stack[-1] = b is None if a is None else a == b
+
+            elif op == NOT_EQUAL:
+                b = pop()
+                a = stack[-1]
+                stack[-1] = b is not None if a is None else not a == b
+
+            elif op == GREATER:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a > b
+
+            elif op == GREATER_EQUAL:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a >= b
+
+            elif op == LESS_EQUAL:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a <= b
+
+            elif op == MULTIPLY:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a * b
+
+            elif op == DIVIDE or op == MODULUS:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                if b == 0:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Cannot divide by Zero.")
+
+                stack[-1] = a / b if op == DIVIDE else a % b
+
+            elif op == POWER:
+                b = pop()
+                a = stack[-1]
+                if a.__class__ is not float or b.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operands must be numbers.")
+
+                stack[-1] = a ** b
+
+            elif op == CHECK_AUGMENT:
+                value = stack[-1]
+                if value.__class__ is not float:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 1],
+                        "Cannot use augmented assignment on non-number values."
+                    )
+
+                if value == 0 and (code[ip] == DIVIDE or code[ip] == MODULUS):
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Cannot divide by Zero.")
+
+                ip += 1
+
+            elif op == AUGMENT:
+                a = pop()
+                b = stack[-1]
+                if a.__class__ is not float:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 1],
+                        "Cannot use augmented assignment on non-number values."
+                    )
+
+                kind = code[ip]
+                ip += 1
+
+                if kind == ADD:
+                    push(a + b)
+                elif kind == SUBTRACT:
+                    push(a - b)
+                elif kind == MULTIPLY:
+                    push(a * b)
+                elif kind == DIVIDE:
+                    push(a / b)
+                else:
+                    push(a % b)
+
+            elif op == NOT:
+                value = stack[-1]
+                stack[-1] = value is None or value is False
+
+            elif op == NEGATE:
+                value = stack[-1]
+                if value.__class__ is not float:
+                    raise LoxRuntimeError(frame.tokens[ip - 1], "Operand must be a number.")
+
+                stack[-1] = -value
+
+            elif op == ECHO:
+                print(stringify(pop()))
+
+            elif op == DEFINE_GLOBAL:
+                gslots[code[ip]] = pop()
+                is_const[code[ip]] = False
+                ip += 1
+
+            elif op == DEFINE_CONST:
+                gslots[code[ip]] = pop()
+                is_const[code[ip]] = True
+                ip += 1
+
+            elif op == SET_GLOBAL:
+                slot = code[ip]
+                ip += 1
+
+                if gslots[slot] is UNDEFINED:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        f"Undefined Variable '{globals_.names[slot]}'."
+                    )
+
+                if is_const[slot]:
+                    raise LoxRuntimeError(frame.tokens[ip - 2], "Cannot reassign a constant.")
+
+                gslots[slot] = stack[-1]
+
+            elif op == CLOSURE:
+                function = constants[code[ip]]
+                ip += 1
+
+                closure = ObjClosure(function)
+                for _ in range(function.upvalue_count):
+                    if code[ip]:
+                        closure.upvalues.append(
+                            self.capture_upvalue(base + code[ip + 1])
+                        )
+                    else:
+                        closure.upvalues.append(upvalues[code[ip + 1]])
+
+                    ip += 2
+
+                push(closure)
+
+            elif op == CLOSE_UPVALUE:
+                self.close_upvalues(len(stack) - 1)
+                pop()
+
+            elif op == GET_SUPER:
+                name = constants[code[ip]]
+                ip += 1
+
+                superclass = pop()
+                method = superclass.methods.get(name)
+                if method is None:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        f"Undefined Property '{name}'."
+                    )
+
+                stack[-1] = ObjBoundMethod(stack[-1], method)
+
+            elif op == SUPER_INVOKE:
+                name = constants[code[ip]]
+                argc = code[ip + 1]
+                ip += 2
+
+                superclass = pop()
+                method = superclass.methods.get(name)
+                if method is None:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 2],
+                        f"Undefined Property '{name}'."
+                    )
+
+                self.call(method, argc, frame.tokens[ip - 3])
+                frame.ip = ip
+
+                frame = frames[-1]
+                code = frame.code
+                constants = frame.constants
+                upvalues = frame.upvalues
+                base = frame.base
+                ip = 0
+
+            elif op == CLASS:
+                push(ObjClass(constants[code[ip]]))
+                ip += 1
+
+            elif op == INHERIT:
+                superclass = stack[-2]
+                if superclass.__class__ is not ObjClass:
+                    raise LoxRuntimeError(
+                        frame.tokens[ip - 1],
+                        "Superclass must be a class."
+                    )
+
+                subclass = pop()
+                subclass.methods.update(superclass.methods)
+                subclass.find_initializer()
+
+            elif op == METHOD:
+                klass = stack[-2]
+                klass.methods[constants[code[ip]]] = pop()
+                klass.find_initializer()
+                ip += 1
+
+    def call(self, closure, argc, token):
+        if argc != closure.function.arity:
+            raise LoxRuntimeError(
+                token,
+                f"Expected {closure.function.arity} arguments " +
+                f"but got {argc} instead."
+            )
+
+        if len(self.frames) == FRAMES_MAX:
+            raise LoxRuntimeError(token, "Stack overflow.")
+
+        self.frames.append(CallFrame(closure, len(self.stack) - argc - 1))
+
+    def call_value(self, callee, argc, token):
+        # Returns True when a new CallFrame was pushed.
+        stack = self.stack
+
+        if callee.__class__ is ObjClosure:
+            self.call(callee, argc, token)
+            return True
+
+        if callee.__class__ is ObjBoundMethod:
+            stack[-argc - 1] = callee.receiver
+            self.call(callee.method, argc, token)
+            return True
+
+        if callee.__class__ is ObjClass:
+            stack[-argc - 1] = ObjInstance(callee)
+
+            if callee.initializer is not None:
+                self.call(callee.initializer, argc, token)
+                return True
+
+            if argc != 0:
+                raise LoxRuntimeError(
+                    token,
+                    f"Expected 0 arguments but got {argc} instead."
+                )
+
+            return False
+
+        if isinstance(callee, LoxCallable):
+            if argc != callee.arity():
+                raise LoxRuntimeError(
+                    token,
+                    f"Expected {callee.arity()} arguments " +
+                    f"but got {argc} instead."
+                )
+
+            start = len(stack) - argc
+            arguments = stack[start:]
+            del stack[start - 1:]
+            stack.append(callee.call(self, arguments))
+            return False
+
+        raise LoxRuntimeError(
+            token,
+            "Only classes, functions or methods can be called."
+        )
+
+    def capture_upvalue(self, location):
+        upvalue = self.open_upvalues.get(location)
+        if upvalue is None:
+            upvalue = ObjUpvalue(self.stack, location)
+            self.open_upvalues[location] = upvalue
+
+        return upvalue
+
+    def close_upvalues(self, last):
+        for location in [l for l in self.open_upvalues if l >= last]:
+            self.open_upvalues.pop(location).close()
+
+    def stringify(self, obj):
+        if obj == None:
+            return "null"
+
+        if isinstance(obj, float):
+            text = str(obj)
+            if text.endswith(".0"):
+                text = text[0 : len(text) - 2]
+
+            return text
+
+        return str(obj)